@@ -1,5 +1,9 @@
+import numpy as np
 import matplotlib.pyplot as plt
 
+from plot_sampling import sample_curve
+from plot_sink import render
+
 def cubic_spline_interpolation(x_vals, y_vals, x_target):
     """
     Performs cubic spline interpolation on a set of known data points.
@@ -51,42 +55,37 @@ def cubic_spline_interpolation(x_vals, y_vals, x_target):
 
     raise RuntimeError("No interval found for x_target.")
 
-def linspace(start, stop, num):
+def evaluate_spline(x_vals, y_vals, b, c, d, x):
     """
-    Replacement for numpy.linspace without using numpy.
-    Returns a list of 'num' evenly spaced values between start and stop.
+    Evaluates the spline with coefficients b, c, d at many points at once.
+    The interval of each point is found with a binary search (np.searchsorted)
+    instead of scanning all intervals.
     """
-    if num == 1:
-        return [start]
-    step = (stop - start) / (num - 1)
-    return [start + i * step for i in range(num)]
+    xs = np.asarray(x_vals, dtype=float)
+    x = np.asarray(x, dtype=float)
+    i = np.clip(np.searchsorted(xs, x, side="right") - 1, 0, len(xs) - 2)
+    dx = x - xs[i]
+    return (np.asarray(y_vals, dtype=float)[i]
+            + dx * (np.asarray(b, dtype=float)[i]
+                    + dx * (np.asarray(c, dtype=float)[i] + dx * np.asarray(d, dtype=float)[i])))
 
 def plot_spline(x_vals, y_vals, b, c, d, x_target, y_interp):
     """
     Plots the cubic spline curve and interpolated point.
     """
-    x_plot = linspace(x_vals[0], x_vals[-1], 500)
-    y_plot = []
-
-    for x in x_plot:
-        for i in range(len(x_vals) - 1):
-            if x_vals[i] <= x <= x_vals[i + 1]:
-                dx = x - x_vals[i]
-                y = y_vals[i] + b[i] * dx + c[i] * dx**2 + d[i] * dx**3
-                y_plot.append(y)
-                break
-
-    plt.figure(figsize=(8, 5))
-    plt.plot(x_plot, y_plot, label="Cubic Spline", color='blue')
-    plt.scatter(x_vals, y_vals, color='red', label="Data Points")
-    plt.scatter(x_target, y_interp, color='green', label=f"Interpolated Point ({x_target:.2f}, {y_interp:.2f})")
-    plt.title("Cubic Spline Interpolation (No NumPy)")
-    plt.xlabel("x")
-    plt.ylabel("y")
-    plt.grid(True)
-    plt.legend()
-    plt.tight_layout()
-    plt.show()
+    x_plot, y_plot = sample_curve(lambda x: evaluate_spline(x_vals, y_vals, b, c, d, x),
+                                  x_vals[0], x_vals[-1])
+    render("cubic_spline", draw_spline, x_plot, y_plot, x_vals, y_vals, x_target, y_interp, figsize=(8, 5))
+
+def draw_spline(ax, x_plot, y_plot, x_vals, y_vals, x_target, y_interp):
+    ax.plot(x_plot, y_plot, label="Cubic Spline", color='blue')
+    ax.scatter(x_vals, y_vals, color='red', label="Data Points")
+    ax.scatter(x_target, y_interp, color='green', label=f"Interpolated Point ({x_target:.2f}, {y_interp:.2f})")
+    ax.set_title("Cubic Spline Interpolation")
+    ax.set_xlabel("x")
+    ax.set_ylabel("y")
+    ax.grid(True)
+    ax.legend()
 """ 
 def main():
     try:
@@ -128,14 +127,8 @@ def cubic_spline_main():
 
         # גרף
         import matplotlib.pyplot as plt
-        dense_x = [x_vals[0] + i * (x_vals[-1] - x_vals[0]) / 1000 for i in range(1001)]
-        dense_y = []
-        for x in dense_x:
-            try:
-                y, _, _, _ = cubic_spline_interpolation(x_vals, y_vals, x)
-                dense_y.append(y)
-            except:
-                dense_y.append(None)
+        dense_x, dense_y = sample_curve(lambda x: evaluate_spline(x_vals, y_vals, b, c, d, x),
+                                        x_vals[0], x_vals[-1])
 
         plt.plot(dense_x, dense_y, label="Spline Curve")
         plt.scatter(x_vals, y_vals, color='red', label="Data Points")
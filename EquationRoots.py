@@ -1,10 +1,14 @@
 # Yael Pinto - 326252376
 # Shahar Ezra - 329186118
 # Tamar Mosheev - 213864242
-import matplotlib
-matplotlib.use('TkAgg')
+import time
 
-import matplotlib.pyplot as plt
+from method_result import MethodResult
+from instrumentation import profiled
+from plot_sampling import sample_curve
+from plot_sink import render, use_interactive_backend
+
+use_interactive_backend()
 
 def f(x):
     """Returns the value of the function f(x) = x^3 - 6x^2 + 11x - 6."""
@@ -14,111 +18,134 @@ def df(x):
     """Returns the derivative f'(x) = 3x^2 - 12x + 11."""
     return 3*x**2 - 12*x + 11
 
+@profiled("newton", callables=(0, 1))
 def newton_method(func, dfunc, x0, epsilon=0.0001, max_iterations=100):
+    start = time.perf_counter()
     iterations = 0
+    evaluations = 0
     while iterations < max_iterations:
         fx = func(x0)
         dfx = dfunc(x0)
+        evaluations += 2
         if dfx == 0:
-            print("Derivative is zero. Method failed to converge.")
-            return None, iterations
+            return MethodResult("newton", None, False, iterations, evaluations,
+                                time.perf_counter() - start,
+                                message="Derivative is zero. Method failed to converge.")
         x1 = x0 - fx / dfx
         if abs(x1 - x0) < epsilon:
-            return x1, iterations + 1
+            return MethodResult("newton", x1, True, iterations + 1, evaluations,
+                                time.perf_counter() - start, error_estimate=abs(x1 - x0))
         x0 = x1
         iterations += 1
-    print("Method did not converge.")
-    return None, iterations
+    return MethodResult("newton", None, False, iterations, evaluations, time.perf_counter() - start,
+                        message="Method did not converge.")
 
+@profiled("secant")
 def secant_method(func, start_point, end_point, epsilon=0.0001, max_iterations=100):
+    start = time.perf_counter()
     x0 = start_point
     x1 = end_point
     iteration = 0
+    evaluations = 0
 
     if x0 == x1:
-        print(f"[Secant] Invalid input: start_point and end_point are the same ({x0}).")
-        return None, iteration
+        return MethodResult("secant", None, False, iteration, evaluations, time.perf_counter() - start,
+                            message=f"Invalid input: start_point and end_point are the same ({x0}).")
 
+    f_x0 = f_x1 = None
     while iteration < max_iterations:
         try:
-            f_x0 = func(x0)
+            # Only the newest point needs a fresh evaluation after the first step.
+            if f_x0 is None:
+                f_x0 = func(x0)
+                evaluations += 1
             f_x1 = func(x1)
+            evaluations += 1
         except Exception as e:
-            print(f"[Secant] Error evaluating function at iteration {iteration}: {e}")
-            return None, iteration
+            return MethodResult("secant", None, False, iteration, evaluations, time.perf_counter() - start,
+                                message=f"Error evaluating function at iteration {iteration}: {e}")
 
         if abs(f_x0) < epsilon:
-            print(f"[Secant] Exact root found at x = {x0}")
-            return x0, iteration
+            return MethodResult("secant", x0, True, iteration, evaluations, time.perf_counter() - start,
+                                error_estimate=abs(f_x0), message=f"Exact root found at x = {x0}")
         if abs(f_x1) < epsilon:
-            print(f"[Secant] Exact root found at x = {x1}")
-            return x1, iteration
+            return MethodResult("secant", x1, True, iteration, evaluations, time.perf_counter() - start,
+                                error_estimate=abs(f_x1), message=f"Exact root found at x = {x1}")
 
         denominator = f_x1 - f_x0
         if denominator == 0:
-            print(f"[Secant] Division by zero detected at iteration {iteration}. f(x1) - f(x0) = 0.")
-            return None, iteration
+            return MethodResult("secant", None, False, iteration, evaluations, time.perf_counter() - start,
+                                message=f"Division by zero detected at iteration {iteration}. f(x1) - f(x0) = 0.")
 
         x2 = x1 - f_x1 * (x1 - x0) / denominator
 
         if abs(x2 - x1) < epsilon:
-            return x2, iteration + 1
+            return MethodResult("secant", x2, True, iteration + 1, evaluations, time.perf_counter() - start,
+                                error_estimate=abs(x2 - x1))
 
         x0, x1 = x1, x2
+        f_x0 = f_x1
         iteration += 1
 
-    print(f"[Secant] Method did not converge within {max_iterations} iterations.")
-    return None, iteration
+    return MethodResult("secant", None, False, iteration, evaluations, time.perf_counter() - start,
+                        message=f"Method did not converge within {max_iterations} iterations.")
 
+@profiled("bisection")
 def bisection_method(f, start, end, epsilon=0.0001):
+    start_time = time.perf_counter()
     a = start
     b = end
     iterations = 0
-    if f(a) * f(b) >= 0:
-        print("Function does not change sign in the interval.")
-        return None, iterations
+    f_a, f_b = f(a), f(b)
+    evaluations = 2
+    if f_a * f_b >= 0:
+        return MethodResult("bisection", None, False, iterations, evaluations,
+                            time.perf_counter() - start_time,
+                            message="Function does not change sign in the interval.")
     while (b - a) / 2.0 > epsilon:
         iterations += 1
         mid = (a + b) / 2.0
         f_mid = f(mid)
+        evaluations += 1
         if abs(f_mid) < epsilon:
-            return mid, iterations
-        elif f(a) * f_mid < 0:
+            return MethodResult("bisection", mid, True, iterations, evaluations,
+                                time.perf_counter() - start_time, error_estimate=(b - a) / 2.0)
+        elif f_a * f_mid < 0:
             b = mid
         else:
-            a = mid
-    return (a + b) / 2.0, iterations
+            a, f_a = mid, f_mid
+    return MethodResult("bisection", (a + b) / 2.0, True, iterations, evaluations,
+                        time.perf_counter() - start_time, error_estimate=(b - a) / 2.0)
+
+def draw_function_with_roots(ax, x_vals, y_vals, root_points, method_name):
+    ax.plot(x_vals, y_vals, label='f(x)', color='blue')
+    ax.axhline(0, color='black', linewidth=0.5)
+
+    if root_points:
+        for root, value in root_points:
+            ax.scatter(root, value, color='green', label=f'Root at x={root:.4f}')
+        ax.set_title(f"{method_name} - Roots Visualization")
+    else:
+        ax.set_title(f"{method_name} - No roots found")
 
-def plot_function_with_roots(f, roots, start, end, step=0.01, method_name=""):
+    ax.set_xlabel("x")
+    ax.set_ylabel("f(x)")
+    ax.legend()
+    ax.grid(True)
+
+def plot_function_with_roots(f, roots, start, end, step=0.01, method_name="", *, budget=None):
     """
-    Plots the function f(x) and highlights the roots found.
+    Plots the function f(x) and highlights the roots found (to a file when a PlotSink is active).
+    Points are sampled where the curve bends, at most as many as a uniform grid with spacing
+    `step` would use, or at most `budget` points if that is given.
     """
-    x_vals = []
-    y_vals = []
-
-    x = start
-    while x <= end:
-        x_vals.append(x)
-        y_vals.append(f(x))
-        x += step
-
-    plt.figure(figsize=(8, 5))
-    plt.plot(x_vals, y_vals, label='f(x)', color='blue')
-    plt.axhline(0, color='black', linewidth=0.5)
-
-    if roots:
-        for root in roots:
-            plt.scatter(root, f(root), color='green', label=f'Root at x={root:.4f}')
-        plt.title(f"{method_name} - Roots Visualization")
-    else:
-        plt.title(f"{method_name} - No roots found")
-
-    plt.xlabel("x")
-    plt.ylabel("f(x)")
-    plt.legend()
-    plt.grid(True)
-    plt.tight_layout()
-    plt.show()
+    if budget is None:
+        if step <= 0:
+            raise ValueError("Step must be positive.")
+        budget = max(3, int((end - start) / step) + 1)
+    x_vals, y_vals = sample_curve(f, start, end, budget)
+    root_points = [(root, f(root)) for root in roots or []]
+    render("roots", draw_function_with_roots, x_vals, y_vals, root_points, method_name, figsize=(8, 5))
 """
 def main():
     start = 0
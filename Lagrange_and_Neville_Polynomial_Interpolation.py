@@ -1,4 +1,7 @@
-import matplotlib.pyplot as plt
+import numpy as np
+
+from plot_sampling import sample_curve
+from plot_sink import render
 
 def lagrange_interpolation(x_vals, y_vals, x_interp):
     """
@@ -30,6 +33,41 @@ def lagrange_interpolation(x_vals, y_vals, x_interp):
         result += term
     return result
 
+def lagrange_interpolation_vectorized(x_vals, y_vals, x_interp):
+    """
+    Evaluates the Lagrange polynomial at many points at once using the barycentric form,
+    O(n) per point after an O(n^2) weight setup, instead of O(n^2) per point.
+
+    Parameters:
+        x_vals (list of float): x-coordinates of the data points.
+        y_vals (list of float): y-coordinates of the data points.
+        x_interp (float or array of float): The x-values where interpolation is desired.
+
+    Returns:
+        numpy.ndarray: The interpolated y-values, with the shape of x_interp.
+    """
+    if len(x_vals) != len(y_vals):
+        raise ValueError("X and Y lists must be of the same length.")
+    if len(x_vals) < 2:
+        raise ValueError("At least two data points are required.")
+
+    xs = np.asarray(x_vals, dtype=float)
+    ys = np.asarray(y_vals, dtype=float)
+    differences = xs[:, None] - xs[None, :]
+    np.fill_diagonal(differences, 1.0)
+    if np.any(differences == 0):
+        raise ZeroDivisionError("Duplicate X values detected.")
+    weights = 1.0 / np.prod(differences, axis=1)
+
+    x = np.asarray(x_interp, dtype=float)
+    offsets = x[..., None] - xs
+    exact = offsets == 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        terms = weights / offsets
+        result = (terms @ ys) / np.sum(terms, axis=-1)
+    hits = np.any(exact, axis=-1)
+    return np.where(hits, ys[np.argmax(exact, axis=-1)], result)
+
 def neville_interpolation(x_vals, y_vals, x_interp):
     """
     Performs Neville's method to estimate the value of a function at a given point.
@@ -62,9 +100,21 @@ def neville_interpolation(x_vals, y_vals, x_interp):
 
     return Q[0][n - 1]
 
+def draw_interpolation(ax, x_range, y_range, x_vals, y_vals, x_interp, y_interp):
+    ax.plot(x_range, y_range, label='Lagrange Polynomial', color='blue')
+    ax.plot(x_vals, y_vals, 'ro', label='Original Points')
+    ax.plot(x_interp, y_interp, 'gs', label=f'Interpolated Point ({x_interp:.2f}, {y_interp:.2f})')
+
+    ax.set_title('Polynomial Interpolation (Lagrange)')
+    ax.set_xlabel('x')
+    ax.set_ylabel('y')
+    ax.legend()
+    ax.grid(True)
+
 def plot_interpolation(x_vals, y_vals, x_interp, y_interp):
     """
-    Plots the interpolation result along with the original data points and the interpolation curve.
+    Plots the interpolation result along with the original data points and the interpolation curve
+    (to a file when a PlotSink is active).
 
     Parameters:
         x_vals (list of float): x-coordinates of the data points.
@@ -72,28 +122,9 @@ def plot_interpolation(x_vals, y_vals, x_interp, y_interp):
         x_interp (float): The x-value where interpolation is desired.
         y_interp (float): The interpolated y-value to be shown on the plot.
     """
-    x_range = []
-    current = min(x_vals) - 0.5
-    end = max(x_vals) + 0.5
-    step = 0.01
-    while current <= end:
-        x_range.append(current)
-        current += step
-
-    y_range = [lagrange_interpolation(x_vals, y_vals, xi) for xi in x_range]
-
-    plt.figure()
-    plt.plot(x_range, y_range, label='Lagrange Polynomial', color='blue')
-    plt.plot(x_vals, y_vals, 'ro', label='Original Points')
-    plt.plot(x_interp, y_interp, 'gs', label=f'Interpolated Point ({x_interp:.2f}, {y_interp:.2f})')
-
-    plt.title('Polynomial Interpolation (Lagrange)')
-    plt.xlabel('x')
-    plt.ylabel('y')
-    plt.legend()
-    plt.grid(True)
-    plt.tight_layout()
-    plt.show()
+    x_range, y_range = sample_curve(lambda x: lagrange_interpolation_vectorized(x_vals, y_vals, x),
+                                    min(x_vals) - 0.5, max(x_vals) + 0.5)
+    render("interpolation", draw_interpolation, x_range, y_range, x_vals, y_vals, x_interp, y_interp)
 
 def main():
     """
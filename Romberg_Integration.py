@@ -1,7 +1,15 @@
 import math
-import matplotlib.pyplot as plt
+import time
+import numpy as np
+
+from method_result import MethodResult
+from instrumentation import profiled
+from vectorized_integration import sample_function
+from plot_sink import render
 
+@profiled("romberg")
 def romberg(f, a, b, max_level, verbose=True, real_value=None):
+    start = time.perf_counter()
     R = [[0.0] * (i + 1) for i in range(max_level)]
     h = b - a
     R[0][0] = 0.5 * h * (f(a) + f(b))
@@ -11,7 +19,9 @@ def romberg(f, a, b, max_level, verbose=True, real_value=None):
         subtotal = sum(f(a + (2 * k - 1) * h) for k in range(1, 2**(i - 1) + 1))
         R[i][0] = 0.5 * R[i - 1][0] + h * subtotal
         for j in range(1, i + 1):
-            R[i][j] = (4*j * R[i][j - 1] - R[i - 1][j - 1]) / (4*j - 1)
+            R[i][j] = (4**j * R[i][j - 1] - R[i - 1][j - 1]) / (4**j - 1)
+
+    elapsed = time.perf_counter() - start
 
     if verbose:
         print("\nRomberg Integration Table:")
@@ -28,22 +38,105 @@ def romberg(f, a, b, max_level, verbose=True, real_value=None):
         if real_value is not None:
             plot_romberg_convergence(R, real_value)
 
-    return R, R[max_level - 1][max_level - 1]
-
-def plot_romberg_convergence(R, real_value):
-    approx_values = [R[i][i] for i in range(len(R))]  # Diagonal values
-    levels = list(range(1, len(R) + 1))
-
-    plt.figure()
-    plt.plot(levels, approx_values, marker='o', label='Romberg Approximation')
-    plt.axhline(real_value, color='green', linestyle='--', label=f'True Value ≈ {real_value:.10f}')
-    plt.xlabel('Refinement Level')
-    plt.ylabel('Approximation')
-    plt.title('Romberg Convergence Plot')
-    plt.grid(True)
-    plt.legend()
-    plt.tight_layout()
-    plt.show()
+    error_estimate = abs(R[-1][-1] - R[-2][-1]) if max_level > 1 else None  # Successive diagonal entries.
+    return MethodResult("romberg", R[max_level - 1][max_level - 1], True, max_level, 2**(max_level - 1) + 1,
+                        elapsed, error_estimate, details={"table": R})
+
+class RombergIntegrator:
+    """
+    Incremental Romberg integration of f over [a, b].
+    The table and all sampled midpoints are kept, so extend() only evaluates
+    the 2^(k-1) new midpoints of level k, and integrate() stops as soon as
+    successive diagonal entries agree to tolerance.
+    """
+
+    def __init__(self, f, a, b):
+        self.f = f
+        self.a = a
+        self.b = b
+        self.R = []
+        self.nodes = []
+        self.values = []
+        self.evaluations = 0
+
+    @property
+    def levels(self):
+        return len(self.R)
+
+    @property
+    def estimate(self):
+        return self.R[-1][-1] if self.R else None
+
+    @property
+    def error_estimate(self):
+        if len(self.R) < 2:
+            return None
+        return abs(self.R[-1][-1] - self.R[-2][-1])
+
+    def extend(self):
+        """
+        Adds one level to the Romberg table and returns its diagonal entry.
+        """
+        i = len(self.R)
+        h = (self.b - self.a) / 2**i
+        if i == 0:
+            x = np.array([self.a, self.b], dtype=float)
+            y = sample_function(self.f, x)
+            row = [0.5 * h * float(y[0] + y[1])]
+        else:
+            # Odd multiples of h are exactly the points not sampled on coarser levels.
+            x = self.a + h * np.arange(1, 2**i, 2)
+            y = sample_function(self.f, x)
+            row = [0.5 * self.R[i - 1][0] + h * float(np.sum(y))]
+            for j in range(1, i + 1):
+                row.append((4**j * row[j - 1] - self.R[i - 1][j - 1]) / (4**j - 1))
+        self.nodes.append(x)
+        self.values.append(y)
+        self.evaluations += len(x)
+        self.R.append(row)
+        return row[-1]
+
+    def result(self, converged=True, elapsed=0.0):
+        """
+        Packs the current state of the table into a MethodResult.
+        """
+        return MethodResult("romberg", self.estimate, converged, self.levels, self.evaluations,
+                            elapsed, self.error_estimate, details={"table": self.R})
+
+    def integrate(self, tol=1e-10, max_level=20, min_level=3):
+        """
+        Extends the table until successive diagonal entries differ by at most tol
+        (absolute, or relative to the estimate when that is larger), or max_level is reached.
+
+        Returns:
+            MethodResult: The estimate, with the table in details["table"].
+        """
+        if tol <= 0:
+            raise ValueError("Tolerance must be positive.")
+        start = time.perf_counter()
+        while True:
+            # An error estimate needs two diagonal entries, so at least two levels are required.
+            if (self.levels >= max(min_level, 2) and self.error_estimate is not None
+                    and self.error_estimate <= tol * max(1.0, abs(self.estimate))):
+                return self.result(True, time.perf_counter() - start)
+            if self.levels >= max_level:
+                return self.result(False, time.perf_counter() - start)
+            self.extend()
+
+def plot_romberg_convergence(R, real_value=None):
+    approx_values = [float(R[i][i]) for i in range(len(R))]  # Diagonal values
+    render("romberg_convergence", draw_romberg_convergence, approx_values, real_value)
+
+def draw_romberg_convergence(ax, approx_values, real_value=None):
+    levels = list(range(1, len(approx_values) + 1))
+    ax.plot(levels, approx_values, marker='o', label='Romberg Approximation')
+    if real_value is not None:
+        ax.axhline(real_value, color='green', linestyle='--', label=f'True Value ≈ {real_value:.10f}')
+    ax.set_xlabel('Refinement Level')
+    ax.set_ylabel('Approximation')
+    ax.set_title('Romberg Convergence Plot')
+    ax.grid(True)
+    ax.legend()
 
 def select_function(choice):
     if choice == "1":
@@ -85,17 +178,45 @@ if _name_ == "_main_":
     except ValueError as ve:
         print("Error:", ve)
 """
-from math import sin, cos, exp
-import numpy as np
-import matplotlib.pyplot as plt
-
-def romberg_main():
-    print("Running Romberg Integration...")
-    def f(x):
-        return eval(select_function())
-    a = float(input("Enter start of interval a: "))
-    b = float(input("Enter end of interval b: "))
-    n = int(input("Enter number of iterations: "))
-    result, matrix = romberg(f, a, b, n)
-    print("Result:", result)
-    plot_romberg_convergence(matrix)
+@profiled("romberg_main", callables=(3,))
+def romberg_main(a, b, max_level, f, tol=None, real_value=None, verbose=True, plot=True):
+    """
+    Menu entry point for Romberg integration.
+    Takes the pre-compiled callable from get_function_from_user, so no expression
+    is parsed during the run.
+
+    Parameters:
+        a (float): Start of the interval.
+        b (float): End of the interval.
+        max_level (int): Maximum number of refinement levels.
+        f (function): The integrand.
+        tol (float): If given, stop early once successive diagonal entries agree to tol.
+        real_value (float): Optional exact value, drawn on the convergence plot.
+        verbose (bool): Whether to print the table and summary.
+        plot (bool): Whether to show the convergence plot.
+
+    Returns:
+        MethodResult: The estimate, with the table in details["table"].
+    """
+    if max_level < 1:
+        raise ValueError("Number of levels must be at least 1.")
+    integrator = RombergIntegrator(f, a, b)
+    if tol is None:
+        start = time.perf_counter()
+        for _ in range(max_level):
+            integrator.extend()
+        result = integrator.result(True, time.perf_counter() - start)
+    else:
+        result = integrator.integrate(tol, max_level=max_level, min_level=max(2, min(3, max_level)))
+
+    if verbose:
+        print("\nRomberg Integration Table:")
+        for i, row in enumerate(result.details["table"]):
+            print(f"R[{i}]: {['{:.10f}'.format(v) for v in row]}")
+        print(f"Result: {result.value:.10f}")
+        if result.error_estimate is not None:
+            print(f"Error estimate: {result.error_estimate:.3e}")
+        print(f"Function evaluations: {result.evaluations}")
+    if plot:
+        plot_romberg_convergence(result.details["table"], real_value)
+    return result
@@ -1,10 +1,17 @@
 import math
-import matplotlib.pyplot as plt
+import time
 
+from method_result import MethodResult
+from instrumentation import profiled
+from plot_sink import render
+from parameter_sweep import simpson_sweep
+
+@profiled("simpson")
 def simpson(f, a, b, n):
     if n % 2 != 0:
         raise ValueError("n must be even for Simpson's Rule.")
 
+    start = time.perf_counter()
     h = (b - a) / n
     total = f(a) + f(b)
 
@@ -14,7 +21,7 @@ def simpson(f, a, b, n):
     for i in range(2, n, 2):
         total += 2 * f(a + i * h)
 
-    return (h / 3) * total
+    return MethodResult("simpson", (h / 3) * total, True, n, n + 1, time.perf_counter() - start)
 
 def select_function(choice):
     if choice == "1":
@@ -28,19 +35,18 @@ def select_function(choice):
 
 def plot_convergence(f, a, b, exact, fname):
     ns = list(range(2, 32, 2))  # Even values of n from 2 to 30
-    approximations = [simpson(f, a, b, n) for n in ns]
-    errors = [abs(approx - exact) for approx in approximations]
-
-    plt.figure()
-    plt.plot(ns, approximations, 'bo-', label='Simpson Approximation')
-    plt.axhline(y=exact, color='green', linestyle='--', label=f'Exact Value ≈ {exact:.10f}')
-    plt.xlabel('Number of Subintervals (n)')
-    plt.ylabel('Integral Approximation')
-    plt.title(f'Simpson’s Rule Convergence – f(x) = {fname}')
-    plt.grid(True)
-    plt.legend()
-    plt.tight_layout()
-    plt.show()
+    # Nested grids share their samples, so f is evaluated far fewer than sum(n + 1) times.
+    approximations = [row["value"] for row in simpson_sweep(f, a, b, ns)]
+    render("simpson_convergence", draw_convergence, ns, approximations, exact, fname)
+
+def draw_convergence(ax, ns, approximations, exact, fname):
+    ax.plot(ns, approximations, 'bo-', label='Simpson Approximation')
+    ax.axhline(y=exact, color='green', linestyle='--', label=f'Exact Value ≈ {exact:.10f}')
+    ax.set_xlabel('Number of Subintervals (n)')
+    ax.set_ylabel('Integral Approximation')
+    ax.set_title(f'Simpson’s Rule Convergence – f(x) = {fname}')
+    ax.grid(True)
+    ax.legend()
 
 def main():
     print("Simpson’s Rule – Numerical Integration\n")
@@ -68,7 +74,7 @@ def main():
             elif choice == "3":
                 true_val = math.exp(b) - math.exp(a)
 
-        approx = simpson(f, a, b, n)
+        approx = simpson(f, a, b, n).value
 
         print(f"\nIntegrating {fname} from {a} to {b} using {n} subintervals.")
         print(f"Approximate integral: {approx:.10f}")
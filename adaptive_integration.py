@@ -0,0 +1,163 @@
+import heapq
+import time
+import numpy as np
+
+from method_result import MethodResult
+from instrumentation import profiled
+from vectorized_integration import sample_function
+
+# Gauss-Kronrod 7-15 abscissae and weights on [-1, 1] (QUADPACK values, non-negative half).
+_XGK = np.array([
+    0.991455371120812639206854697526329, 0.949107912342758524526189684047851,
+    0.864864423359769072789712788640926, 0.741531185599394439863864773280788,
+    0.586087235467691130294144845693013, 0.405845151377397166906606412076961,
+    0.207784955007898467600689403773245, 0.000000000000000000000000000000000,
+])
+_WGK = np.array([
+    0.022935322010529224963732008058970, 0.063092092629978553290700663189204,
+    0.104790010322250183839876322541518, 0.140653259715525918745189590510238,
+    0.169004726639267902826583426598550, 0.190350578064785409913256402421014,
+    0.204432940075298892414161999234649, 0.209482141084727828012999174891714,
+])
+_WG = np.array([
+    0.129484966168869693270611432679082, 0.279705391489276667901467771423780,
+    0.381830050505118944950369775488975, 0.417959183673469387755102040816327,
+])
+
+# Full 15-point tables, ordered from -1 to 1. The 7 Gauss nodes are the odd positions.
+KRONROD_NODES = np.concatenate([-_XGK[:-1], _XGK[::-1]])
+KRONROD_WEIGHTS = np.concatenate([_WGK[:-1], _WGK[::-1]])
+GAUSS_WEIGHTS = np.zeros(15)
+GAUSS_WEIGHTS[1::2] = np.concatenate([_WG[:-1], _WG[::-1]])
+
+def _tolerance(abs_tol, rel_tol, value):
+    return max(abs_tol, rel_tol * abs(value))
+
+@profiled("adaptive_simpson")
+def adaptive_simpson(f, a, b, abs_tol=1e-10, rel_tol=1e-10, max_depth=50):
+    """
+    Recursive adaptive Simpson's Rule with Richardson correction.
+    Each subdivision reuses the three samples of its parent, so only two new
+    function evaluations are spent per refined panel.
+
+    Parameters:
+        f (function): The integrand – a function of one variable.
+        a (float): The lower limit of integration.
+        b (float): The upper limit of integration.
+        abs_tol (float): Target absolute error.
+        rel_tol (float): Target error relative to the integral.
+        max_depth (int): Maximum recursion depth per panel.
+
+    Returns:
+        MethodResult: The integral estimate with its error estimate and evaluation count.
+
+    Raises:
+        ValueError: If both tolerances are non-positive.
+    """
+    if abs_tol <= 0 and rel_tol <= 0:
+        raise ValueError("At least one of abs_tol, rel_tol must be positive.")
+    if a == b:
+        return MethodResult("adaptive_simpson", 0.0, error_estimate=0.0)
+
+    start = time.perf_counter()
+    evaluations = 0
+    deepest = 0
+
+    def fx(x):
+        nonlocal evaluations
+        evaluations += 1
+        return float(f(x))
+
+    def simpson_panel(left, f_left, right, f_right):
+        mid = 0.5 * (left + right)
+        f_mid = fx(mid)
+        return mid, f_mid, (right - left) / 6 * (f_left + 4 * f_mid + f_right)
+
+    def refine(left, f_left, right, f_right, mid, f_mid, whole, tol, depth):
+        nonlocal deepest
+        deepest = max(deepest, depth)
+        left_mid, f_left_mid, left_area = simpson_panel(left, f_left, mid, f_mid)
+        right_mid, f_right_mid, right_area = simpson_panel(mid, f_mid, right, f_right)
+        delta = left_area + right_area - whole
+        if depth >= max_depth or abs(delta) <= 15 * tol:
+            return left_area + right_area + delta / 15, abs(delta) / 15
+        left_value, left_err = refine(left, f_left, mid, f_mid, left_mid, f_left_mid,
+                                      left_area, tol / 2, depth + 1)
+        right_value, right_err = refine(mid, f_mid, right, f_right, right_mid, f_right_mid,
+                                        right_area, tol / 2, depth + 1)
+        return left_value + right_value, left_err + right_err
+
+    f_a, f_b = fx(a), fx(b)
+    mid, f_mid, whole = simpson_panel(a, f_a, b, f_b)
+    tol = _tolerance(abs_tol, rel_tol, whole)
+    value, error = refine(a, f_a, b, f_b, mid, f_mid, whole, tol, 0)
+    converged = error <= _tolerance(abs_tol, rel_tol, value) or deepest < max_depth
+    return MethodResult("adaptive_simpson", value, converged, deepest + 1, evaluations,
+                        time.perf_counter() - start, error)
+
+def gauss_kronrod_panel(f, a, b):
+    """
+    Applies the 7-point Gauss / 15-point Kronrod pair on [a, b] with one vectorized call.
+
+    Returns:
+        tuple: (Kronrod estimate, error estimate |K15 - G7|)
+    """
+    half = 0.5 * (b - a)
+    y = sample_function(f, 0.5 * (a + b) + half * KRONROD_NODES)
+    kronrod = half * float(np.dot(KRONROD_WEIGHTS, y))
+    gauss = half * float(np.dot(GAUSS_WEIGHTS, y))
+    return kronrod, abs(kronrod - gauss)
+
+@profiled("gauss_kronrod")
+def gauss_kronrod(f, a, b, abs_tol=1e-10, rel_tol=1e-10, max_evaluations=100000):
+    """
+    Globally adaptive G7-K15 quadrature.
+    Panels are kept in a max-heap keyed by their error estimate, and the worst
+    panel is bisected until the summed error meets the tolerance.
+
+    Parameters:
+        f (function): The integrand; NumPy-vectorized callables are evaluated 15 nodes at a time.
+        a (float): The lower limit of integration.
+        b (float): The upper limit of integration.
+        abs_tol (float): Target absolute error.
+        rel_tol (float): Target error relative to the integral.
+        max_evaluations (int): Budget of function evaluations.
+
+    Returns:
+        MethodResult: The integral estimate with its error estimate and evaluation count.
+
+    Raises:
+        ValueError: If both tolerances are non-positive.
+    """
+    if abs_tol <= 0 and rel_tol <= 0:
+        raise ValueError("At least one of abs_tol, rel_tol must be positive.")
+    if a == b:
+        return MethodResult("gauss_kronrod", 0.0, error_estimate=0.0)
+
+    start = time.perf_counter()
+    value, error = gauss_kronrod_panel(f, a, b)
+    evaluations = 15
+    heap = [(-error, a, b, value)]
+
+    while error > _tolerance(abs_tol, rel_tol, value) and evaluations + 30 <= max_evaluations:
+        neg_err, left, right, panel_value = heapq.heappop(heap)
+        mid = 0.5 * (left + right)
+        if mid == left or mid == right:
+            heapq.heappush(heap, (neg_err, left, right, panel_value))
+            break
+        left_value, left_err = gauss_kronrod_panel(f, left, mid)
+        right_value, right_err = gauss_kronrod_panel(f, mid, right)
+        evaluations += 30
+        heapq.heappush(heap, (-left_err, left, mid, left_value))
+        heapq.heappush(heap, (-right_err, mid, right, right_value))
+        value += left_value + right_value - panel_value
+        error += left_err + right_err + neg_err
+
+    # Re-sum from the panels to drop the rounding drift of the running totals.
+    value = sum(panel[3] for panel in heap)
+    error = sum(-panel[0] for panel in heap)
+    converged = error <= _tolerance(abs_tol, rel_tol, value)
+    message = "" if converged else (f"Tolerance not reached within {max_evaluations} evaluations "
+                                    f"(error estimate {error:.3e}).")
+    return MethodResult("gauss_kronrod", value, converged, len(heap), evaluations,
+                        time.perf_counter() - start, error, message)
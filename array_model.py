@@ -0,0 +1,50 @@
+import numpy as np
+
+def as_matrix(A):
+    """
+    Returns A as a C-contiguous float64 2-D array.
+    Arrays that already have this layout (including read-only memmaps) are returned as is, without copying.
+
+    Raises:
+        ValueError: If A is not two-dimensional.
+    """
+    A = np.ascontiguousarray(A, dtype=np.float64)
+    if A.ndim != 2:
+        raise ValueError("Matrix must be two-dimensional.")
+    return A
+
+def as_vector(v):
+    """
+    Returns v as a flat float64 array.
+    Accepts flat lists, column lists [[v0], [v1], ...], and 1-D or (n, 1) arrays.
+    Contiguous float64 arrays give a view, not a copy.
+
+    Raises:
+        ValueError: If v is neither flat nor a single column.
+    """
+    v = np.asarray(v, dtype=np.float64)
+    if v.ndim == 2 and v.shape[1] == 1:
+        return v.reshape(-1)
+    if v.ndim != 1:
+        raise ValueError("Vector must be flat or a single column.")
+    return v
+
+def layout_of(v):
+    """
+    Records the container layout of a vector argument, so results can be returned in the same layout.
+
+    Returns:
+        tuple: (is_array, shape)
+    """
+    return isinstance(v, np.ndarray), np.shape(v)
+
+def restore_layout(x, layout):
+    """
+    Compatibility layer for the list-based API: returns the flat float64 result x in the
+    layout recorded by layout_of. Array callers get a reshaped view; list callers get
+    a flat list or a column list [[x0], [x1], ...] as they passed in. Only the orientation
+    is kept, so x may differ in length from the recorded vector (e.g. Ax for a non-square A).
+    """
+    is_array, shape = layout
+    x = x.reshape((len(x),) + tuple(shape[1:]))
+    return x if is_array else x.tolist()
@@ -0,0 +1,43 @@
+"""
+Benchmark: polynomial integration with the scalar trapezoidal rule,
+the vectorized trapezoidal rule and the exact antiderivative.
+
+Run from the repository root:
+    python benchmarks/bench_polynomial_integration.py
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from evaluate_polynomial import trapezoidal_rule, trapezoidal_rule_vectorized, integrate_polynomial
+
+COEFFS = [1.0, -6.0, 11.0, -6.0]  # x^3 - 6x^2 + 11x - 6
+LEFT, RIGHT = 0.0, 5.0
+STEPS = [1e-3, 1e-4, 1e-5, 1e-6]
+
+def best_time(func, *args, repeat=3):
+    best = float("inf")
+    value = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        value = func(*args)
+        value = getattr(value, "value", value)
+        best = min(best, time.perf_counter() - start)
+    return best, value
+
+def main():
+    exact_time, exact = best_time(integrate_polynomial, COEFFS, LEFT, RIGHT, repeat=100)
+    print(f"Exact integral: {exact:.12f}  ({exact_time * 1e6:.1f} us)\n")
+    print(f"{'step':>8} {'scalar [s]':>12} {'vectorized [s]':>15} {'speedup':>9} {'abs error':>12}")
+    for step in STEPS:
+        repeat = 1 if step < 1e-5 else 3
+        scalar_time, scalar_value = best_time(trapezoidal_rule, LEFT, RIGHT, COEFFS, step, repeat=repeat)
+        vector_time, vector_value = best_time(trapezoidal_rule_vectorized, LEFT, RIGHT, COEFFS, step)
+        assert abs(scalar_value - vector_value) <= 1e-8 * max(1.0, abs(scalar_value))
+        print(f"{step:>8.0e} {scalar_time:>12.4f} {vector_time:>15.5f} "
+              f"{scalar_time / vector_time:>8.0f}x {abs(vector_value - exact):>12.3e}")
+
+if __name__ == "__main__":
+    main()
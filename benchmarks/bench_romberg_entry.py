@@ -0,0 +1,66 @@
+"""
+Benchmark: per-evaluation overhead of the Romberg entry point.
+
+"before" re-parses the expression string with eval on every call, as the old
+romberg_main did; "after" uses the callable lambdified once by get_function_from_user.
+
+Run from the repository root:
+    python benchmarks/bench_romberg_entry.py
+"""
+import math
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sympy import symbols, lambdify, sympify
+
+from Romberg_Integration import romberg, romberg_main
+
+EXPRESSION = "sin(x)*exp(-x/3) + x**2/10"
+A, B = 0.0, 4.0
+LEVELS = 16
+EVALUATIONS = 100000
+
+def eval_callable(expr_str):
+    namespace = {"sin": math.sin, "cos": math.cos, "exp": math.exp}
+    def f(x):
+        return eval(expr_str, namespace, {"x": x})
+    return f
+
+def lambdified_callable(expr_str):
+    return lambdify(symbols('x'), sympify(expr_str), "numpy")
+
+def time_calls(f, count):
+    start = time.perf_counter()
+    for i in range(count):
+        f(i * 1e-5)
+    return (time.perf_counter() - start) / count
+
+def main():
+    before = eval_callable(EXPRESSION)
+    after = lambdified_callable(EXPRESSION)
+
+    before_per_call = time_calls(before, EVALUATIONS)
+    after_per_call = time_calls(after, EVALUATIONS)
+    print(f"Per-evaluation cost, scalar calls ({EVALUATIONS} calls):")
+    print(f"  eval of string:      {before_per_call * 1e6:8.2f} us")
+    print(f"  lambdified callable: {after_per_call * 1e6:8.2f} us")
+
+    start = time.perf_counter()
+    before_value = romberg(before, A, B, LEVELS, verbose=False).value
+    before_total = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = romberg_main(A, B, LEVELS, after, verbose=False, plot=False)
+    after_total = time.perf_counter() - start
+
+    assert abs(before_value - result.value) < 1e-9
+    print(f"\nRomberg, {LEVELS} levels ({result.evaluations} evaluations):")
+    print(f"  old path (eval, scalar loop):      {before_total:.4f} s")
+    print(f"  romberg_main (lambdified, arrays): {after_total:.4f} s")
+    print(f"  speedup: {before_total / after_total:.0f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Load test for solver_service: measures requests per second and latency percentiles.
+
+Starts the service in a subprocess on a temporary Unix socket (or uses a running one with
+--socket), opens several connections and keeps a window of pipelined requests in flight on each.
+
+Run from the repository root:
+    python benchmarks/load_test_service.py --requests 2000 --connections 4 --pipeline 16
+"""
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import numpy as np
+
+from solver_service import SolverClient
+
+# A mix of cheap root finding, quadrature and a small linear solve.
+WORKLOAD = [
+    ("bisection_method", {"f": "x**3 - 2*x - 5", "start": 2, "end": 3, "epsilon": 1e-10}),
+    ("newton_method", {"func": "cos(x) - x", "x0": 1.0, "epsilon": 1e-12}),
+    ("simpson_vectorized", {"f": "exp(-x**2)", "a": 0, "b": 2, "n": 1000}),
+    ("gauss_kronrod", {"f": "sqrt(x)", "a": 0, "b": 1}),
+    ("gauss_seidel_method", {"A": [[4, 2, 0], [2, 10, 4], [0, 4, 5]], "b": [2, 6, 5], "tol": 1e-10}),
+]
+
+async def run_connection(socket_path, count, pipeline, latencies, errors):
+    client = await SolverClient.connect(socket_path)
+    window = asyncio.Semaphore(pipeline)
+
+    async def one(i):
+        method, params = WORKLOAD[i % len(WORKLOAD)]
+        async with window:
+            start = time.perf_counter()
+            try:
+                await client.call(method, **params)
+            except RuntimeError:
+                errors.append(method)
+            latencies.append(time.perf_counter() - start)
+
+    await asyncio.gather(*(one(i) for i in range(count)))
+    await client.close()
+
+async def load_test(socket_path, requests, connections, pipeline):
+    latencies = []
+    errors = []
+    per_connection = [requests // connections + (i < requests % connections) for i in range(connections)]
+    start = time.perf_counter()
+    await asyncio.gather(*(run_connection(socket_path, count, pipeline, latencies, errors)
+                           for count in per_connection))
+    return time.perf_counter() - start, np.array(latencies), errors
+
+def wait_for_socket(path, process, timeout=60.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if os.path.exists(path):
+            return
+        if process.poll() is not None:
+            raise RuntimeError("The service exited during startup.")
+        time.sleep(0.05)
+    raise RuntimeError("The service did not start in time.")
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test the solver service.")
+    parser.add_argument("--socket", default=None, help="Use an already running service on this socket.")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes for the spawned service.")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--connections", type=int, default=4)
+    parser.add_argument("--pipeline", type=int, default=16, help="Requests in flight per connection.")
+    args = parser.parse_args()
+
+    process = None
+    socket_path = args.socket
+    if socket_path is None:
+        socket_path = os.path.join(tempfile.mkdtemp(), "numerics.sock")
+        command = [sys.executable, os.path.join(ROOT, "solver_service.py"), "--socket", socket_path]
+        if args.workers:
+            command += ["--workers", str(args.workers)]
+        process = subprocess.Popen(command, stdout=subprocess.DEVNULL)
+        wait_for_socket(socket_path, process)
+
+    try:
+        elapsed, latencies, errors = asyncio.run(
+            load_test(socket_path, args.requests, args.connections, args.pipeline))
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+    print(f"{len(latencies)} requests over {args.connections} connection(s), pipeline depth {args.pipeline}")
+    print(f"Throughput: {len(latencies) / elapsed:.0f} requests/s ({elapsed:.2f} s)")
+    print(f"Latency p50: {np.percentile(latencies, 50) * 1e3:.2f} ms, "
+          f"p99: {np.percentile(latencies, 99) * 1e3:.2f} ms, max: {latencies.max() * 1e3:.2f} ms")
+    if errors:
+        print(f"{len(errors)} request(s) failed.")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
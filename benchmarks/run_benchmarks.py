@@ -0,0 +1,310 @@
+"""
+Benchmark suite covering every numerical method at several problem sizes.
+
+Each benchmark records the best wall time over a few repeats, the peak memory
+allocated during one run (tracemalloc), and the number of function evaluations.
+Results are written as JSON and can be compared against a saved baseline.
+
+Run from the repository root:
+    python benchmarks/run_benchmarks.py                  # run everything, write results/latest.json
+    python benchmarks/run_benchmarks.py --quick          # smallest sizes only
+    python benchmarks/run_benchmarks.py --filter simpson # only benchmarks whose name contains "simpson"
+    python benchmarks/run_benchmarks.py --save-baseline  # also store the run as results/baseline.json
+    python benchmarks/run_benchmarks.py --compare        # flag regressions against results/baseline.json
+"""
+import argparse
+import contextlib
+import io
+import json
+import math
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+os.environ.setdefault("MPLBACKEND", "Agg")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import matplotlib.pyplot as plt
+
+from instrumentation import CountingFunction
+from method_result import MethodResult
+from EquationRoots import bisection_method, newton_method, secant_method
+from jacobi_gauss_seidel import jacobi_method, gauss_seidel_method
+from forward_elimination import gaussian_elimination
+from mixed_precision import lu_factor, lu_solve, mixed_precision_solve
+from sparse_matrix import poisson_2d
+from parallel_iterative import block_jacobi, multicolor_gauss_seidel
+from Lagrange_and_Neville_Polynomial_Interpolation import lagrange_interpolation, neville_interpolation
+from Cubic_Spline_Interpolation import cubic_spline_interpolation
+from Simpson_Rule import simpson
+from Romberg_Integration import romberg
+from interpolation_methods import trapezoid_rule
+from vectorized_integration import simpson_vectorized, trapezoid_vectorized
+from matrix_vector_mult import residual_norm_max
+from plot_sink import DiscardSink, set_plot_sink
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+BENCHMARKS = []
+
+def benchmark(name, sizes, quick_sizes=None):
+    """
+    Registers a benchmark. The decorated function takes a size and returns
+    (run, counter): a zero-argument callable to time, and an optional
+    CountingFunction whose evaluation points are reported as evaluations
+    (so vectorized and scalar integrators are counted alike).
+    """
+    def decorator(setup):
+        BENCHMARKS.append({"name": name, "sizes": sizes, "quick_sizes": quick_sizes or sizes[:1],
+                           "setup": setup})
+        return setup
+    return decorator
+
+def cubic(x):
+    return x**3 - 6*x**2 + 11*x - 6
+
+def diagonally_dominant_system(n, seed=0):
+    rng = np.random.default_rng(seed)
+    A = rng.uniform(-1.0, 1.0, (n, n))
+    A[np.arange(n), np.arange(n)] = np.sum(np.abs(A), axis=1) + 1.0
+    return A.tolist(), rng.uniform(-1.0, 1.0, n).tolist()
+
+# --- Root finding (EquationRoots) ---
+
+@benchmark("roots.bisection", [10, 100, 1000])
+def bench_bisection(size):
+    f = CountingFunction(cubic)
+    shifts = np.linspace(-0.4, 0.4, size)
+    return (lambda: [bisection_method(lambda x, s=s: f(x - s), 0.5, 1.5, 1e-10) for s in shifts]), f
+
+@benchmark("roots.newton", [10, 100, 1000])
+def bench_newton(size):
+    f = CountingFunction(cubic)
+    starts = np.linspace(0.6, 1.4, size)
+    return (lambda: [newton_method(f, lambda x: 3*x**2 - 12*x + 11, x0, 1e-12) for x0 in starts]), f
+
+@benchmark("roots.secant", [10, 100, 1000])
+def bench_secant(size):
+    f = CountingFunction(cubic)
+    starts = np.linspace(0.6, 0.9, size)
+    return (lambda: [secant_method(f, x0, x0 + 0.5, 1e-12) for x0 in starts]), f
+
+# --- Linear solvers (jacobi_gauss_seidel, forward_elimination) ---
+
+@benchmark("linear.jacobi", [10, 50, 100])
+def bench_jacobi(size):
+    A, b = diagonally_dominant_system(size)
+    b_col = [[v] for v in b]
+    return (lambda: jacobi_method(A, b_col, tol=1e-10)), None
+
+@benchmark("linear.gauss_seidel", [10, 50, 100])
+def bench_gauss_seidel(size):
+    A, b = diagonally_dominant_system(size)
+    b_col = [[v] for v in b]
+    return (lambda: gauss_seidel_method(A, b_col, tol=1e-10)), None
+
+@benchmark("linear.gaussian_elimination", [10, 50, 200])
+def bench_gaussian_elimination(size):
+    A, b = diagonally_dominant_system(size)
+    return (lambda: gaussian_elimination(A, b)), None
+
+@benchmark("linear.lu_float64", [50, 200, 500], quick_sizes=[50, 200])
+def bench_lu_float64(size):
+    A, b = diagonally_dominant_system(size)
+    A = np.array(A)
+    return (lambda: lu_solve(*lu_factor(A, np.float64), b)), None
+
+@benchmark("linear.mixed_precision", [50, 200, 500], quick_sizes=[50, 200])
+def bench_mixed_precision(size):
+    A, b = diagonally_dominant_system(size)
+    A = np.array(A)
+    return (lambda: mixed_precision_solve(A, b)), None
+
+# Sparse 5-point Poisson systems with size^2 unknowns (224^2 ~ 50k), a fixed number of sweeps.
+
+@benchmark("linear.block_jacobi_sparse", [32, 100, 224], quick_sizes=[32])
+def bench_block_jacobi_sparse(size):
+    A = poisson_2d(size)
+    b = np.ones(A.shape[0])
+    return (lambda: block_jacobi(A, b, tol=0.0, max_iterations=50)), None
+
+@benchmark("linear.multicolor_gauss_seidel_sparse", [32, 100, 224], quick_sizes=[32])
+def bench_multicolor_gauss_seidel_sparse(size):
+    A = poisson_2d(size)
+    b = np.ones(A.shape[0])
+    return (lambda: multicolor_gauss_seidel(A, b, tol=0.0, max_iterations=50)), None
+
+# --- Interpolation (Lagrange / Neville / spline) ---
+
+@benchmark("interpolation.lagrange", [5, 20, 80])
+def bench_lagrange(size):
+    x = np.linspace(0.0, 1.0, size).tolist()
+    y = np.sin(x).tolist()
+    targets = np.linspace(0.0, 1.0, 100)
+    return (lambda: [lagrange_interpolation(x, y, t) for t in targets]), None
+
+@benchmark("interpolation.neville", [5, 20, 80])
+def bench_neville(size):
+    x = np.linspace(0.0, 1.0, size).tolist()
+    y = np.sin(x).tolist()
+    targets = np.linspace(0.0, 1.0, 100)
+    return (lambda: [neville_interpolation(x, y, t) for t in targets]), None
+
+@benchmark("interpolation.cubic_spline", [10, 100, 1000])
+def bench_cubic_spline(size):
+    x = np.linspace(0.0, 1.0, size).tolist()
+    y = np.sin(x).tolist()
+    targets = np.linspace(0.0, 1.0, 100)
+    return (lambda: [cubic_spline_interpolation(x, y, t) for t in targets]), None
+
+# --- Integration (Simpson / Romberg / trapezoid) ---
+
+@benchmark("integration.simpson", [100, 10000, 1000000], [100, 10000])
+def bench_simpson(size):
+    f = CountingFunction(math.sin)
+    return (lambda: simpson(f, 0.0, math.pi, size)), f
+
+@benchmark("integration.simpson_vectorized", [100, 10000, 1000000], [100, 10000])
+def bench_simpson_vectorized(size):
+    f = CountingFunction(np.sin)
+    return (lambda: simpson_vectorized(f, 0.0, math.pi, size)), f
+
+@benchmark("integration.trapezoid", [100, 10000, 1000000], [100, 10000])
+def bench_trapezoid(size):
+    f = CountingFunction(math.sin)
+    return (lambda: trapezoid_rule(f, 0.0, math.pi, size)), f
+
+@benchmark("integration.trapezoid_vectorized", [100, 10000, 1000000], [100, 10000])
+def bench_trapezoid_vectorized(size):
+    f = CountingFunction(np.sin)
+    return (lambda: trapezoid_vectorized(f, 0.0, math.pi, size)), f
+
+@benchmark("integration.romberg", [5, 10, 15])
+def bench_romberg(size):
+    f = CountingFunction(math.sin)
+    return (lambda: romberg(f, 0.0, math.pi, size, verbose=False)), f
+
+# --- Residuals (matrix_vector_mult) ---
+
+@benchmark("residual.residual_norm_max", [10, 100, 500])
+def bench_residual(size):
+    A, b = diagonally_dominant_system(size)
+    x = np.ones(size).tolist()
+    return (lambda: residual_norm_max(A, x, b)), None
+
+def measure(entry, size, repeat):
+    """
+    Runs one benchmark at one size and returns its record. Plots are discarded, so the
+    timings measure the methods and not matplotlib.
+    """
+    run, counter = entry["setup"](size)
+    sink = io.StringIO()
+    previous_plots = set_plot_sink(DiscardSink())
+    try:
+        with contextlib.redirect_stdout(sink):
+            if counter is not None:
+                counter.reset()
+            result = run()
+            plt.close("all")
+            evaluations = counter.points if counter is not None else None
+            if evaluations is None and isinstance(result, MethodResult):
+                evaluations = result.evaluations
+
+            tracemalloc.start()
+            run()
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            plt.close("all")
+
+            best = math.inf
+            for _ in range(repeat):
+                start = time.perf_counter()
+                run()
+                best = min(best, time.perf_counter() - start)
+                plt.close("all")
+    finally:
+        set_plot_sink(previous_plots)
+
+    return {"name": entry["name"], "size": size, "time": best,
+            "memory_peak": peak, "evaluations": evaluations}
+
+def run_all(quick=False, name_filter=None, repeat=3):
+    records = []
+    for entry in BENCHMARKS:
+        if name_filter and name_filter not in entry["name"]:
+            continue
+        for size in entry["quick_sizes"] if quick else entry["sizes"]:
+            record = measure(entry, size, repeat)
+            records.append(record)
+            evaluations = "-" if record["evaluations"] is None else record["evaluations"]
+            print(f"{record['name']:<36}{size:>9}{record['time'] * 1e3:>12.3f} ms"
+                  f"{record['memory_peak'] / 1024:>12.1f} KiB{evaluations:>12}")
+    return records
+
+def metadata():
+    return {"timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(), "numpy": np.__version__,
+            "platform": platform.platform(), "machine": platform.machine()}
+
+def save(records, path):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump({"meta": metadata(), "results": records}, handle, indent=2)
+
+def compare(records, baseline_path, threshold):
+    """
+    Prints the time ratio against the baseline for every shared (name, size)
+    and returns the list of regressions slower than `threshold` times the baseline.
+    """
+    with open(baseline_path, encoding="utf-8") as handle:
+        baseline = {(r["name"], r["size"]): r for r in json.load(handle)["results"]}
+    regressions = []
+    print(f"\n{'benchmark':<36}{'size':>9}{'baseline [ms]':>15}{'now [ms]':>12}{'ratio':>8}")
+    for record in records:
+        old = baseline.get((record["name"], record["size"]))
+        if old is None:
+            continue
+        ratio = record["time"] / old["time"] if old["time"] > 0 else math.inf
+        flag = "  REGRESSION" if ratio > threshold else ""
+        print(f"{record['name']:<36}{record['size']:>9}{old['time'] * 1e3:>15.3f}"
+              f"{record['time'] * 1e3:>12.3f}{ratio:>8.2f}{flag}")
+        if ratio > threshold:
+            regressions.append((record["name"], record["size"], ratio))
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the numerical-methods benchmark suite.")
+    parser.add_argument("--quick", action="store_true", help="Only run the smallest sizes.")
+    parser.add_argument("--filter", default=None, help="Only run benchmarks whose name contains this text.")
+    parser.add_argument("--repeat", type=int, default=3, help="Timing repeats per benchmark (best is kept).")
+    parser.add_argument("--output", default=os.path.join(RESULTS_DIR, "latest.json"))
+    parser.add_argument("--baseline", default=os.path.join(RESULTS_DIR, "baseline.json"))
+    parser.add_argument("--save-baseline", action="store_true", help="Also store this run as the baseline.")
+    parser.add_argument("--compare", action="store_true", help="Compare against the baseline.")
+    parser.add_argument("--threshold", type=float, default=1.25,
+                        help="Slowdown ratio above which a benchmark counts as a regression.")
+    args = parser.parse_args()
+
+    print(f"{'benchmark':<36}{'size':>9}{'time':>15}{'peak memory':>16}{'evals':>12}")
+    records = run_all(args.quick, args.filter, args.repeat)
+    save(records, args.output)
+    print(f"\nResults written to {args.output}")
+    if args.save_baseline:
+        save(records, args.baseline)
+        print(f"Baseline written to {args.baseline}")
+    if args.compare:
+        if not os.path.exists(args.baseline):
+            print(f"No baseline found at {args.baseline}; run with --save-baseline first.")
+            return 1
+        regressions = compare(records, args.baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) above {args.threshold:.2f}x.")
+            return 1
+        print("\nNo regressions.")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
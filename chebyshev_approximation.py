@@ -0,0 +1,184 @@
+import time
+import numpy as np
+
+from method_result import MethodResult
+from instrumentation import profiled
+from plot_sink import render
+from vectorized_integration import sample_function
+
+def chebyshev_points(n, a=-1.0, b=1.0):
+    """
+    Returns the n + 1 Chebyshev points of the second kind mapped to [a, b],
+    in increasing order.
+    """
+    if n < 1:
+        raise ValueError("Degree n must be at least 1.")
+    t = -np.cos(np.pi * np.arange(n + 1) / n)
+    return 0.5 * (b - a) * t + 0.5 * (a + b)
+
+def chebyshev_coefficients(values):
+    """
+    Computes Chebyshev coefficients from samples at the Chebyshev points.
+    Uses a DCT-I computed with a real FFT of the even extension, O(n log n).
+
+    Parameters:
+        values (array of float): f-values at chebyshev_points(n), increasing order.
+
+    Returns:
+        numpy.ndarray: Coefficients c_0 ... c_n of sum c_k T_k(t).
+    """
+    v = np.asarray(values, dtype=float)[::-1]  # order as cos(pi k / n), k = 0..n
+    n = len(v) - 1
+    if n == 0:
+        return v.copy()
+    extended = np.concatenate([v, v[n - 1:0:-1]])
+    c = np.fft.rfft(extended).real[:n + 1] / n
+    c[0] /= 2
+    c[n] /= 2
+    return c
+
+def clenshaw_evaluate(coeffs, x, a=-1.0, b=1.0):
+    """
+    Evaluates a Chebyshev series on [a, b] with Clenshaw's recurrence.
+    Works on scalars and arrays of query points alike.
+
+    Parameters:
+        coeffs (array of float): Chebyshev coefficients c_0 ... c_n.
+        x (float or array of float): Query points in [a, b].
+        a (float): Left end of the approximation interval.
+        b (float): Right end of the approximation interval.
+
+    Returns:
+        float or numpy.ndarray: Series value(s) at x.
+    """
+    c = np.asarray(coeffs, dtype=float)
+    if c.size == 0:
+        raise ValueError("Coefficient list is empty – cannot evaluate series.")
+    t = (2 * np.asarray(x, dtype=float) - (a + b)) / (b - a)
+    b1 = np.zeros_like(t)
+    b2 = np.zeros_like(t)
+    for ck in c[:0:-1]:
+        b1, b2 = 2 * t * b1 - b2 + ck, b1
+    result = t * b1 - b2 + c[0]
+    return result if result.ndim else float(result)
+
+def chebyshev_fit(f, a, b, n):
+    """
+    Interpolates f at n + 1 Chebyshev points on [a, b].
+
+    Returns:
+        numpy.ndarray: Chebyshev coefficients of the degree-n interpolant.
+    """
+    if a >= b:
+        raise ValueError("Lower limit a must be less than upper limit b.")
+    return chebyshev_coefficients(sample_function(f, chebyshev_points(n, a, b)))
+
+@profiled("chebyshev")
+def chebyshev_approximation(f, a, b, tol=1e-13, min_degree=16, max_degree=2**16):
+    """
+    Builds a Chebyshev approximation of f on [a, b], doubling the degree
+    until the trailing coefficients decay below tol (relative to the largest one).
+    Samples from the previous level are reused, since the points of degree n
+    are a subset of the points of degree 2n.
+
+    Parameters:
+        f (function): The function to approximate.
+        a (float): Left end of the interval.
+        b (float): Right end of the interval.
+        tol (float): Relative coefficient decay tolerance.
+        min_degree (int): Starting degree.
+        max_degree (int): Largest degree to try.
+
+    Returns:
+        MethodResult: value is the chopped coefficient array; iterations counts degree doublings.
+    """
+    if a >= b:
+        raise ValueError("Lower limit a must be less than upper limit b.")
+    if tol <= 0:
+        raise ValueError("Tolerance must be positive.")
+
+    start = time.perf_counter()
+    n = max(int(min_degree), 2)
+    values = sample_function(f, chebyshev_points(n, a, b))
+    doublings = 0
+    while True:
+        if not np.all(np.isfinite(values)):
+            raise ValueError("Function returned non-finite values on the interval.")
+        c = chebyshev_coefficients(values)
+        scale = max(np.max(np.abs(c)), np.finfo(float).tiny)
+        tail = np.abs(c[-max(n // 8, 2):])
+        if np.all(tail <= tol * scale):
+            return MethodResult("chebyshev", chop_coefficients(c, tol), True, doublings, n + 1,
+                                time.perf_counter() - start, float(np.max(tail)))
+        if 2 * n > max_degree:
+            return MethodResult("chebyshev", c, False, doublings, n + 1, time.perf_counter() - start,
+                                float(np.max(tail)),
+                                f"Coefficients did not decay below {tol} up to degree {max_degree}.")
+        # Only the odd-indexed points of the finer grid are new.
+        new_values = np.empty(2 * n + 1)
+        new_values[::2] = values
+        new_values[1::2] = sample_function(f, chebyshev_points(2 * n, a, b)[1::2])
+        values = new_values
+        n *= 2
+        doublings += 1
+
+def chop_coefficients(coeffs, tol):
+    """
+    Drops trailing coefficients whose magnitude is below tol relative to the largest one.
+    """
+    c = np.asarray(coeffs, dtype=float)
+    scale = np.max(np.abs(c))
+    if scale == 0:
+        return c[:1].copy()
+    significant = np.nonzero(np.abs(c) > tol * scale)[0]
+    return c[:significant[-1] + 1].copy()
+
+def chebyshev_integral(coeffs, a, b):
+    """
+    Integrates a Chebyshev series exactly over [a, b].
+    Uses the closed form of the integral of T_k over [-1, 1]: 2 / (1 - k^2) for even k, 0 for odd k.
+    """
+    c = np.asarray(coeffs, dtype=float)
+    k = np.arange(0, len(c), 2)
+    return 0.5 * (b - a) * float(np.dot(c[::2], 2.0 / (1.0 - k ** 2)))
+
+def chebyshev_derivative(coeffs, a=-1.0, b=1.0):
+    """
+    Returns the Chebyshev coefficients of the derivative of a series on [a, b].
+    """
+    c = np.asarray(coeffs, dtype=float)
+    n = len(c) - 1
+    if n == 0:
+        return np.zeros(1)
+    d = np.zeros(n + 2)
+    for k in range(n - 1, -1, -1):
+        d[k] = d[k + 2] + 2 * (k + 1) * c[k + 1]
+    d[0] /= 2
+    return d[:n] * (2.0 / (b - a))
+
+def chebyshev_surrogate(f, a, b, tol=1e-13, max_degree=2**16):
+    """
+    Returns a fast callable that approximates f on [a, b] together with its coefficients.
+    The callable accepts scalars or arrays, so it can be passed to the root finders,
+    integrators and plotting helpers in place of f.
+    """
+    result = chebyshev_approximation(f, a, b, tol=tol, max_degree=max_degree)
+    if not result.converged:
+        print(f"[Chebyshev] {result.message}")
+    coeffs = result.value
+    return (lambda x: clenshaw_evaluate(coeffs, x, a, b)), coeffs
+
+def draw_coefficients(ax, magnitudes, title):
+    ax.semilogy(np.arange(len(magnitudes)), np.maximum(magnitudes, 1e-300), marker='.')
+    ax.set_title(title)
+    ax.set_xlabel("Degree k")
+    ax.set_ylabel("|c_k|")
+    ax.grid(True)
+
+def plot_coefficients(coeffs, title="Chebyshev Coefficient Decay"):
+    """
+    Plots the magnitude of the Chebyshev coefficients on a logarithmic scale
+    (to a file when a PlotSink is active).
+    """
+    magnitudes = np.abs(np.asarray(coeffs, dtype=float))
+    render(title, draw_coefficients, magnitudes, title)
@@ -0,0 +1,191 @@
+import math
+import time
+import numpy as np
+
+from method_result import MethodResult
+from array_model import as_matrix, as_vector
+from jacobi_gauss_seidel import dominance_margins, jacobi_method, gauss_seidel_method
+from forward_elimination import gaussian_elimination
+
+# Rough per-operation costs used to compare solvers: one floating-point multiply-add inside
+# NumPy, and one interpreted Python step (a loop iteration with a small NumPy call).
+FLOP_COST = 1e-9
+PYTHON_STEP_COST = 1.5e-6
+
+def _check_diagonal(A):
+    if np.any(A.diagonal() == 0):
+        raise ValueError("Zero diagonal element: the Jacobi and Gauss-Seidel iterations are undefined.")
+
+def spectral_radius(matvec, n, max_iterations=300, tol=1e-4, window=10, seed=0):
+    """
+    Estimates the spectral radius of a linear operator by power iteration.
+    The growth factor is averaged geometrically over the last `window` steps, which also
+    gives a stable estimate when the dominant eigenvalues are a complex pair.
+
+    Parameters:
+        matvec (function): Applies the operator to a vector.
+        n (int): Dimension.
+        max_iterations (int): Maximum number of operator applications.
+        tol (float): Stop when two successive window estimates agree to this relative tolerance.
+        window (int): Number of steps averaged per estimate.
+        seed (int): Seed for the random start vector.
+
+    Returns:
+        float: The estimated spectral radius.
+    """
+    x = np.random.default_rng(seed).standard_normal(n)
+    x /= np.linalg.norm(x)
+    log_growth = []
+    previous = None
+    for k in range(max_iterations):
+        y = matvec(x)
+        norm = np.linalg.norm(y)
+        if norm == 0 or not np.isfinite(norm):
+            return 0.0 if norm == 0 else math.inf
+        log_growth.append(math.log(norm))
+        x = y / norm
+        if len(log_growth) >= 2 * window and len(log_growth) % window == 0:
+            estimate = math.exp(sum(log_growth[-window:]) / window)
+            if previous is not None and abs(estimate - previous) <= tol * max(estimate, 1e-300):
+                return estimate
+            previous = estimate
+    return math.exp(sum(log_growth[-window:]) / min(window, len(log_growth)))
+
+def jacobi_spectral_radius(A, **options):
+    """
+    Spectral radius of the Jacobi iteration matrix -D^{-1}(L + U), applied as x - D^{-1} A x.
+    """
+    A = as_matrix(A)
+    _check_diagonal(A)
+    diagonal = A.diagonal()
+    return spectral_radius(lambda x: x - (A @ x) / diagonal, len(A), **options)
+
+def forward_substitution(lower, v):
+    """
+    Solves (D + L) y = v for the lower triangle of a matrix with non-zero diagonal,
+    one column update per step (O(n^2)).
+    """
+    y = np.array(v, dtype=float)
+    for k in range(len(y)):
+        y[k] /= lower[k, k]
+        y[k + 1:] -= lower[k + 1:, k] * y[k]
+    return y
+
+def gauss_seidel_spectral_radius(A, **options):
+    """
+    Spectral radius of the Gauss-Seidel iteration matrix -(D + L)^{-1} U.
+    The matrix is never formed: each power step is one product with U and one
+    forward substitution, O(n^2) in total.
+    """
+    A = as_matrix(A)
+    _check_diagonal(A)
+    lower = np.tril(A)
+    upper = np.triu(A, 1)
+    return spectral_radius(lambda x: forward_substitution(lower, -(upper @ x)), len(A), **options)
+
+def predict_iterations(rho, tol, initial_change):
+    """
+    Predicts the iterations needed until successive iterates differ by less than tol,
+    assuming the change shrinks by a factor rho per iteration from initial_change.
+
+    Returns:
+        float: The predicted iteration count (math.inf if rho >= 1).
+    """
+    if initial_change < tol or initial_change == 0:
+        return 1
+    if rho >= 1:
+        return math.inf
+    if rho == 0:
+        return 2
+    return 1 + math.ceil(math.log(tol / initial_change) / math.log(rho))
+
+def diagnose(A, b, tol=1e-5, max_iterations=100, methods=("jacobi", "gauss_seidel")):
+    """
+    Convergence diagnostics for solving Ax = b iteratively from x = 0.
+    Every power step costs about one sweep of the method, so the radius estimates are capped at
+    max_iterations steps and at the estimated time of Gaussian elimination: the check never
+    costs more than the solve it is meant to save.
+
+    Parameters:
+        methods (tuple of str): The iterations to diagnose, "jacobi" and/or "gauss_seidel";
+                                pass only the one about to run to skip the other radius.
+
+    Returns:
+        dict: Row dominance margins, whether A is diagonally dominant, the spectral radius
+        ("rho_jacobi", "rho_gauss_seidel") and predicted iterations of every diagnosed method,
+        the estimated time of those methods and Gaussian elimination, and the recommended solver.
+
+    Raises:
+        ValueError: If a method is unknown or a diagonal element is zero.
+    """
+    A = as_matrix(A)
+    b = as_vector(b)
+    n = len(A)
+    unknown = set(methods) - {"jacobi", "gauss_seidel"}
+    if unknown:
+        raise ValueError(f"Unknown method '{unknown.pop()}'.")
+    _check_diagonal(A)
+    margins = dominance_margins(A)
+
+    # Jacobi sweeps are one matrix-vector product; Gauss-Seidel sweeps take n interpreted row
+    # updates; elimination is n^3 / 3 multiply-adds in n interpreted steps.
+    sweep_costs = {"jacobi": n * n * FLOP_COST + PYTHON_STEP_COST,
+                   "gauss_seidel": n * (n * FLOP_COST + PYTHON_STEP_COST)}
+    costs = {"gaussian_elimination": n ** 3 / 3 * FLOP_COST + 2 * n * PYTHON_STEP_COST}
+    # Both methods start from x = 0, so the first change is the size of the first iterate.
+    first_changes = {"jacobi": lambda: np.max(np.abs(b / A.diagonal())),
+                     "gauss_seidel": lambda: np.max(np.abs(forward_substitution(A, b)))}
+    radius_functions = {"jacobi": jacobi_spectral_radius, "gauss_seidel": gauss_seidel_spectral_radius}
+    diagnostics = {"margins": margins, "diagonally_dominant": bool(np.all(margins >= 0)),
+                   "predicted_iterations": {}, "estimated_time": costs}
+    for name in methods:
+        # At least two averaging windows are needed for an estimate.
+        steps = max(20, min(max_iterations, int(costs["gaussian_elimination"] / sweep_costs[name])))
+        rho = radius_functions[name](A, max_iterations=steps)
+        diagnostics[f"rho_{name}"] = rho
+        diagnostics["predicted_iterations"][name] = predict_iterations(rho, tol, first_changes[name]())
+        costs[name] = diagnostics["predicted_iterations"][name] * sweep_costs[name]
+
+    iterations = diagnostics["predicted_iterations"]
+    applicable = [name for name in costs
+                  if name == "gaussian_elimination" or iterations[name] <= max_iterations]
+    diagnostics["recommended"] = min(applicable, key=costs.get)
+    return diagnostics
+
+def print_diagnostics(diagnostics):
+    margins = diagnostics["margins"]
+    print(f"[Diagnostics] Diagonally dominant: {diagnostics['diagonally_dominant']} "
+          f"(smallest row margin {np.min(margins):.4g})")
+    for name, predicted in diagnostics["predicted_iterations"].items():
+        rho = diagnostics[f"rho_{name}"]
+        outlook = "will not converge" if math.isinf(predicted) else f"~{predicted} iterations"
+        print(f"[Diagnostics] {name}: spectral radius {rho:.4f}, {outlook}")
+    print(f"[Diagnostics] Recommended solver: {diagnostics['recommended']}")
+
+def auto_solve(A, b, tol=1e-5, max_iterations=100, verbose=False):
+    """
+    Diagnoses the system, then runs the solver predicted to be fastest among those that
+    will converge within max_iterations (Gaussian elimination if neither iteration will).
+
+    Returns:
+        MethodResult: The chosen solver's result; details["diagnostics"] holds the diagnosis
+        and details["diagnosis_time"] its cost in seconds.
+    """
+    start = time.perf_counter()
+    diagnostics = diagnose(A, b, tol, max_iterations)
+    diagnosis_time = time.perf_counter() - start
+    if verbose:
+        print_diagnostics(diagnostics)
+
+    choice = diagnostics["recommended"]
+    if choice == "jacobi":
+        result = jacobi_method(A, b, tol, max_iterations)
+    elif choice == "gauss_seidel":
+        result = gauss_seidel_method(A, b, tol, max_iterations)
+    else:
+        solve_start = time.perf_counter()
+        x = gaussian_elimination(A, b)
+        result = MethodResult("gaussian_elimination", x, True, 1, 1, time.perf_counter() - solve_start)
+    result.details["diagnostics"] = diagnostics
+    result.details["diagnosis_time"] = diagnosis_time
+    return result
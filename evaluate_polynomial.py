@@ -1,4 +1,9 @@
-import matplotlib.pyplot as plt
+import time
+import numpy as np
+
+from method_result import MethodResult
+from plot_sampling import sample_curve
+from plot_sink import render
 
 def evaluate_polynomial(coeffs, x):
     """
@@ -14,22 +19,77 @@ def evaluate_polynomial(coeffs, x):
         result += coef * (x ** (degree - i))
     return result
 
+def validate_coefficients(coeffs):
+    """
+    Validates polynomial coefficients once and returns them as a float64 array.
+    Accepts a single coefficient list (highest degree first) or a 2-D array
+    holding one polynomial per row.
+    """
+    if coeffs is None or len(coeffs) == 0:
+        raise ValueError("Coefficient list is empty – cannot evaluate polynomial.")
+    c = np.asarray(coeffs)
+    if c.dtype.kind not in "iuf":
+        for coef in np.ravel(np.asarray(coeffs, dtype=object)):
+            if isinstance(coef, bool) or not isinstance(coef, (int, float, np.integer, np.floating)):
+                raise TypeError(f"Invalid coefficient: {coef} is not a number.")
+    c = c.astype(float)
+    if c.ndim not in (1, 2) or c.shape[-1] == 0:
+        raise ValueError("Coefficients must be a non-empty 1-D list or a 2-D array of rows.")
+    return c
+
+def horner_evaluate(coeffs, x, derivative=False, validate=True):
+    """
+    Evaluates one or many polynomials at one or many points using Horner's scheme.
+
+    Parameters:
+        coeffs (list or array of float): Coefficients from highest degree to constant,
+            or a 2-D array with one polynomial per row.
+        x (float or array of float): Evaluation point(s).
+        derivative (bool): If True, also return p'(x), computed in the same pass.
+        validate (bool): Set to False when coeffs were already checked by validate_coefficients.
+
+    Returns:
+        numpy.ndarray or float: p(x) with shape x.shape for a single polynomial,
+        or (number of polynomials,) + x.shape for a 2-D batch.
+        If derivative is True, a tuple (p(x), p'(x)).
+    """
+    c = validate_coefficients(coeffs) if validate else np.asarray(coeffs, dtype=float)
+    x = np.asarray(x, dtype=float)
+    # Put the coefficient axis first so each Horner step is one array operation.
+    terms = c if c.ndim == 1 else c.T.reshape((c.shape[1], c.shape[0]) + (1,) * x.ndim)
+    shape = np.broadcast_shapes(terms.shape[1:], x.shape)
+
+    p = np.full(shape, 0.0) + terms[0]
+    dp = np.zeros(shape)
+    for ck in terms[1:]:
+        if derivative:
+            dp = dp * x + p
+        p = p * x + ck
+
+    if p.ndim == 0:
+        p, dp = float(p), float(dp)
+    return (p, dp) if derivative else p
+
 def trapezoidal_rule(left, right, coeffs, step=0.1, visualize=False):
     """
     Approximates the definite integral of a polynomial using the Trapezoidal Rule.
     Optionally shows a visual plot if visualize=True.
+    Returns a MethodResult whose value is the approximation.
     """
     if step <= 0:
         raise ValueError("Step size must be positive.")
     if left == right:
-        return 0.0
+        return MethodResult("trapezoidal_rule", 0.0)
     if left > right:
-        return -trapezoidal_rule(right, left, coeffs, step, visualize)
+        result = trapezoidal_rule(right, left, coeffs, step, visualize)
+        result.value = -result.value
+        return result
 
     n = int((right - left) / step)
     if n == 0:
         raise ValueError("Interval too small relative to step size – no subintervals created.")
 
+    start = time.perf_counter()
     total_area = 0
     x_vals = []
     y_vals = []
@@ -49,38 +109,86 @@ def trapezoidal_rule(left, right, coeffs, step=0.1, visualize=False):
     if visualize:
         plot_trapezoids(coeffs, left, right, step, x_vals, y_vals)
 
-    return total_area
+    return MethodResult("trapezoidal_rule", total_area, True, n, 2 * n, time.perf_counter() - start)
+
+def integrate_polynomial(coeffs, left, right):
+    """
+    Computes the exact definite integral of a polynomial from its antiderivative.
+
+    Parameters:
+        coeffs (list of float): Coefficients from highest degree to constant.
+        left (float): Lower limit of integration.
+        right (float): Upper limit of integration.
+
+    Returns:
+        float: The exact value of the integral.
+    """
+    c = validate_coefficients(coeffs)
+    if c.ndim != 1:
+        raise ValueError("integrate_polynomial expects a single coefficient list.")
+    degree = len(c) - 1
+    antiderivative = np.append(c / np.arange(degree + 1, 0, -1), 0.0)
+    return float(horner_evaluate(antiderivative, right, validate=False)
+                 - horner_evaluate(antiderivative, left, validate=False))
+
+def trapezoidal_rule_vectorized(left, right, coeffs, step=0.1, visualize=False):
+    """
+    Same contract as trapezoidal_rule, but evaluates every grid point exactly once
+    with a single vectorized Horner pass instead of two scalar calls per step.
+    """
+    if step <= 0:
+        raise ValueError("Step size must be positive.")
+    if left == right:
+        return MethodResult("trapezoidal_rule_vectorized", 0.0)
+    if left > right:
+        result = trapezoidal_rule_vectorized(right, left, coeffs, step, visualize)
+        result.value = -result.value
+        return result
+
+    n = int((right - left) / step)
+    if n == 0:
+        raise ValueError("Interval too small relative to step size – no subintervals created.")
+
+    start = time.perf_counter()
+    x = left + step * np.arange(n + 1)
+    y = horner_evaluate(coeffs, x)
+    total_area = step * (np.sum(y) - 0.5 * (y[0] + y[-1]))
+
+    if visualize:
+        x_vals = np.column_stack([x[:-1], x[1:]]).ravel()
+        y_vals = np.column_stack([y[:-1], y[1:]]).ravel()
+        plot_trapezoids(coeffs, left, right, step, x_vals, y_vals)
+
+    return MethodResult("trapezoidal_rule_vectorized", float(total_area), True, n, n + 1,
+                        time.perf_counter() - start)
 
 def plot_trapezoids(coeffs, left, right, step, x_vals, y_vals):
     """
-    Plots the polynomial and trapezoids used in the approximation.
+    Plots the polynomial and trapezoids used in the approximation (to a file when a PlotSink is active).
     """
-    fine_x = []
-    fine_y = []
-    x = left
-    while x <= right:
-        fine_x.append(x)
-        fine_y.append(evaluate_polynomial(coeffs, x))
-        x += step / 20
-
-    plt.figure(figsize=(10, 5))
-    plt.plot(fine_x, fine_y, label='f(x)', color='blue')
-    plt.fill_between(fine_x, fine_y, color='lightblue', alpha=0.3)
-
-    # Draw trapezoids
-    for i in range(0, len(x_vals) - 1, 2):
-        x1, x2 = x_vals[i], x_vals[i + 1]
-        y1, y2 = y_vals[i], y_vals[i + 1]
-        plt.plot([x1, x1, x2, x2], [0, y1, y2, 0], 'r--', alpha=0.6)
-
-    plt.axhline(0, color='black', linewidth=0.5)
-    plt.title("Trapezoidal Rule Visualization")
-    plt.xlabel("x")
-    plt.ylabel("f(x)")
-    plt.legend()
-    plt.grid(True)
-    plt.tight_layout()
-    plt.show()
+    fine_x, fine_y = sample_curve(lambda x: horner_evaluate(coeffs, x), left, right)
+    render("trapezoids", draw_trapezoids, fine_x, fine_y, x_vals, y_vals, figsize=(10, 5))
+
+def draw_trapezoids(ax, fine_x, fine_y, x_vals, y_vals):
+    ax.plot(fine_x, fine_y, label='f(x)', color='blue')
+    ax.fill_between(fine_x, fine_y, color='lightblue', alpha=0.3)
+
+    # Draw all trapezoids as one polyline, separated by NaN breaks.
+    x_vals = np.asarray(x_vals, dtype=float)
+    y_vals = np.asarray(y_vals, dtype=float)
+    x1, x2 = x_vals[0::2], x_vals[1::2]
+    y1, y2 = y_vals[0::2], y_vals[1::2]
+    zeros = np.zeros_like(x1)
+    breaks = np.full_like(x1, np.nan)
+    ax.plot(np.column_stack([x1, x1, x2, x2, breaks]).ravel(),
+            np.column_stack([zeros, y1, y2, zeros, breaks]).ravel(), 'r--', alpha=0.6)
+
+    ax.axhline(0, color='black', linewidth=0.5)
+    ax.set_title("Trapezoidal Rule Visualization")
+    ax.set_xlabel("x")
+    ax.set_ylabel("f(x)")
+    ax.legend()
+    ax.grid(True)
 
 """
 def main():
@@ -99,7 +207,7 @@ def main():
 
         # Perform integration and visualize
         result = trapezoidal_rule(a, b, coeffs, step, visualize=True)
-        print(f"\nApproximate value of the definite integral: {result:.6f}")
+        print(f"\nApproximate value of the definite integral: {result.value:.6f}")
 
     except Exception as e:
         print("Error:", str(e))
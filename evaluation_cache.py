@@ -0,0 +1,104 @@
+from collections import OrderedDict
+import numpy as np
+
+class MemoizedFunction:
+    """
+    Wraps an expensive function of one variable with a bounded LRU cache keyed on the
+    float input, so several methods (and plots) run on the same f share evaluations.
+
+    Scalars are looked up directly. Arrays are split into cached and uncached entries,
+    and only the distinct misses are evaluated, in one vectorized call.
+    """
+    __slots__ = ("f", "maxsize", "hits", "misses", "evictions", "_cache")
+
+    def __init__(self, f, maxsize=4096):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1.")
+        self.f = f
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._cache = OrderedDict()
+
+    def __call__(self, x):
+        if np.ndim(x) == 0:
+            return self._scalar(float(x))
+        return self._array(np.asarray(x, dtype=float))
+
+    def _scalar(self, key):
+        cache = self._cache
+        if key in cache:
+            cache.move_to_end(key)
+            self.hits += 1
+            return cache[key]
+        value = self.f(key)
+        self.misses += 1
+        self._store(key, value)
+        return value
+
+    def _array(self, x):
+        keys, inverse = np.unique(x.ravel(), return_inverse=True)
+        values = np.empty(len(keys))
+        cache = self._cache
+        missing = []
+        for i, key in enumerate(keys.tolist()):
+            if key in cache:
+                cache.move_to_end(key)
+                values[i] = cache[key]
+            else:
+                missing.append(i)
+
+        if missing:
+            missing = np.array(missing)
+            new_values = self._evaluate(keys[missing])
+            values[missing] = new_values
+            for key, value in zip(keys[missing].tolist(), new_values.tolist()):
+                self._store(key, value)
+        self.hits += x.size - len(missing)
+        self.misses += len(missing)
+        return values[inverse].reshape(x.shape)
+
+    def _evaluate(self, points):
+        try:
+            y = np.asarray(self.f(points), dtype=float)
+            if y.shape != points.shape:
+                y = np.broadcast_to(y, points.shape).copy()
+            return y
+        except (TypeError, ValueError):
+            return np.array([self.f(p) for p in points.tolist()], dtype=float)
+
+    def _store(self, key, value):
+        cache = self._cache
+        cache[key] = value
+        if len(cache) > self.maxsize:
+            cache.popitem(last=False)
+            self.evictions += 1
+
+    def cache_info(self):
+        """
+        Returns hit/miss statistics as a dict.
+        """
+        lookups = self.hits + self.misses
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+                "size": len(self._cache), "maxsize": self.maxsize,
+                "hit_rate": self.hits / lookups if lookups else 0.0}
+
+    def cache_clear(self):
+        self._cache.clear()
+        self.hits = self.misses = self.evictions = 0
+
+def memoize(f, maxsize=4096):
+    """
+    Opt-in memoization for an expensive user function.
+
+    Parameters:
+        f (function): A function of one variable (NumPy-vectorized or scalar-only).
+        maxsize (int): Maximum number of cached points; the least recently used are evicted.
+
+    Returns:
+        MemoizedFunction: Callable like f, with cache_info() and cache_clear().
+    """
+    if isinstance(f, MemoizedFunction):
+        return f
+    return MemoizedFunction(f, maxsize)
@@ -0,0 +1,138 @@
+import ast
+import math
+import re
+
+import sympy
+from sympy.parsing.sympy_parser import parse_expr, standard_transformations, convert_xor
+
+# Functions and constants an expression in x may use, by the name written in the expression.
+FUNCTIONS = {
+    "sin": sympy.sin, "cos": sympy.cos, "tan": sympy.tan, "cot": sympy.cot,
+    "sec": sympy.sec, "csc": sympy.csc, "asin": sympy.asin, "acos": sympy.acos, "atan": sympy.atan,
+    "sinh": sympy.sinh, "cosh": sympy.cosh, "tanh": sympy.tanh,
+    "asinh": sympy.asinh, "acosh": sympy.acosh, "atanh": sympy.atanh,
+    "exp": sympy.exp, "log": sympy.log, "ln": sympy.log, "sqrt": sympy.sqrt,
+    "abs": sympy.Abs, "Abs": sympy.Abs, "sign": sympy.sign, "floor": sympy.floor, "ceiling": sympy.ceiling,
+}
+CONSTANTS = {"pi": sympy.pi, "E": sympy.E}
+
+_OPERATORS = (ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Pow, ast.Mod, ast.UAdd, ast.USub)
+
+# Largest constant exponent accepted. SymPy evaluates constant powers exactly, so 9**9**9
+# would otherwise tie up the parser computing a 370-million-digit integer.
+MAX_EXPONENT = 1000
+
+def is_valid_function_input(expr_str):
+    allowed_chars = r"^[\d\w\s\+\-\*\/\^\(\)\.\,\:]+$"
+    hebrew_letters = re.compile("[\u0590-\u05FF]")
+    if not re.match(allowed_chars, expr_str.replace("**", "^")):
+        return False, "Expression contains invalid characters."
+    if hebrew_letters.search(expr_str):
+        return False, "Expression contains Hebrew letters, which are not allowed."
+    return True, ""
+
+def _check_tree(node):
+    """
+    Walks the syntax tree and rejects anything but numbers, x, the whitelisted constants,
+    arithmetic operators and calls of whitelisted functions by name.
+    """
+    if isinstance(node, ast.Expression):
+        return _check_tree(node.body)
+    if isinstance(node, ast.Constant):
+        if type(node.value) not in (int, float):
+            raise ValueError("Only numeric constants are allowed.")
+        return
+    if isinstance(node, ast.Name):
+        if node.id != "x" and node.id not in CONSTANTS:
+            raise ValueError(f"Unknown name '{node.id}': only x, {', '.join(CONSTANTS)} and functions are allowed.")
+        return
+    if isinstance(node, ast.BinOp) and isinstance(node.op, _OPERATORS):
+        _check_tree(node.left)
+        _check_tree(node.right)
+        return
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, _OPERATORS):
+        _check_tree(node.operand)
+        return
+    if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and not node.keywords:
+        if node.func.id not in FUNCTIONS:
+            raise ValueError(f"Unknown function '{node.func.id}'.")
+        for argument in node.args:
+            _check_tree(argument)
+        return
+    raise ValueError(f"'{type(node).__name__}' is not allowed in an expression.")
+
+def _constant_value(node):
+    """
+    Value of a constant subtree as a float (None if it depends on x or calls a function).
+
+    Raises:
+        ValueError: If a constant exponent exceeds MAX_EXPONENT or a constant overflows a float.
+    """
+    if isinstance(node, ast.Expression):
+        return _constant_value(node.body)
+    if isinstance(node, ast.Constant):
+        return float(node.value)
+    if isinstance(node, ast.Name):
+        return float(CONSTANTS[node.id]) if node.id in CONSTANTS else None
+    if isinstance(node, ast.Call):
+        # SymPy evaluates whitelisted functions of exact constants (floor(1e9) is an Integer),
+        # so their values must be bounded like any other constant.
+        values = [_constant_value(argument) for argument in node.args]
+        if any(value is None for value in values):
+            return None
+        try:
+            value = complex(sympy.N(FUNCTIONS[node.func.id](*(sympy.Float(v) for v in values))))
+        except (TypeError, ValueError, OverflowError):
+            raise ValueError(f"Invalid arguments for {node.func.id}().") from None
+        return _checked(value.real if value.imag == 0 else value)
+    if isinstance(node, ast.UnaryOp):
+        value = _constant_value(node.operand)
+        return None if value is None else (-value if isinstance(node.op, ast.USub) else value)
+    left = _constant_value(node.left)
+    right = _constant_value(node.right)
+    if isinstance(node.op, ast.Pow) and right is not None and abs(right) > MAX_EXPONENT:
+        raise ValueError(f"Constant exponents are limited to {MAX_EXPONENT}.")
+    if left is None or right is None:
+        return None
+    operations = {ast.Add: lambda p, q: p + q, ast.Sub: lambda p, q: p - q, ast.Mult: lambda p, q: p * q,
+                  ast.Div: lambda p, q: p / q, ast.Pow: lambda p, q: p ** q, ast.Mod: lambda p, q: p % q}
+    try:
+        return _checked(operations[type(node.op)](left, right))
+    except (OverflowError, ZeroDivisionError):
+        raise ValueError("Constant is too large or undefined.") from None
+
+def _checked(value):
+    if isinstance(value, complex):
+        raise ValueError("Constants must be real numbers.")
+    if not math.isfinite(value):
+        raise ValueError("Constant is too large or undefined.")
+    return value
+
+def parse_function(expr_str):
+    """
+    Parses an expression in x into a SymPy expression without evaluating arbitrary code:
+    the text is first checked against the allowed characters and then, as a syntax tree,
+    against a whitelist (no attribute access, no unknown names, no constant exponent above
+    MAX_EXPONENT or constant beyond the float range), and is finally parsed with
+    parse_expr over a namespace holding only x and the whitelisted functions and constants.
+    '^' is accepted for powers.
+
+    Returns:
+        sympy.Expr: The expression.
+
+    Raises:
+        ValueError: If the expression is malformed or uses anything outside the whitelist.
+    """
+    valid, msg = is_valid_function_input(expr_str)
+    if not valid:
+        raise ValueError(msg)
+    try:
+        tree = ast.parse(expr_str.replace("^", "**").strip(), mode="eval")
+    except SyntaxError as e:
+        raise ValueError(f"Malformed expression: {e.msg}.") from None
+    _check_tree(tree)
+    _constant_value(tree)
+    namespace = {"__builtins__": {}, "Integer": sympy.Integer, "Float": sympy.Float,
+                 "Rational": sympy.Rational, **FUNCTIONS, **CONSTANTS}
+    return parse_expr(expr_str, local_dict={"x": sympy.Symbol("x")}, global_dict=namespace,
+                      transformations=standard_transformations + (convert_xor,))
@@ -1,96 +1,103 @@
-import matplotlib.pyplot as plt
+import numpy as np
+
+from array_model import as_matrix, as_vector, layout_of, restore_layout
+from matrix_io import parse_vector
+from plot_sink import render
 
 def forward_elimination(A, b):
     """
     Performs the forward phase of Gaussian Elimination.
+    Each elimination step updates all rows below the pivot with one NumPy operation.
 
     Parameters:
-        A (list of list of float): Coefficient matrix (must be square).
-        b (list of float): Right-hand side vector.
+        A (list of list of float or numpy.ndarray): Coefficient matrix (must be square).
+        b (list of float or numpy.ndarray): Right-hand side vector.
 
     Returns:
-        tuple: (Upper-triangular matrix A, updated RHS vector b).
+        tuple: (Upper-triangular matrix A, updated RHS vector b), in the same container
+        types as the inputs (lists in, lists out; arrays in, arrays out).
 
     Raises:
         ValueError: If matrix is not square, mismatched vector size,
                     or a zero pivot is encountered.
     """
+    A_layout, b_layout = layout_of(A), layout_of(b)
+    A = np.array(A, dtype=np.float64)  # Working copy; the caller's data is never modified.
+    b = np.array(as_vector(b))
     n = len(A)
-    if any(len(row) != n for row in A):
+    if A.ndim != 2 or A.shape[1] != n:
         raise ValueError("Matrix A must be square.")
     if len(b) != n:
         raise ValueError("Vector b length must match matrix A size.")
 
-    A = [row[:] for row in A]  # deep copy
-    b = b[:]
-
     for i in range(n):
-        if A[i][i] == 0:
+        if A[i, i] == 0:
             raise ValueError(f"Zero pivot encountered at row {i}. Try pivoting.")
 
-        for j in range(i + 1, n):
-            factor = A[j][i] / A[i][i]
-            for k in range(i, n):
-                A[j][k] -= factor * A[i][k]
-            b[j] -= factor * b[i]
+        factors = A[i + 1:, i] / A[i, i]
+        A[i + 1:, i:] -= np.outer(factors, A[i, i:])
+        b[i + 1:] -= factors * b[i]
 
-    return A, b
+    return restore_layout(A, A_layout), restore_layout(b, b_layout)
 
 def back_substitution(U, y):
     """
     Performs the backward phase to solve Ux = y.
 
     Parameters:
-        U (list of list of float): Upper-triangular matrix.
-        y (list of float): RHS vector after forward elimination.
+        U (list of list of float or numpy.ndarray): Upper-triangular matrix.
+        y (list of float or numpy.ndarray): RHS vector after forward elimination.
 
     Returns:
-        list of float: Solution vector x.
+        list of float or numpy.ndarray: Solution vector x, in the same layout as y.
 
     Raises:
         ValueError: If diagonal element is zero (division by zero).
     """
+    y_layout = layout_of(y)
+    U = as_matrix(U)
+    y = as_vector(y)
     n = len(U)
-    x = [0.0] * n
+    x = np.zeros(n)
 
     for i in range(n - 1, -1, -1):
-        if U[i][i] == 0:
+        if U[i, i] == 0:
             raise ValueError(f"Zero diagonal element at row {i}, cannot divide.")
 
-        sum_ = sum(U[i][j] * x[j] for j in range(i + 1, n))
-        x[i] = (y[i] - sum_) / U[i][i]
+        x[i] = (y[i] - U[i, i + 1:] @ x[i + 1:]) / U[i, i]
 
-    return x
+    return restore_layout(x, y_layout)
 
 def gaussian_elimination(A, b):
     """
     Solves a system Ax = b using Gaussian Elimination (no pivoting).
 
     Parameters:
-        A (list of list of float): Coefficient matrix.
-        b (list of float): RHS vector.
+        A (list of list of float or numpy.ndarray): Coefficient matrix.
+        b (list of float or numpy.ndarray): RHS vector.
 
     Returns:
-        list of float: Solution vector x.
+        list of float or numpy.ndarray: Solution vector x, in the same layout as b.
     """
-    U, y = forward_elimination(A, b)
-    return back_substitution(U, y)
+    b_layout = layout_of(b)
+    U, y = forward_elimination(as_matrix(A), as_vector(b))
+    return restore_layout(back_substitution(U, y), b_layout)
+
+def draw_solution(ax, x):
+    ax.bar(list(range(len(x))), x)
+    ax.set_xlabel("Variable Index")
+    ax.set_ylabel("Value")
+    ax.set_title("Solution Vector x")
+    ax.grid(True)
 
 def plot_solution(x):
     """
-    Plots the solution vector x as a bar chart.
+    Plots the solution vector x as a bar chart (to a file when a PlotSink is active).
 
     Parameters:
         x (list of float): Solution vector.
     """
-    indices = list(range(len(x)))
-    plt.bar(indices, x)
-    plt.xlabel("Variable Index")
-    plt.ylabel("Value")
-    plt.title("Solution Vector x")
-    plt.grid(True)
-    plt.tight_layout()
-    plt.show()
+    render("solution", draw_solution, list(as_vector(x)))
 
 def get_matrix_input():
     """
@@ -105,14 +112,12 @@ def get_matrix_input():
     n = int(input("Enter number of variables (n): "))
     A = []
     for i in range(n):
-        row_input = input(f"Enter row {i + 1} (space-separated): ")
-        row = [float(val) for val in row_input.strip().split()]
+        row = parse_vector(input(f"Enter row {i + 1} (space-separated): "))
         if len(row) != n:
             raise ValueError(f"Row {i + 1} must have exactly {n} values.")
         A.append(row)
 
-    b_input = input("Enter RHS vector b (space-separated): ")
-    b = [float(val) for val in b_input.strip().split()]
+    b = parse_vector(input("Enter RHS vector b (space-separated): "))
     if len(b) != n:
         raise ValueError("Vector b length must match number of variables.")
 
@@ -0,0 +1,138 @@
+import functools
+import inspect
+import threading
+import time
+import numpy as np
+
+class CountingFunction:
+    """
+    Wraps a user function and records how often it is called, how many points it
+    was evaluated at (arrays count per element), the time spent inside it, and
+    optionally the evaluation points themselves.
+    """
+    __slots__ = ("f", "calls", "points", "elapsed", "record", "history")
+
+    def __init__(self, f, record=False):
+        self.f = f
+        self.calls = 0
+        self.points = 0
+        self.elapsed = 0.0
+        self.record = record
+        self.history = []
+
+    def __call__(self, x, *args):
+        start = time.perf_counter()
+        try:
+            value = self.f(x, *args)
+        finally:
+            self.elapsed += time.perf_counter() - start
+            self.calls += 1
+        self.points += int(np.size(x))
+        if self.record:
+            self.history.append(np.copy(x) if isinstance(x, np.ndarray) else x)
+        return value
+
+    def reset(self):
+        self.calls = 0
+        self.points = 0
+        self.elapsed = 0.0
+        self.history = []
+
+_enabled = False
+_record_points = False
+_lock = threading.Lock()
+_local = threading.local()
+_report = {}
+
+def enable_profiling(record_points=False):
+    """
+    Turns on profiling for every method decorated with @profiled.
+    """
+    global _enabled, _record_points
+    _enabled = True
+    _record_points = record_points
+
+def disable_profiling():
+    """
+    Turns profiling off. Decorated methods then call straight through without wrapping f.
+    """
+    global _enabled
+    _enabled = False
+
+def reset_profiling():
+    with _lock:
+        _report.clear()
+
+def profiled(name, callables=(0,)):
+    """
+    Decorator for numerical methods. While profiling is enabled, the user-function
+    arguments named by `callables` (parameter positions or names) are wrapped in a
+    CountingFunction, whether they are passed by position or by keyword, and the method's
+    total time is split into time spent inside the user function and numerical overhead.
+    While disabled, only a flag check is added.
+    """
+    def decorator(method):
+        signature = inspect.signature(method)
+        parameters = list(signature.parameters)
+        names = [parameters[i] if isinstance(i, int) else i for i in callables]
+
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            if not _enabled or getattr(_local, "depth", 0):
+                return method(*args, **kwargs)
+            try:
+                bound = signature.bind(*args, **kwargs)
+            except TypeError:
+                return method(*args, **kwargs)  # Let the method report the bad call itself.
+            counters = []
+            for parameter in names:
+                if callable(bound.arguments.get(parameter)):
+                    bound.arguments[parameter] = CountingFunction(bound.arguments[parameter], record=_record_points)
+                    counters.append(bound.arguments[parameter])
+            _local.depth = 1
+            start = time.perf_counter()
+            try:
+                return method(*bound.args, **bound.kwargs)
+            finally:
+                total = time.perf_counter() - start
+                _local.depth = 0
+                _record(name, total, counters)
+        return wrapper
+    return decorator
+
+def _record(name, total, counters):
+    function_time = sum(c.elapsed for c in counters)
+    with _lock:
+        entry = _report.setdefault(name, {"runs": 0, "total_time": 0.0, "function_time": 0.0,
+                                          "overhead_time": 0.0, "function_calls": 0,
+                                          "evaluations": 0, "points": []})
+        entry["runs"] += 1
+        entry["total_time"] += total
+        entry["function_time"] += function_time
+        entry["overhead_time"] += total - function_time
+        entry["function_calls"] += sum(c.calls for c in counters)
+        entry["evaluations"] += sum(c.points for c in counters)
+        for c in counters:
+            entry["points"].extend(c.history)
+
+def profiling_report():
+    """
+    Returns a copy of the collected statistics, keyed by method name.
+    """
+    with _lock:
+        return {name: dict(entry, points=list(entry["points"])) for name, entry in _report.items()}
+
+def print_profiling_report():
+    """
+    Prints per-method time split between numerical overhead and user-function time.
+    """
+    report = profiling_report()
+    if not report:
+        print("No profiling data collected.")
+        return
+    print(f"{'method':<28}{'runs':>6}{'total [ms]':>12}{'f(x) [ms]':>12}{'overhead [ms]':>15}"
+          f"{'calls':>9}{'evals':>10}")
+    for name, entry in sorted(report.items(), key=lambda item: -item[1]["total_time"]):
+        print(f"{name:<28}{entry['runs']:>6}{entry['total_time'] * 1e3:>12.3f}"
+              f"{entry['function_time'] * 1e3:>12.3f}{entry['overhead_time'] * 1e3:>15.3f}"
+              f"{entry['function_calls']:>9}{entry['evaluations']:>10}")
@@ -1,99 +1,9 @@
-import matplotlib.pyplot as plt
+import time
 
-def forward_elimination(A, b):
-    """
-    Performs the forward phase of Gaussian Elimination:
-    transforms matrix A into upper-triangular form and updates vector b.
-
-    Parameters:
-        A (list of list of float): Square coefficient matrix (n x n).
-        b (list of float): Right-hand side vector (length n).
-
-    Returns:
-        tuple: (Upper-triangular matrix A, modified RHS vector b)
-
-    Raises:
-        ValueError: If matrix is not square, vector size mismatch,
-                    or zero pivot (division by zero).
-    """
-    n = len(A)
-    if any(len(row) != n for row in A):
-        raise ValueError("Matrix A must be square.")
-    if len(b) != n:
-        raise ValueError("Vector b length must match matrix A size.")
-
-    # Deep copy to avoid modifying input directly
-    A = [row[:] for row in A]
-    b = b[:]
-
-    for i in range(n):
-        if A[i][i] == 0:
-            raise ValueError(f"Zero pivot encountered at row {i}. Try row swapping (pivoting).")
-
-        for j in range(i + 1, n):
-            factor = A[j][i] / A[i][i]
-            for k in range(i, n):
-                A[j][k] -= factor * A[i][k]
-            b[j] -= factor * b[i]
-
-    return A, b
-
-def back_substitution(U, y):
-    """
-    Performs back-substitution to solve Ux = y,
-    where U is upper-triangular.
-
-    Parameters:
-        U (list of list of float): Upper-triangular matrix (n x n).
-        y (list of float): Updated RHS vector from forward elimination.
-
-    Returns:
-        list of float: Solution vector x.
-
-    Raises:
-        ValueError: If zero diagonal element is found (division by zero).
-    """
-    n = len(U)
-    x = [0.0] * n
-
-    for i in range(n - 1, -1, -1):
-        if U[i][i] == 0:
-            raise ValueError(f"Zero diagonal element at row {i}, cannot divide.")
-
-        sum_ = sum(U[i][j] * x[j] for j in range(i + 1, n))
-        x[i] = (y[i] - sum_) / U[i][i]
-
-    return x
-
-def gaussian_elimination(A, b):
-    """
-    Solves the system Ax = b using Gaussian Elimination (no pivoting).
-
-    Parameters:
-        A (list of list of float): Coefficient matrix.
-        b (list of float): Right-hand side vector.
-
-    Returns:
-        list of float: Solution vector x.
-    """
-    U, y = forward_elimination(A, b)
-    return back_substitution(U, y)
-
-def plot_solution(x):
-    """
-    Plots the solution vector x as a bar chart.
-
-    Parameters:
-        x (list of float): Solution vector to be plotted.
-    """
-    indices = list(range(len(x)))
-    plt.bar(indices, x)
-    plt.xlabel("Variable Index")
-    plt.ylabel("Value")
-    plt.title("Solution Vector x")
-    plt.grid(True)
-    plt.tight_layout()
-    plt.show()
+from method_result import MethodResult
+from instrumentation import profiled
+# The direct solver and its plot are shared with forward_elimination, which works on float64 arrays.
+from forward_elimination import forward_elimination, back_substitution, gaussian_elimination, plot_solution
 
 def get_matrix_input():
     """
@@ -123,6 +33,7 @@ def get_matrix_input():
 
     return A, b
 
+@profiled("trapezoid")
 def trapezoid_rule(f, a, b, n):
     """
     Approximates the definite integral of a function f over [a, b]
@@ -135,7 +46,7 @@ def trapezoid_rule(f, a, b, n):
         n (int): Number of subintervals (must be >= 1).
 
     Returns:
-        float: Approximation of the integral of f from a to b.
+        MethodResult: value is the approximation of the integral of f from a to b.
 
     Raises:
         ValueError: If n < 1 or a >= b.
@@ -145,12 +56,13 @@ def trapezoid_rule(f, a, b, n):
     if a >= b:
         raise ValueError("Lower limit a must be less than upper limit b.")
 
+    start = time.perf_counter()
     h = (b - a) / n
     total = 0.5 * (f(a) + f(b))  # Endpoints are halved
     for i in range(1, n):
         total += f(a + i * h)
 
-    return h * total
+    return MethodResult("trapezoid", h * total, True, n, n + 1, time.perf_counter() - start)
 
 
 """
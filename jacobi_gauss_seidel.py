@@ -1,4 +1,19 @@
-import matplotlib.pyplot as plt
+import time
+import numpy as np
+
+from method_result import MethodResult
+from instrumentation import profiled
+from array_model import as_matrix, as_vector, layout_of, restore_layout
+from plot_sink import render
+
+def dominance_margins(matrix):
+    """
+    Returns |a_ii| - sum_{j != i} |a_ij| for every row, computed with NumPy.
+    A row is diagonally dominant when its margin is non-negative.
+    """
+    A = as_matrix(matrix)
+    diagonal = np.abs(A.diagonal())
+    return 2 * diagonal - np.sum(np.abs(A), axis=1)
 
 def is_diagonally_dominant(matrix):
     """
@@ -6,13 +21,7 @@ def is_diagonally_dominant(matrix):
     A matrix is diagonally dominant if the absolute value of each diagonal element
     is greater than or equal to the sum of the absolute values of the other elements in the row.
     """
-    n = len(matrix)
-    for i in range(n):
-        diagonal = abs(matrix[i][i])
-        off_diagonal_sum = sum(abs(matrix[i][j]) for j in range(n) if j != i)
-        if diagonal < off_diagonal_sum:
-            return False
-    return True
+    return bool(np.all(dominance_margins(matrix) >= 0))
 
 def rearrange_to_diagonally_dominant(A, b):
     """
@@ -42,84 +51,131 @@ def rearrange_to_diagonally_dominant(A, b):
 
 def vector_difference_norm(vec1, vec2):
     """
-    Returns the maximum absolute difference between two vectors.
+    Returns the maximum absolute difference between two vectors (flat, column lists or arrays).
     This is used to check for convergence in iterative methods.
     """
-    return max(abs(vec1[i][0] - vec2[i][0]) for i in range(len(vec1)))
+    return float(np.max(np.abs(as_vector(vec1) - as_vector(vec2))))
 
 def print_vector(vec):
     """
     Returns a string representation of a vector with 6 decimal places.
     """
-    return "[" + ", ".join(f"{v[0]:.6f}" for v in vec) + "]"
+    return "[" + ", ".join(f"{v:.6f}" for v in as_vector(vec)) + "]"
+
+def draw_errors(ax, errors, title):
+    ax.plot(range(1, len(errors) + 1), errors, marker='o')
+    ax.set_title(title)
+    ax.set_xlabel("Iteration")
+    ax.set_ylabel("Error (Max Norm)")
+    ax.grid(True)
+
+def initial_guess(x0, n):
+    """
+    Returns a float64 copy of the starting vector x0 (flat, column list or array), or zeros if x0 is None.
+
+    Raises:
+        ValueError: If x0 does not have n entries.
+    """
+    if x0 is None:
+        return np.zeros(n)
+    x = np.array(as_vector(x0), dtype=float)
+    if x.shape != (n,):
+        raise ValueError(f"Initial guess x0 must have {n} entries.")
+    return x
 
 def plot_errors(errors, title):
     """
-    Plots the convergence error over iterations.
+    Plots the convergence error over iterations (to a file when a PlotSink is active).
     """
-    plt.figure()
-    plt.plot(range(1, len(errors) + 1), errors, marker='o')
-    plt.title(title)
-    plt.xlabel("Iteration")
-    plt.ylabel("Error (Max Norm)")
-    plt.grid(True)
-    plt.tight_layout()
-    plt.show()
+    render(title, draw_errors, errors, title)
 
-def jacobi_method(A, b, tol=1e-5, max_iterations=100):
+@profiled("jacobi", callables=())
+def jacobi_method(A, b, tol=1e-5, max_iterations=100, x0=None):
     """
     Solves the system Ax = b using the Jacobi iterative method.
+    A and b may be lists or arrays, and b may be flat or a column; the work is done on
+    float64 arrays, one matrix-vector product per sweep.
+    x0 is the starting vector (default zeros); a previous solution of a similar system
+    (a warm start) can save most of the iterations.
+    Returns a MethodResult; value is the last iterate in the same layout as b, evaluations counts sweeps.
+    Raises ValueError if a diagonal element is zero.
     """
-    n = len(A)
-    x = [[0.0] for _ in range(n)]
+    start = time.perf_counter()
+    b_layout = layout_of(b)
+    A = as_matrix(A)
+    b = as_vector(b)
+    diagonal = A.diagonal()
+    if np.any(diagonal == 0):
+        raise ValueError("Zero diagonal element: the Jacobi iteration is undefined.")
+    x = initial_guess(x0, len(b))
     errors = []
 
     print("Jacobi Method:\n")
     for iteration in range(1, max_iterations + 1):
-        x_new = [[0.0] for _ in range(n)]
-        for i in range(n):
-            sum_ax = sum(A[i][j] * x[j][0] for j in range(n) if j != i)
-            x_new[i][0] = (b[i][0] - sum_ax) / A[i][i]
+        x_new = (b - A @ x + diagonal * x) / diagonal
         err = vector_difference_norm(x_new, x)
         errors.append(err)
         print(f"Iteration {iteration}: {print_vector(x_new)}")
         if err < tol:
             print(f"\nConverged in {iteration} iterations.")
+            elapsed = time.perf_counter() - start
             plot_errors(errors, "Jacobi Method Error per Iteration")
-            return x_new, True, iteration
+            return MethodResult("jacobi", restore_layout(x_new, b_layout), True, iteration, iteration,
+                                elapsed, err, details={"errors": errors})
         x = x_new
 
     print("The system did not converge within the maximum number of iterations.")
+    elapsed = time.perf_counter() - start
     plot_errors(errors, "Jacobi Method Error per Iteration")
-    return None, False, max_iterations
+    return MethodResult("jacobi", restore_layout(x, b_layout), False, max_iterations, max_iterations, elapsed,
+                        errors[-1] if errors else None,
+                        "The system did not converge within the maximum number of iterations.",
+                        {"errors": errors})
 
-def gauss_seidel_method(A, b, tol=1e-5, max_iterations=100):
+@profiled("gauss_seidel", callables=())
+def gauss_seidel_method(A, b, tol=1e-5, max_iterations=100, x0=None):
     """
     Solves the system Ax = b using the Gauss-Seidel iterative method.
+    A and b may be lists or arrays, and b may be flat or a column; each row update is a
+    single dot product on float64 arrays, with x updated in place.
+    x0 is the starting vector (default zeros), as in jacobi_method.
+    Returns a MethodResult; value is the last iterate in the same layout as b, evaluations counts sweeps.
+    Raises ValueError if a diagonal element is zero.
     """
-    n = len(A)
-    x = [[0.0] for _ in range(n)]
+    start = time.perf_counter()
+    b_layout = layout_of(b)
+    A = as_matrix(A)
+    b = as_vector(b)
+    n = len(b)
+    diagonal = A.diagonal()
+    if np.any(diagonal == 0):
+        raise ValueError("Zero diagonal element: the Gauss-Seidel iteration is undefined.")
+    x = initial_guess(x0, n)
     errors = []
 
     print("Gauss-Seidel Method:\n")
     for iteration in range(1, max_iterations + 1):
-        x_new = [row[:] for row in x]
+        x_old = x.copy()
         for i in range(n):
-            sum1 = sum(A[i][j] * x_new[j][0] for j in range(i))
-            sum2 = sum(A[i][j] * x[j][0] for j in range(i + 1, n))
-            x_new[i][0] = (b[i][0] - sum1 - sum2) / A[i][i]
-        err = vector_difference_norm(x_new, x)
+            # x holds the new values for j < i and the old ones for j >= i.
+            x[i] += (b[i] - A[i] @ x) / diagonal[i]
+        err = vector_difference_norm(x, x_old)
         errors.append(err)
-        print(f"Iteration {iteration}: {print_vector(x_new)}")
+        print(f"Iteration {iteration}: {print_vector(x)}")
         if err < tol:
             print(f"\nConverged in {iteration} iterations.")
+            elapsed = time.perf_counter() - start
             plot_errors(errors, "Gauss-Seidel Method Error per Iteration")
-            return x_new, True, iteration
-        x = x_new
+            return MethodResult("gauss_seidel", restore_layout(x, b_layout), True, iteration, iteration,
+                                elapsed, err, details={"errors": errors})
 
     print("The system did not converge within the maximum number of iterations.")
+    elapsed = time.perf_counter() - start
     plot_errors(errors, "Gauss-Seidel Method Error per Iteration")
-    return None, False, max_iterations
+    return MethodResult("gauss_seidel", restore_layout(x, b_layout), False, max_iterations, max_iterations,
+                        elapsed, errors[-1] if errors else None,
+                        "The system did not converge within the maximum number of iterations.",
+                        {"errors": errors})
 
 """
 # --- Main program ---
@@ -165,10 +221,10 @@ if __name__ == "__main__":
         choice = input("Enter your choice (1, 2, or 3): ").strip()
 
         if choice == '1':
-            result, converged, iterations = jacobi_method(A, b)
+            result = jacobi_method(A, b)
             method_name = "Jacobi"
         elif choice == '2':
-            result, converged, iterations = gauss_seidel_method(A, b)
+            result = gauss_seidel_method(A, b)
             method_name = "Gauss-Seidel"
         elif choice == '3':
             print("Exiting the program. Goodbye!")
@@ -177,11 +233,11 @@ if __name__ == "__main__":
             print("Invalid input! Please enter 1, 2, or 3.\n")
             continue
 
-        if result is not None:
+        if result.converged:
             if not has_diagonal_dominance:
-                print(f"\nAlthough the matrix is not diagonally dominant, the {method_name} method converged.\nSolution: {print_vector(result)}\n")
+                print(f"\nAlthough the matrix is not diagonally dominant, the {method_name} method converged.\nSolution: {print_vector(result.value)}\n")
             else:
-                print(f"\n{method_name} method solution: {print_vector(result)}\n")
+                print(f"\n{method_name} method solution: {print_vector(result.value)}\n")
         else:
             if not has_diagonal_dominance:
                 print(f"\nThe system did NOT converge using the {method_name} method, and the matrix is not diagonally dominant.\n")
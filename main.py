@@ -1,25 +1,22 @@
 import numpy as np
 import matplotlib.pyplot as plt
 from sympy import symbols, lambdify, sympify, SympifyError
-import re
+import math
 
 from EquationRoots import bisection_method, newton_method, secant_method
 from Lagrange_and_Neville_Polynomial_Interpolation import lagrange_interpolation, neville_interpolation
 from jacobi_gauss_seidel import jacobi_method, gauss_seidel_method
-from Simpson_Rule import simpson as simpson_rule
 from Romberg_Integration import romberg_main as romberg_integration
 from Cubic_Spline_Interpolation import cubic_spline_main as cubic_spline
-from interpolation_methods import trapezoid_rule
 from matrix_vector_mult import residual_norm_max, plot_residual
-
-def is_valid_function_input(expr_str):
-    allowed_chars = r"^[\d\w\s\+\-\*\/\^\(\)\.\,\:]+$"
-    hebrew_letters = re.compile("[\u0590-\u05FF]")
-    if not re.match(allowed_chars, expr_str.replace("**", "^")):
-        return False, "Expression contains invalid characters."
-    if hebrew_letters.search(expr_str):
-        return False, "Expression contains Hebrew letters, which are not allowed."
-    return True, ""
+from vectorized_integration import simpson_vectorized, trapezoid_vectorized
+from chebyshev_approximation import chebyshev_surrogate, chebyshev_integral
+from evaluation_cache import memoize
+from matrix_io import load_system, parse_vector
+from forward_elimination import gaussian_elimination
+from convergence_diagnostics import diagnose, print_diagnostics
+from plot_sampling import sample_curve
+from expression_parser import is_valid_function_input
 
 def get_function_from_user():
     x = symbols('x')
@@ -66,10 +63,25 @@ def get_vector_input(n):
     print(f"Enter a vector of size {n}:")
     return [get_float(f"b[{i}] = ") for i in range(n)]
 
+def get_system_input():
+    path = input("Load A and b from a file (.npy, .npz, .csv, .txt, .mtx; leave blank to type them in): ").strip()
+    if path:
+        A, b = load_system(path)
+        print(f"Loaded a {len(b)}x{len(b)} system from {path}.")
+        return A, b
+    n = get_int("Matrix size: ")
+    return get_matrix_input(n), get_vector_input(n)
+
+def print_result(result, label):
+    if result.value is None:
+        print(f"{label}: no result. {result.message}")
+        return
+    print(f"{label}: {result.value}")
+    print(f"({result.iterations} iterations, {result.evaluations} evaluations, {result.elapsed * 1000:.3f} ms)")
+
 def plot_function(f, title="Function Plot", a=-10, b=10):
     try:
-        x_vals = np.linspace(a, b, 400)
-        y_vals = f(x_vals)
+        x_vals, y_vals = sample_curve(f, a, b)
         plt.figure()
         plt.plot(x_vals, y_vals, label='f(x)')
         plt.title(title)
@@ -95,6 +107,7 @@ def main_menu():
     print("10. Simpson Rule")
     print("11. Trapezoid Rule")
     print("12. Residual Vector Analysis (r = b - Ax)")
+    print("13. Chebyshev Approximation")
     print("0. Exit")
 
 def main():
@@ -105,6 +118,7 @@ def main():
         try:
             if choice == "1":
                 f, f_str = get_function_from_user()
+                f = memoize(f)  # The sign-change pre-check and the bisection share f(a), f(b).
                 a = get_float("Enter left endpoint (a): ")
                 b = get_float("Enter right endpoint (b): ")
                 tol = get_float("Enter tolerance: ")
@@ -112,15 +126,16 @@ def main():
                     print("Bisection method requires a sign change over the interval.")
                     continue
                 result = bisection_method(f, a, b, tol)
-                print(f"Root found: {result}")
+                print_result(result, "Root found")
                 plot_function(f, f"Bisection Method: f(x) = {f_str}", a=a, b=b)
 
             elif choice == "2":
                 f, f_str = get_function_from_user()
                 x0 = get_float("Enter initial guess: ")
                 tol = get_float("Enter tolerance: ")
-                result = newton_method(f, x0, tol)
-                print(f"Root found: {result}")
+                df = lambdify(symbols('x'), sympify(f_str).diff(symbols('x')), "numpy")
+                result = newton_method(f, df, x0, tol)
+                print_result(result, "Root found")
                 plot_function(f, f"Newton-Raphson: f(x) = {f_str}", a=x0 - 5, b=x0 + 5)
 
             elif choice == "3":
@@ -129,7 +144,7 @@ def main():
                 x1 = get_float("Enter second guess: ")
                 tol = get_float("Enter tolerance: ")
                 result = secant_method(f, x0, x1, tol)
-                print(f"Root found: {result}")
+                print_result(result, "Root found")
                 plot_function(f, f"Secant Method: f(x) = {f_str}", a=min(x0, x1) - 5, b=max(x0, x1) + 5)
 
             elif choice == "4":
@@ -159,15 +174,23 @@ def main():
                 print(f"Estimated value at x = {x_interp}: {result}")
 
             elif choice == "7":
-                n = get_int("Matrix size: ")
-                A = get_matrix_input(n)
-                b = get_vector_input(n)
+                A, b = get_system_input()
+                diagnostics = diagnose(A, b, methods=("jacobi",))
+                print_diagnostics(diagnostics)
+                if math.isinf(diagnostics["predicted_iterations"]["jacobi"]):
+                    print("Skipping the iteration; solving directly with Gaussian elimination instead.")
+                    print(f"Solution: {gaussian_elimination(A, b)}")
+                    continue
                 jacobi_method(A, b)
 
             elif choice == "8":
-                n = get_int("Matrix size: ")
-                A = get_matrix_input(n)
-                b = get_vector_input(n)
+                A, b = get_system_input()
+                diagnostics = diagnose(A, b, methods=("gauss_seidel",))
+                print_diagnostics(diagnostics)
+                if math.isinf(diagnostics["predicted_iterations"]["gauss_seidel"]):
+                    print("Skipping the iteration; solving directly with Gaussian elimination instead.")
+                    print(f"Solution: {gaussian_elimination(A, b)}")
+                    continue
                 gauss_seidel_method(A, b)
 
             elif choice == "9":
@@ -182,8 +205,8 @@ def main():
                 a = get_float("Start of interval (a): ")
                 b = get_float("End of interval (b): ")
                 n = get_int("Number of subintervals (even): ")
-                result = simpson_rule(f, a, b, n)
-                print(f"Integration result: {result}")
+                result = simpson_vectorized(f, a, b, n)
+                print_result(result, "Integration result")
                 plot_function(f, f"Simpson Rule: f(x) = {f_str}", a=a, b=b)
 
             elif choice == "11":
@@ -191,31 +214,34 @@ def main():
                 a = get_float("Start of interval (a): ")
                 b = get_float("End of interval (b): ")
                 n = get_int("Number of subintervals: ")
-                result = trapezoid_rule(f, a, b, n)
-                print(f"Integration result: {result}")
+                result = trapezoid_vectorized(f, a, b, n)
+                print_result(result, "Integration result")
                 plot_function(f, f"Trapezoid Rule: f(x) = {f_str}", a=a, b=b)
 
             elif choice == "12":
                 try:
-                    n = int(input("Enter the number of variables (n): "))
-
-                    print("\nEnter matrix A row by row (each row should have n space-separated numbers):")
-                    A = []
-                    for i in range(n):
-                        row = input(f"Row {i + 1}: ").strip().split()
-                        if len(row) != n:
-                            raise ValueError(f"Each row must have exactly {n} numbers.")
-                        A.append([float(val) for val in row])
-
-                    b_input = input("\nEnter vector b (space-separated): ").strip().split()
-                    if len(b_input) != n:
-                        raise ValueError("Vector b must have n elements.")
-                    b = [float(val) for val in b_input]
-
-                    x_input = input("\nEnter approximate solution vector x (space-separated): ").strip().split()
-                    if len(x_input) != n:
+                    path = input("Load A and b from a file (leave blank to type them in): ").strip()
+                    if path:
+                        A, b = load_system(path)
+                        n = len(b)
+                    else:
+                        n = int(input("Enter the number of variables (n): "))
+
+                        print("\nEnter matrix A row by row (each row should have n space-separated numbers):")
+                        A = np.empty((n, n))
+                        for i in range(n):
+                            row = parse_vector(input(f"Row {i + 1}: "))
+                            if len(row) != n:
+                                raise ValueError(f"Each row must have exactly {n} numbers.")
+                            A[i] = row
+
+                        b = parse_vector(input("\nEnter vector b (space-separated): "))
+                        if len(b) != n:
+                            raise ValueError("Vector b must have n elements.")
+
+                    x_approx = parse_vector(input("\nEnter approximate solution vector x (space-separated): "))
+                    if len(x_approx) != n:
                         raise ValueError("Vector x must have n elements.")
-                    x_approx = [float(val) for val in x_input]
 
                     residual_vector, error = residual_norm_max(A, x_approx, b)
 
@@ -227,6 +253,16 @@ def main():
                 except Exception as e:
                     print("Error:", str(e))
 
+            elif choice == "13":
+                f, f_str = get_function_from_user()
+                a = get_float("Start of interval (a): ")
+                b = get_float("End of interval (b): ")
+                tol = get_float("Enter tolerance: ")
+                surrogate, coeffs = chebyshev_surrogate(f, a, b, tol)
+                print(f"Chebyshev degree: {len(coeffs) - 1}")
+                print(f"Integral over [a, b]: {chebyshev_integral(coeffs, a, b)}")
+                plot_function(surrogate, f"Chebyshev Approximation: f(x) = {f_str}", a=a, b=b)
+
             elif choice == "0":
                 print("Goodbye!")
                 break
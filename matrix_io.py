@@ -0,0 +1,164 @@
+import os
+import numpy as np
+
+def parse_vector(text):
+    """
+    Parses one line of space- or comma-separated numbers into a float64 array.
+
+    Raises:
+        ValueError: If a token is not a number.
+    """
+    return np.array(text.replace(",", " ").split(), dtype=float)
+
+def load_text(path):
+    """
+    Loads a dense matrix from a CSV or whitespace-separated text file with NumPy's C parser.
+    Lines starting with '#' are ignored; a one-column or one-row file gives a 1-D vector.
+
+    Parameters:
+        path (str): Path to a .csv, .txt or .dat file.
+
+    Returns:
+        numpy.ndarray: float64 array.
+    """
+    with open(path, encoding="utf-8") as handle:
+        first = next((line for line in handle if line.strip() and not line.lstrip().startswith("#")), "")
+    delimiter = "," if "," in first else None
+    data = np.loadtxt(path, delimiter=delimiter, comments="#", ndmin=2, dtype=float)
+    if 1 in data.shape:
+        return data.ravel()
+    return data
+
+def load_matrix_market(path, dense=True):
+    """
+    Loads a Matrix Market (.mtx) file in coordinate or array format.
+    Coordinate entries are read in a single loadtxt call and scattered with NumPy;
+    'symmetric' and 'skew-symmetric' files are expanded to the full matrix.
+
+    Parameters:
+        path (str): Path to the .mtx file.
+        dense (bool): Return a dense array. With dense=False, coordinate files are
+                      returned as (rows, cols, values, shape) with 0-based indices.
+
+    Returns:
+        numpy.ndarray or tuple: The matrix.
+
+    Raises:
+        ValueError: If the header is missing or the field type is complex.
+    """
+    with open(path, encoding="utf-8") as handle:
+        header = handle.readline().lower().split()
+        if len(header) < 5 or header[0] != "%%matrixmarket" or header[1] != "matrix":
+            raise ValueError("Not a Matrix Market matrix file.")
+        layout, field, symmetry = header[2], header[3], header[4]
+        if field == "complex":
+            raise ValueError("Complex Matrix Market files are not supported.")
+        line = handle.readline()
+        skipped = 2
+        while line.startswith("%") or not line.strip():
+            line = handle.readline()
+            skipped += 1
+        sizes = [int(v) for v in line.split()]
+
+    body = np.loadtxt(path, skiprows=skipped, comments="%", ndmin=2, dtype=float)
+    shape = (sizes[0], sizes[1])
+
+    if layout == "array":
+        values = body.ravel()
+        if symmetry == "general":
+            return values.reshape(shape[1], shape[0]).T.copy()  # Column-major on disk.
+        matrix = np.zeros(shape)
+        rows, cols = np.tril_indices(shape[0], 0 if symmetry == "symmetric" else -1)
+        order = np.lexsort((rows, cols))
+        matrix[rows[order], cols[order]] = values
+        sign = -1.0 if symmetry == "skew-symmetric" else 1.0
+        lower = np.tril_indices(shape[0], -1)
+        matrix[lower[1], lower[0]] = sign * matrix[lower]
+        return matrix
+
+    rows = body[:, 0].astype(np.int64) - 1
+    cols = body[:, 1].astype(np.int64) - 1
+    values = body[:, 2] if field != "pattern" else np.ones(len(rows))
+    if symmetry in ("symmetric", "skew-symmetric", "hermitian"):
+        off = rows != cols
+        sign = -1.0 if symmetry == "skew-symmetric" else 1.0
+        rows, cols, values = (np.concatenate([rows, cols[off]]), np.concatenate([cols, rows[off]]),
+                              np.concatenate([values, sign * values[off]]))
+    if not dense:
+        return rows, cols, values, shape
+    matrix = np.zeros(shape)
+    np.add.at(matrix, (rows, cols), values)
+    return matrix
+
+def load_matrix(path, mmap=True, key=None):
+    """
+    Loads a matrix or vector from a file, choosing the reader by extension:
+    .npy (memory-mapped read-only by default, so nothing is read until used),
+    .npz (the array named `key`, or the only/first array), .mtx (Matrix Market),
+    anything else as CSV/whitespace text.
+
+    Parameters:
+        path (str): The file to load.
+        mmap (bool): Memory-map .npy files instead of reading them into memory.
+        key (str): Array name inside an .npz archive.
+
+    Returns:
+        numpy.ndarray: The loaded float64 array (a read-only memmap for .npy with mmap=True).
+
+    Raises:
+        ValueError: If the file does not exist or `key` is not in the archive.
+    """
+    if not os.path.exists(path):
+        raise ValueError(f"File '{path}' does not exist.")
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".npy":
+        data = np.load(path, mmap_mode="r" if mmap else None)
+        return data if data.dtype == np.float64 else data.astype(np.float64)
+    if extension == ".npz":
+        with np.load(path) as archive:
+            names = archive.files
+            if key is None:
+                key = names[0]
+            if key not in names:
+                raise ValueError(f"Array '{key}' not found in {path} (available: {', '.join(names)}).")
+            return np.asarray(archive[key], dtype=np.float64)
+    if extension == ".mtx":
+        return load_matrix_market(path)
+    return load_text(path)
+
+def load_system(path, b_path=None):
+    """
+    Loads a linear system Ax = b.
+
+    Parameters:
+        path (str): An .npz archive with arrays 'A' and 'b', or a matrix file. Without
+                    b_path, a matrix file must hold the augmented matrix [A | b].
+        b_path (str): Optional separate file for the right-hand side.
+
+    Returns:
+        tuple: (A, b) as float64 arrays; A is n x n and b has length n. Both are views
+        of the loaded data, not copies.
+
+    Raises:
+        ValueError: If the shapes do not form a square system.
+    """
+    if os.path.splitext(path)[1].lower() == ".npz" and b_path is None:
+        with np.load(path) as archive:
+            if "A" not in archive.files or "b" not in archive.files:
+                raise ValueError("The .npz archive must contain arrays named 'A' and 'b'.")
+            A = np.asarray(archive["A"], dtype=np.float64)
+            b = np.asarray(archive["b"], dtype=np.float64).ravel()
+    elif b_path is not None:
+        A = load_matrix(path)
+        b = load_matrix(b_path).ravel()
+    else:
+        augmented = load_matrix(path)
+        if augmented.ndim != 2 or augmented.shape[1] != augmented.shape[0] + 1:
+            raise ValueError("Expected an augmented n x (n + 1) matrix [A | b].")
+        A, b = augmented[:, :-1], augmented[:, -1]
+
+    if A.ndim != 2 or A.shape[0] != A.shape[1]:
+        raise ValueError("Matrix A must be square.")
+    if len(b) != A.shape[0]:
+        raise ValueError("Vector b length must match matrix A size.")
+    return A, b
@@ -1,68 +1,80 @@
-import matplotlib
-matplotlib.use('TkAgg')
-import matplotlib.pyplot as plt
+import numpy as np
+
+from array_model import as_matrix, as_vector, layout_of, restore_layout
+from plot_sink import render, use_interactive_backend
+
+use_interactive_backend()
 
 def matrix_vector_mult(matrix, vector):
     """
     Multiplies a matrix by a vector.
 
     Parameters:
-        matrix (list of list of float): The coefficient matrix.
-        vector (list of float): The vector to multiply.
+        matrix (list of list of float or numpy.ndarray): The coefficient matrix.
+        vector (list of float or numpy.ndarray): The vector to multiply.
 
     Returns:
-        list of float: The resulting vector from Ax.
+        list of float or numpy.ndarray: The resulting vector from Ax, in the same layout as vector.
     """
-    result = []
-    for row in matrix:
-        if len(row) != len(vector):
-            raise ValueError("Matrix row and vector length mismatch.")
-        value = sum(row[i] * vector[i] for i in range(len(vector)))
-        result.append(value)
-    return result
+    layout = layout_of(vector)
+    matrix = as_matrix(matrix)
+    vector = as_vector(vector)
+    if matrix.shape[1] != len(vector):
+        raise ValueError("Matrix row and vector length mismatch.")
+    return restore_layout(matrix @ vector, layout)
 
 def vector_subtract(v1, v2):
     """
     Subtracts one vector from another.
 
     Parameters:
-        v1 (list of float): First vector.
-        v2 (list of float): Second vector.
+        v1 (list of float or numpy.ndarray): First vector.
+        v2 (list of float or numpy.ndarray): Second vector.
 
     Returns:
-        list of float: The result of v1 - v2.
+        list of float or numpy.ndarray: The result of v1 - v2, in the same layout as v1.
     """
+    layout = layout_of(v1)
+    v1 = as_vector(v1)
+    v2 = as_vector(v2)
     if len(v1) != len(v2):
         raise ValueError("Vector length mismatch.")
-    return [v1[i] - v2[i] for i in range(len(v1))]
+    return restore_layout(v1 - v2, layout)
 
 def max_norm(vector):
     """
     Computes the maximum norm (infinity norm) of a vector.
 
     Parameters:
-        vector (list of float): Input vector.
+        vector (list of float or numpy.ndarray): Input vector.
 
     Returns:
         float: The maximum absolute value in the vector.
     """
-    return max(abs(v) for v in vector)
+    return float(np.max(np.abs(as_vector(vector))))
 
 def residual_norm_max(A, x, b):
     """
     Computes the residual vector and its max norm.
 
     Parameters:
-        A (list of list of float): Coefficient matrix.
-        x (list of float): Approximate solution vector.
-        b (list of float): Right-hand side vector.
+        A (list of list of float or numpy.ndarray): Coefficient matrix.
+        x (list of float or numpy.ndarray): Approximate solution vector.
+        b (list of float or numpy.ndarray): Right-hand side vector.
 
     Returns:
-        tuple: Residual vector and its infinity norm.
+        tuple: Residual vector (same layout as b) and its infinity norm.
     """
-    Ax = matrix_vector_mult(A, x)
-    r = vector_subtract(b, Ax)
-    return r, max_norm(r)
+    layout = layout_of(b)
+    A = as_matrix(A)
+    x = as_vector(x)
+    b = as_vector(b)
+    if A.shape[1] != len(x):
+        raise ValueError("Matrix row and vector length mismatch.")
+    if len(b) != len(A):
+        raise ValueError("Vector length mismatch.")
+    r = b - A @ x
+    return restore_layout(r, layout), max_norm(r)
 
 def plot_residual(r):
     """
@@ -71,20 +83,20 @@ def plot_residual(r):
     Parameters:
         r (list of float): Residual vector.
     """
+    render("residual", draw_residual, list(as_vector(r)))
+
+def draw_residual(ax, r):
     indices = list(range(len(r)))
-    bars = plt.bar(indices, r, color='skyblue', edgecolor='black')
-    plt.xlabel("Index")
-    plt.ylabel("Residual Value")
-    plt.title("Residual Vector r = b - Ax")
-    plt.grid(True, axis='y', linestyle='--', alpha=0.7)
+    bars = ax.bar(indices, r, color='skyblue', edgecolor='black')
+    ax.set_xlabel("Index")
+    ax.set_ylabel("Residual Value")
+    ax.set_title("Residual Vector r = b - Ax")
+    ax.grid(True, axis='y', linestyle='--', alpha=0.7)
 
     for i, bar in enumerate(bars):
         height = bar.get_height()
-        plt.text(bar.get_x() + bar.get_width()/2.0, height,
-                 f'{height:.2f}', ha='center', va='bottom', fontsize=9)
-
-    plt.tight_layout()
-    plt.show()
+        ax.text(bar.get_x() + bar.get_width()/2.0, height,
+                f'{height:.2f}', ha='center', va='bottom', fontsize=9)
 
 def main():
     """
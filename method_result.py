@@ -0,0 +1,39 @@
+class MethodResult:
+    """
+    Common result of every numerical method in the project.
+
+    Attributes:
+        value: The computed root, integral or solution vector (None on failure).
+        converged (bool): Whether the method met its stopping criterion.
+        iterations (int): Iterations, levels or refinements performed.
+        evaluations (int): Number of calls to the user function (or matrix sweeps).
+        elapsed (float): Wall time in seconds.
+        error_estimate (float): The method's own estimate of the error, if it has one.
+        message (str): Why the method stopped, mainly for failures.
+        details (dict): Method-specific data, e.g. the Romberg table or per-iteration errors.
+    """
+    __slots__ = ("method", "value", "converged", "iterations", "evaluations",
+                 "elapsed", "error_estimate", "message", "details")
+
+    def __init__(self, method, value=None, converged=True, iterations=0, evaluations=0,
+                 elapsed=0.0, error_estimate=None, message="", details=None):
+        self.method = method
+        self.value = value
+        self.converged = converged
+        self.iterations = iterations
+        self.evaluations = evaluations
+        self.elapsed = elapsed
+        self.error_estimate = error_estimate
+        self.message = message
+        self.details = details if details is not None else {}
+
+    def as_dict(self):
+        """
+        Returns the result as a plain dict (e.g. for JSON logging or monitoring).
+        """
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self):
+        return (f"MethodResult(method={self.method!r}, value={self.value!r}, converged={self.converged}, "
+                f"iterations={self.iterations}, evaluations={self.evaluations}, "
+                f"elapsed={self.elapsed:.3e}, error_estimate={self.error_estimate!r})")
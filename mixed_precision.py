@@ -0,0 +1,186 @@
+import time
+import numpy as np
+
+from method_result import MethodResult
+from instrumentation import profiled
+from array_model import as_matrix, as_vector, layout_of, restore_layout
+from matrix_vector_mult import residual_norm_max
+
+def lu_factor(A, dtype=np.float32):
+    """
+    LU factorization with partial pivoting, PA = LU, computed in the given precision.
+    L (unit diagonal, below) and U (on and above the diagonal) are stored together in one
+    array, and each elimination step is a single rank-1 NumPy update of the trailing block.
+
+    Parameters:
+        A (list of list of float or numpy.ndarray): Square coefficient matrix.
+        dtype: Working precision, np.float32 by default (half the memory and bandwidth of float64).
+
+    Returns:
+        tuple: (LU, pivots) where pivots[k] is the row swapped with row k at step k.
+
+    Raises:
+        ValueError: If A is not square or is singular in the working precision.
+    """
+    LU = np.array(as_matrix(A), dtype=dtype)
+    n = len(LU)
+    if LU.shape != (n, n):
+        raise ValueError("Matrix A must be square.")
+    pivots = np.zeros(n, dtype=np.int64)
+    for k in range(n):
+        p = k + int(np.argmax(np.abs(LU[k:, k])))
+        pivots[k] = p
+        if LU[p, k] == 0:
+            raise ValueError(f"Matrix is singular: no non-zero pivot in column {k}.")
+        if p != k:
+            LU[[k, p]] = LU[[p, k]]
+        LU[k + 1:, k] /= LU[k, k]
+        LU[k + 1:, k + 1:] -= np.outer(LU[k + 1:, k], LU[k, k + 1:])
+    return LU, pivots
+
+def lu_solve(LU, pivots, b):
+    """
+    Solves Ax = b from the factors of lu_factor with one forward and one back substitution,
+    in the precision of the factors.
+
+    Returns:
+        numpy.ndarray: The solution, with the dtype of LU.
+    """
+    x = np.array(b, dtype=LU.dtype)
+    n = len(x)
+    for k in range(n):
+        p = pivots[k]
+        if p != k:
+            x[k], x[p] = x[p], x[k]
+    for k in range(n - 1):
+        x[k + 1:] -= LU[k + 1:, k] * x[k]
+    for k in range(n - 1, -1, -1):
+        x[k] /= LU[k, k]
+        x[:k] -= LU[:k, k] * x[k]
+    return x
+
+def residual_target(A, b, x, tol=None):
+    """
+    Returns tol, or by default the infinity-norm residual a float64 direct solve achieves:
+    sqrt(n) * eps64 * (||A||inf * ||x||inf + ||b||inf).
+    """
+    if tol is not None:
+        return tol
+    n = len(A)
+    if n == 0:
+        return 0.0
+    eps = np.finfo(np.float64).eps
+    return np.sqrt(n) * eps * (np.max(np.sum(np.abs(A), axis=1)) * np.max(np.abs(x)) + np.max(np.abs(b)))
+
+def refine(A, b, LU, pivots, x, tol=None, max_iterations=10):
+    """
+    Iterative refinement of x: computes r = b - Ax in float64 with residual_norm_max and adds
+    the correction d from LU d = r. The factors may be low-precision factors of A, or factors of
+    a nearby matrix (e.g. the previous step of a time-stepping run); either way the result is
+    accurate to the float64 residual as long as the corrections contract.
+
+    Parameters:
+        A (numpy.ndarray): Coefficient matrix (float64).
+        b (numpy.ndarray): Right-hand side vector (float64).
+        LU, pivots: Factors from lu_factor.
+        x (numpy.ndarray): Starting solution, refined in place.
+        tol (float): Target for the infinity-norm residual (default: float64 accuracy,
+                     see residual_target).
+        max_iterations (int): Maximum number of residual evaluations.
+
+    Returns:
+        tuple: (x, residuals, converged), residuals holding the norm at every evaluation.
+        Refinement stops early, unconverged, once a step fails to halve the residual.
+    """
+    residuals = []
+    for _ in range(max_iterations):
+        r, norm = residual_norm_max(A, x, b)
+        residuals.append(norm)
+        if norm <= residual_target(A, b, x, tol):
+            return x, residuals, True
+        if len(residuals) >= 2 and norm > 0.5 * residuals[-2]:
+            break  # Not contracting: the factors are too inaccurate for this matrix.
+        x += lu_solve(LU, pivots, r)
+    return x, residuals, False
+
+@profiled("mixed_precision", callables=())
+def mixed_precision_solve(A, b, tol=None, max_iterations=10):
+    """
+    Solves Ax = b by iterative refinement: A is factored once in float32, residuals
+    r = b - Ax are computed in float64 with residual_norm_max, and each correction
+    solves Ad = r with the cheap float32 triangular factors.
+
+    Parameters:
+        A (list of list of float or numpy.ndarray): Coefficient matrix.
+        b (list of float or numpy.ndarray): Right-hand side vector.
+        tol (float): Target for the infinity-norm residual (default: float64 accuracy, see residual_target).
+        max_iterations (int): Maximum number of refinement steps.
+
+    Returns:
+        MethodResult: value is the solution in the layout of b; details["residuals"] holds the
+        residual norm after every step. If refinement stalls (A too ill-conditioned for float32),
+        the system is re-factored in float64 and details["fallback"] is True.
+    """
+    start = time.perf_counter()
+    b_layout = layout_of(b)
+    A = as_matrix(A)
+    b = as_vector(b)
+
+    LU, pivots = lu_factor(A, np.float32)
+    x = lu_solve(LU, pivots, b).astype(np.float64)
+    x, residuals, converged = refine(A, b, LU, pivots, x, tol, max_iterations)
+    fallback = not converged
+    if fallback:
+        LU, pivots = lu_factor(A, np.float64)
+        x = lu_solve(LU, pivots, b)
+        r, norm = residual_norm_max(A, x, b)
+        residuals.append(norm)
+        converged = norm <= residual_target(A, b, x, tol)
+
+    return MethodResult("mixed_precision", restore_layout(x, b_layout), converged, len(residuals),
+                        len(residuals), time.perf_counter() - start, residuals[-1],
+                        "" if not fallback else "Refinement stalled; solved with float64 factors instead.",
+                        {"residuals": residuals, "fallback": fallback, "factor_dtype": str(LU.dtype)})
+
+def compare_precision(A, b, repeat=3):
+    """
+    Times the float64 path (float64 LU factor and solve) against float32 factorization with
+    float64 refinement, and reports the memory of the factors and the final residuals.
+
+    Returns:
+        dict: Times in seconds (best of repeat), factor sizes in bytes, residual norms, and
+        the time and memory saving of the mixed-precision path as fractions.
+    """
+    A = as_matrix(A)
+    b = as_vector(b)
+
+    def best(run):
+        times = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            value = run()
+            times.append(time.perf_counter() - start)
+        return min(times), value
+
+    def float64_path():
+        LU, pivots = lu_factor(A, np.float64)
+        return lu_solve(LU, pivots, b)
+
+    time64, x64 = best(float64_path)
+    time_mixed, result = best(lambda: mixed_precision_solve(A, b))
+    bytes64 = A.size * np.dtype(np.float64).itemsize
+    bytes32 = A.size * np.dtype(np.float32).itemsize
+    return {"n": len(A), "time_float64": time64, "time_mixed": time_mixed,
+            "factor_bytes_float64": bytes64, "factor_bytes_float32": bytes32,
+            "residual_float64": residual_norm_max(A, x64, b)[1], "residual_mixed": result.error_estimate,
+            "refinement_steps": result.iterations, "fallback": result.details["fallback"],
+            "time_saving": 1 - time_mixed / time64, "memory_saving": 1 - bytes32 / bytes64}
+
+def print_precision_report(report):
+    print(f"[Mixed precision] n = {report['n']}, {report['refinement_steps']} residual evaluations"
+          + (" (fell back to float64)" if report["fallback"] else ""))
+    print(f"[Mixed precision] float64 path: {report['time_float64'] * 1e3:.2f} ms, "
+          f"factors {report['factor_bytes_float64'] / 2**20:.2f} MiB, residual {report['residual_float64']:.3e}")
+    print(f"[Mixed precision] float32 + refinement: {report['time_mixed'] * 1e3:.2f} ms, "
+          f"factors {report['factor_bytes_float32'] / 2**20:.2f} MiB, residual {report['residual_mixed']:.3e}")
+    print(f"[Mixed precision] Saved {report['time_saving']:.0%} time and {report['memory_saving']:.0%} factor memory.")
@@ -0,0 +1,156 @@
+import time
+import numpy as np
+
+from method_result import MethodResult
+from instrumentation import profiled
+from batch_integration import reference_rule
+
+def _sample_nd(f, coords):
+    """
+    Evaluates f(x1, ..., xd) on equally shaped coordinate arrays in one call,
+    falling back to a point-by-point loop for callables that reject arrays.
+    """
+    shape = coords[0].shape
+    try:
+        y = np.asarray(f(*coords), dtype=float)
+        if y.shape != shape:
+            y = np.broadcast_to(y, shape).copy()
+        return y
+    except (TypeError, ValueError):
+        flat = [c.ravel() for c in coords]
+        return np.array([f(*point) for point in zip(*flat)], dtype=float).reshape(shape)
+
+def _check_bounds(bounds):
+    bounds = np.asarray(bounds, dtype=float)
+    if bounds.ndim != 2 or bounds.shape[1] != 2 or len(bounds) == 0:
+        raise ValueError("Bounds must be a list of (lower, upper) pairs, one per dimension.")
+    if np.any(bounds[:, 0] >= bounds[:, 1]):
+        raise ValueError("Each lower limit must be less than its upper limit.")
+    return bounds
+
+@profiled("tensor_product")
+def tensor_product_integrate(f, bounds, n=10, rule="gauss"):
+    """
+    Integrates f(x1, ..., xd) over a box with a tensor product of 1-D rules.
+    The full node grid is built with meshgrid, f is evaluated on it in one call,
+    and the weights are contracted one axis at a time.
+
+    Parameters:
+        f (function): The integrand, taking one argument per dimension.
+        bounds (list of tuple): (lower, upper) for each dimension.
+        n (int or list of int): Rule size per dimension, see batch_integration.reference_rule.
+        rule (str): "gauss", "lobatto", "simpson" or "trapezoid".
+
+    Returns:
+        MethodResult: value is the approximation of the integral.
+
+    Raises:
+        ValueError: If the bounds are malformed or a rule size is invalid.
+    """
+    start = time.perf_counter()
+    bounds = _check_bounds(bounds)
+    d = len(bounds)
+    sizes = [n] * d if np.ndim(n) == 0 else list(n)
+    if len(sizes) != d:
+        raise ValueError("Provide one rule size per dimension.")
+
+    axes_nodes = []
+    axes_weights = []
+    for (lower, upper), size in zip(bounds, sizes):
+        nodes, weights = reference_rule(rule, size)
+        half = 0.5 * (upper - lower)
+        axes_nodes.append(0.5 * (lower + upper) + half * nodes)
+        axes_weights.append(half * weights)
+
+    Y = _sample_nd(f, np.meshgrid(*axes_nodes, indexing="ij"))
+    evaluations = Y.size
+    for weights in reversed(axes_weights):
+        Y = Y @ weights
+    return MethodResult("tensor_product", float(Y), True, 1, evaluations, time.perf_counter() - start)
+
+def _first_primes(count):
+    primes = []
+    candidate = 2
+    while len(primes) < count:
+        if all(candidate % p for p in primes if p * p <= candidate):
+            primes.append(candidate)
+        candidate += 1
+    return primes
+
+def halton_points(start, count, dimension):
+    """
+    Returns Halton points with indices start .. start + count - 1 as a (count x dimension) array.
+    Each coordinate is the radical inverse of the index in a different prime base.
+    """
+    points = np.zeros((count, dimension))
+    for axis, base in enumerate(_first_primes(dimension)):
+        index = np.arange(start, start + count, dtype=np.int64)
+        scale = 1.0 / base
+        while np.any(index > 0):
+            points[:, axis] += scale * (index % base)
+            index //= base
+            scale /= base
+    return points
+
+@profiled("quasi_monte_carlo")
+def quasi_monte_carlo(f, bounds, tol=1e-4, max_points=1000000, chunk_size=8192,
+                      replicates=8, seed=None, verbose=False):
+    """
+    Randomized quasi-Monte Carlo integration of f(x1, ..., xd) over a box, for d > 3.
+    Uses `replicates` independently shifted copies of the Halton sequence; their spread
+    gives the error estimate. Points are generated and evaluated in chunks, so memory
+    stays bounded by chunk_size regardless of max_points.
+
+    Parameters:
+        f (function): The integrand, taking one argument per dimension.
+        bounds (list of tuple): (lower, upper) for each dimension.
+        tol (float): Stop once the standard-error estimate is at most tol.
+        max_points (int): Budget of points per replicate.
+        chunk_size (int): Points per replicate generated at a time.
+        replicates (int): Number of random shifts (at least 2).
+        seed (int): Seed for the random shifts.
+        verbose (bool): Print the running estimate after each chunk.
+
+    Returns:
+        MethodResult: The estimate with its standard-error estimate and evaluation count;
+        details["history"] holds (evaluations, estimate, error) after each chunk.
+
+    Raises:
+        ValueError: If the bounds are malformed or replicates < 2.
+    """
+    start = time.perf_counter()
+    bounds = _check_bounds(bounds)
+    if replicates < 2:
+        raise ValueError("At least two replicates are needed for an error estimate.")
+    d = len(bounds)
+    lower = bounds[:, 0]
+    width = bounds[:, 1] - bounds[:, 0]
+    volume = float(np.prod(width))
+    shifts = np.random.default_rng(seed).random((replicates, d))
+
+    sums = np.zeros(replicates)
+    used = 0
+    estimate, error = 0.0, np.inf
+    history = []
+    converged = False
+    while used < max_points:
+        count = min(chunk_size, max_points - used)
+        base = halton_points(used + 1, count, d)
+        for r in range(replicates):
+            x = lower + width * np.mod(base + shifts[r], 1.0)
+            sums[r] += np.sum(_sample_nd(f, list(x.T)))
+        used += count
+        means = volume * sums / used
+        estimate = float(np.mean(means))
+        error = float(np.std(means, ddof=1) / np.sqrt(replicates))
+        history.append((used * replicates, estimate, error))
+        if verbose:
+            print(f"[QMC] {used * replicates} evaluations: estimate = {estimate:.10f}, error ≈ {error:.3e}")
+        if error <= tol:
+            converged = True
+            break
+
+    message = "" if converged else (f"Tolerance {tol} not reached within {max_points} points per replicate "
+                                    f"(error estimate {error:.3e}).")
+    return MethodResult("quasi_monte_carlo", estimate, converged, len(history), used * replicates,
+                        time.perf_counter() - start, error, message, {"history": history})
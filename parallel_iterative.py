@@ -0,0 +1,223 @@
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from method_result import MethodResult
+from instrumentation import profiled
+from array_model import as_matrix, as_vector, layout_of, restore_layout
+from sparse_matrix import CSRMatrix
+from jacobi_gauss_seidel import initial_guess, gauss_seidel_method
+
+def _operator(A):
+    return A if isinstance(A, CSRMatrix) else as_matrix(A)
+
+def _rows_matvec(A, x, start, stop):
+    if isinstance(A, CSRMatrix):
+        return A.row_block_matvec(x, start, stop)
+    return A[start:stop] @ x
+
+def _row_weights(A, start, stop):
+    if isinstance(A, CSRMatrix):
+        return A.indptr[start:stop + 1]
+    return np.arange(start, stop + 1) * A.shape[1]
+
+def balanced_blocks(A, count, start=0, stop=None):
+    """
+    Splits rows start..stop into at most `count` contiguous blocks with about the same
+    number of non-zeros each (the same number of rows for a dense matrix).
+
+    Returns:
+        list of tuple: (first_row, end_row) pairs, end exclusive.
+    """
+    stop = A.shape[0] if stop is None else stop
+    if stop <= start:
+        return []
+    cumulative = _row_weights(A, start, stop)
+    targets = np.linspace(cumulative[0], cumulative[-1], count + 1)[1:-1]
+    cuts = start + np.searchsorted(cumulative, targets)
+    bounds = np.unique(np.concatenate(([start], np.clip(cuts, start, stop), [stop])))
+    return list(zip(bounds[:-1].tolist(), bounds[1:].tolist()))
+
+def greedy_coloring(A):
+    """
+    Colors the unknowns so that no two coupled unknowns (a_ij != 0 or a_ji != 0) share a color,
+    using the symmetrized pattern of A + A^T (red-black for a 5-point grid). Unknowns of one
+    color never read each other, so they can be updated simultaneously.
+
+    Parameters:
+        A (CSRMatrix): Sparse coefficient matrix.
+
+    Returns:
+        numpy.ndarray: Color index of every unknown.
+    """
+    n = A.shape[0]
+    rows = np.repeat(np.arange(n), np.diff(A.indptr))
+    pattern = CSRMatrix.from_triplets(np.concatenate([rows, A.indices]), np.concatenate([A.indices, rows]),
+                                      np.ones(2 * A.nnz), A.shape)
+    colors = np.full(n, -1, dtype=np.int64)
+    for i in range(n):
+        neighbours = colors[pattern.indices[pattern.indptr[i]:pattern.indptr[i + 1]]]
+        used = np.zeros(len(neighbours) + 2, dtype=bool)
+        used[neighbours[(neighbours >= 0) & (neighbours < len(used))]] = True
+        colors[i] = int(np.argmin(used))
+    return colors
+
+def _run_team(workers, phases, work, end_phase):
+    """
+    Runs `work(worker, phase)` on every worker thread, phase after phase, with a barrier after each
+    phase. end_phase(phase) runs once per phase, in a single thread, while the others wait at the
+    barrier; it returns True to stop. If any worker fails, the barrier is broken so none can hang.
+    """
+    stop = threading.Event()
+
+    def finish():
+        finish.phase = (finish.phase + 1) % phases
+        if end_phase(finish.phase - 1 if finish.phase else phases - 1):
+            stop.set()
+    finish.phase = 0
+    barrier = threading.Barrier(workers, action=finish)
+
+    def member(worker):
+        try:
+            while not stop.is_set():
+                for phase in range(phases):
+                    work(worker, phase)
+                    barrier.wait()
+                    if stop.is_set():
+                        break
+        except threading.BrokenBarrierError:
+            pass
+        except BaseException:
+            barrier.abort()
+            raise
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(member, worker) for worker in range(workers)]
+        for future in futures:
+            future.result()
+
+@profiled("block_jacobi", callables=())
+def block_jacobi(A, b, tol=1e-5, max_iterations=1000, workers=None, x0=None):
+    """
+    Solves Ax = b with the Jacobi iteration, the rows split into one block per worker thread.
+    Every sweep each thread updates its block with a NumPy matrix-vector product on shared arrays
+    (releasing the GIL), then all threads meet at a barrier before the next sweep.
+
+    Parameters:
+        A (list of list of float, numpy.ndarray or CSRMatrix): Coefficient matrix; use a CSRMatrix
+           (sparse_matrix.load_sparse or CSRMatrix.from_triplets) for large sparse systems.
+        b (list of float or numpy.ndarray): Right-hand side, flat or a column.
+        tol (float): Stop when successive iterates differ by less than tol (max norm).
+        max_iterations (int): Maximum number of sweeps.
+        workers (int): Number of threads (default: CPU count).
+        x0 (list of float or numpy.ndarray): Starting vector (default zeros).
+
+    Returns:
+        MethodResult: value in the layout of b; details["errors"] holds the change per sweep.
+
+    Raises:
+        ValueError: If a diagonal element is zero.
+    """
+    start = time.perf_counter()
+    b_layout = layout_of(b)
+    A = _operator(A)
+    b = as_vector(b)
+    diagonal = A.diagonal()
+    if np.any(diagonal == 0):
+        raise ValueError("Zero diagonal element: the Jacobi iteration is undefined.")
+    blocks = balanced_blocks(A, workers or os.cpu_count() or 1)
+    buffers = [initial_guess(x0, len(b)), np.zeros(len(b))]
+    changes = np.zeros(len(blocks))
+    errors = []
+
+    def work(worker, phase):
+        source, target = buffers[len(errors) % 2], buffers[1 - len(errors) % 2]
+        first, end = blocks[worker]
+        step = (b[first:end] - _rows_matvec(A, source, first, end)) / diagonal[first:end]
+        target[first:end] = source[first:end] + step
+        changes[worker] = np.max(np.abs(step)) if end > first else 0.0
+
+    def end_sweep(phase):
+        errors.append(float(changes.max()))
+        return errors[-1] < tol or len(errors) >= max_iterations
+
+    _run_team(len(blocks), 1, work, end_sweep)
+    x = buffers[len(errors) % 2]
+    converged = errors[-1] < tol
+    elapsed = time.perf_counter() - start
+    print(f"[Block Jacobi] {'Converged' if converged else 'Did not converge'} after {len(errors)} sweeps "
+          f"on {len(blocks)} threads ({elapsed:.3f} s).")
+    return MethodResult("block_jacobi", restore_layout(x, b_layout), converged, len(errors), len(errors), elapsed,
+                        errors[-1], "" if converged else "The system did not converge within the maximum number of iterations.",
+                        {"errors": errors, "blocks": blocks})
+
+@profiled("multicolor_gauss_seidel", callables=())
+def multicolor_gauss_seidel(A, b, tol=1e-5, max_iterations=1000, workers=None, colors=None, x0=None):
+    """
+    Solves Ax = b with Gauss-Seidel in multicolor order: the unknowns are grouped by color
+    (greedy_coloring, red-black on grid problems) and every color is updated in parallel by the
+    worker threads, with a barrier between colors. Later colors see the new values of earlier ones.
+    Coloring only pays off for sparse matrices (a dense one needs a color per row), so lists and
+    arrays are solved with the serial gauss_seidel_method instead.
+
+    Parameters:
+        A (CSRMatrix): Sparse coefficient matrix (lists and arrays fall back as described).
+        b, tol, max_iterations, workers, x0: As for block_jacobi.
+        colors (numpy.ndarray): Color of every unknown (default: greedy_coloring(A)); unknowns of
+                                one color must not be coupled in either direction.
+
+    Returns:
+        MethodResult: value in the layout of b (original unknown order); details["colors"] is
+        the number of colors and details["errors"] the change per sweep.
+
+    Raises:
+        ValueError: If a diagonal element is zero.
+    """
+    if not isinstance(A, CSRMatrix):
+        return gauss_seidel_method(A, b, tol, max_iterations, x0=x0)
+    start = time.perf_counter()
+    b_layout = layout_of(b)
+    b = as_vector(b)
+    colors = greedy_coloring(A) if colors is None else np.asarray(colors)
+    order = np.argsort(colors, kind="stable")
+    P = A.permuted(order)
+    pb = b[order]
+    diagonal = P.diagonal()
+    if np.any(diagonal == 0):
+        raise ValueError("Zero diagonal element: the Gauss-Seidel iteration is undefined.")
+    workers = workers or os.cpu_count() or 1
+    bounds = np.searchsorted(colors[order], np.arange(colors.max() + 2))
+    color_blocks = [balanced_blocks(P, workers, first, end) for first, end in zip(bounds[:-1], bounds[1:])]
+    color_blocks = [blocks + [(0, 0)] * (workers - len(blocks)) for blocks in color_blocks if blocks]
+    x = initial_guess(x0, len(b))[order]
+    changes = np.zeros(workers)
+    errors = []
+
+    def work(worker, phase):
+        first, end = color_blocks[phase][worker]
+        if end > first:
+            step = (pb[first:end] - P.row_block_matvec(x, first, end)) / diagonal[first:end]
+            x[first:end] += step
+            changes[worker] = max(changes[worker], np.max(np.abs(step)))
+
+    def end_phase(phase):
+        if phase < len(color_blocks) - 1:
+            return False
+        errors.append(float(changes.max()))
+        changes[:] = 0.0
+        return errors[-1] < tol or len(errors) >= max_iterations
+
+    _run_team(workers, len(color_blocks), work, end_phase)
+    solution = np.empty_like(x)
+    solution[order] = x
+    converged = errors[-1] < tol
+    elapsed = time.perf_counter() - start
+    print(f"[Multicolor Gauss-Seidel] {'Converged' if converged else 'Did not converge'} after {len(errors)} sweeps "
+          f"with {len(color_blocks)} colors on {workers} threads ({elapsed:.3f} s).")
+    return MethodResult("multicolor_gauss_seidel", restore_layout(solution, b_layout), converged, len(errors),
+                        len(errors), elapsed, errors[-1],
+                        "" if converged else "The system did not converge within the maximum number of iterations.",
+                        {"errors": errors, "colors": len(color_blocks)})
@@ -0,0 +1,176 @@
+import csv
+import itertools
+import math
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
+
+from method_result import MethodResult
+from vectorized_integration import sample_function, simpson_weights
+from Romberg_Integration import RombergIntegrator
+
+def parameter_grid(grid):
+    """
+    Expands {"n": [2, 4], "tol": [1e-6, 1e-8]} into the list of all parameter combinations.
+    """
+    names = list(grid)
+    return [dict(zip(names, values)) for values in itertools.product(*(grid[name] for name in names))]
+
+def _error(value, exact, result):
+    if exact is None:
+        return result.error_estimate if isinstance(result, MethodResult) else None
+    if value is None:
+        return None
+    return float(np.max(np.abs(np.ravel(np.asarray(value, dtype=float) - np.ravel(exact)))))
+
+def _record(point, result, exact, elapsed):
+    """
+    One tidy row: the sweep parameters followed by the outcome columns.
+    """
+    if isinstance(result, MethodResult):
+        value = result.value
+        row = dict(point, value=value, error=_error(value, exact, result), evaluations=result.evaluations,
+                   iterations=result.iterations, converged=result.converged, time=result.elapsed or elapsed)
+    else:
+        row = dict(point, value=result, error=_error(result, exact, None), evaluations=None,
+                   iterations=None, converged=None, time=elapsed)
+    if isinstance(row["value"], np.ndarray):
+        row["value"] = row["value"].tolist()
+    return row
+
+def _run_point(method, fixed, point, exact):
+    start = time.perf_counter()
+    result = method(**fixed, **point)
+    return _record(point, result, exact, time.perf_counter() - start)
+
+def sweep(method, grid, fixed=None, exact=None, workers=None, executor="process"):
+    """
+    Runs `method` once for every combination of parameters in `grid` and returns a tidy table.
+
+    Parameters:
+        method (function): Any project method, called as method(**fixed, **point).
+        grid (dict): Parameter name -> list of values to sweep (n, tol, max_level, x0, ...).
+        fixed (dict): Arguments shared by every run (f, a, b, A, b, ...).
+        exact: Known exact value (scalar or vector); if given, error = |value - exact|,
+               otherwise the method's own error estimate is reported.
+        workers (int): Run independent points in parallel with this many workers (None: serially).
+        executor (str): "process" (needs picklable method and arguments, so no lambdas)
+                        or "thread" (for methods that spend their time inside NumPy).
+
+    Returns:
+        list of dict: One row per grid point, with the parameters and
+        value, error, evaluations, iterations, converged and time.
+    """
+    fixed = fixed or {}
+    points = parameter_grid(grid)
+    if not workers or workers <= 1 or len(points) <= 1:
+        return [_run_point(method, fixed, point, exact) for point in points]
+    if executor not in ("process", "thread"):
+        raise ValueError("executor must be 'process' or 'thread'.")
+    pool_class = ProcessPoolExecutor if executor == "process" else ThreadPoolExecutor
+    with pool_class(max_workers=workers) as pool:
+        futures = [pool.submit(_run_point, method, fixed, point, exact) for point in points]
+        return [future.result() for future in futures]
+
+def simpson_sweep(f, a, b, ns, exact=None):
+    """
+    Composite Simpson's Rule for every n in ns, sharing function evaluations between grids.
+    Node k of grid n sits at the integer position k * (L / n) on the grid of L = lcm(ns)
+    subintervals, so coinciding nodes of different grids get the same key: the union of
+    all nodes is evaluated once, in one call, and each grid picks its samples from it.
+
+    Parameters:
+        f (function): The integrand.
+        a (float): The lower limit of integration.
+        b (float): The upper limit of integration.
+        ns (list of int): Even numbers of subintervals.
+        exact (float): Known value of the integral, for the error column.
+
+    Returns:
+        list of dict: One row per n (in the order given) with n, value, error, evaluations
+        (the n + 1 points the grid uses), new_evaluations (those not already evaluated for a
+        finer grid, counting from the finest grid down; their sum is the number of calls
+        actually made) and time (the summation plus the cost of the new points).
+
+    Raises:
+        ValueError: If any n is odd or not positive.
+    """
+    if not ns or any(n <= 0 or n % 2 for n in ns):
+        raise ValueError("n must be even for Simpson's Rule.")
+    order = sorted(set(ns), reverse=True)
+    L = math.lcm(*order)
+    if L >= 2**62:
+        # Positions would overflow int64: fall back to evaluating each grid on its own.
+        return [simpson_sweep(f, a, b, [n], exact)[0] for n in ns]
+
+    keys = {n: np.arange(n + 1, dtype=np.int64) * (L // n) for n in order}
+    all_keys = np.unique(np.concatenate(list(keys.values())))
+    start = time.perf_counter()
+    y_all = sample_function(f, a + (b - a) * (all_keys / L))
+    time_per_point = (time.perf_counter() - start) / len(all_keys)
+
+    seen = np.zeros(len(all_keys), dtype=bool)
+    rows = {}
+    for n in order:
+        start = time.perf_counter()
+        index = np.searchsorted(all_keys, keys[n])
+        new_points = int(np.count_nonzero(~seen[index]))
+        seen[index] = True
+        value = float(simpson_weights(n, (b - a) / n) @ y_all[index])
+        rows[n] = {"n": n, "value": value, "error": None if exact is None else abs(value - exact),
+                   "evaluations": n + 1, "new_evaluations": new_points,
+                   "time": time.perf_counter() - start + new_points * time_per_point}
+    return [dict(rows[n]) for n in ns]
+
+def romberg_sweep(f, a, b, max_levels, exact=None):
+    """
+    Romberg results for several max_level values from a single incremental table:
+    every level is the diagonal of the same table, so each level only costs its new midpoints.
+
+    Returns:
+        list of dict: One row per max_level with value, error (exact error if given,
+        else the difference of successive diagonal entries), evaluations and time.
+    """
+    integrator = RombergIntegrator(f, a, b)
+    rows = {}
+    start = time.perf_counter()
+    for level in range(1, max(max_levels) + 1):
+        value = integrator.extend()
+        if level in max_levels:
+            error = integrator.error_estimate if exact is None else abs(value - exact)
+            rows[level] = {"max_level": level, "value": value, "error": error,
+                           "evaluations": integrator.evaluations, "time": time.perf_counter() - start}
+    return [dict(rows[level]) for level in max_levels]
+
+def format_table(rows, columns=None):
+    """
+    Formats sweep rows as an aligned text table.
+    """
+    if not rows:
+        return ""
+    columns = columns or list(rows[0])
+
+    def cell(value):
+        if isinstance(value, float):
+            return f"{value:.6e}" if value != 0 and (abs(value) < 1e-3 or abs(value) >= 1e6) else f"{value:.10g}"
+        if isinstance(value, list):
+            return "[" + ", ".join(cell(v) for v in value) + "]"
+        return "-" if value is None else str(value)
+
+    cells = [[cell(row.get(column)) for column in columns] for row in rows]
+    widths = [max(len(column), *(len(line[i]) for line in cells)) for i, column in enumerate(columns)]
+    lines = ["  ".join(column.rjust(width) for column, width in zip(columns, widths))]
+    lines += ["  ".join(value.rjust(width) for value, width in zip(line, widths)) for line in cells]
+    return "\n".join(lines)
+
+def write_csv(rows, path):
+    """
+    Writes sweep rows to a CSV file with one column per key.
+    """
+    if not rows:
+        return
+    with open(path, "w", newline="", encoding="utf-8") as handle:
+        writer = csv.DictWriter(handle, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
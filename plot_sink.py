@@ -0,0 +1,175 @@
+import itertools
+import os
+import re
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+_active = None
+_process_figure = None
+
+def _draw_on(figure, draw, args, path, figsize):
+    """
+    Clears the reused figure, lets `draw` fill a fresh axes and writes the file.
+    """
+    figure.clear()
+    figure.set_size_inches(figsize or plt.rcParams["figure.figsize"])
+    draw(figure.add_subplot(), *args)
+    figure.tight_layout()
+    figure.savefig(path)
+    return path
+
+def _draw_in_process(draw, args, path, figsize, dpi):
+    # Each worker process keeps one Agg figure of its own for all the plots it renders.
+    global _process_figure
+    if _process_figure is None:
+        _process_figure = Figure(dpi=dpi)
+        FigureCanvasAgg(_process_figure)
+    return _draw_on(_process_figure, draw, args, path, figsize)
+
+class PlotSink:
+    """
+    Renders plots headlessly to PNG or SVG files with the Agg canvas instead of plt.show().
+    One Figure is reused for every plot instead of creating a new figure each time.
+    With worker="thread" or "process", rendering runs in a single background worker,
+    so the solvers do not wait for it; call wait() (or leave the `with` block) to collect the files.
+
+    Usage:
+        with PlotSink("plots", fmt="svg", worker="thread") as sink:
+            jacobi_method(A, b)  # Writes plots/0000_Jacobi_Method_Error_per_Iteration.svg
+        print(sink.paths)
+    """
+
+    def __init__(self, directory, fmt="png", worker=None, dpi=100):
+        """
+        Parameters:
+            directory (str): Output directory (created if missing).
+            fmt (str): "png" or "svg".
+            worker (str): None to render inline, "thread" or "process" to render in the background.
+            dpi (int): Resolution of PNG output.
+
+        Raises:
+            ValueError: If the format or worker kind is unknown.
+        """
+        if fmt not in ("png", "svg"):
+            raise ValueError("Plot format must be 'png' or 'svg'.")
+        if worker not in (None, "thread", "process"):
+            raise ValueError("worker must be None, 'thread' or 'process'.")
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.fmt = fmt
+        self.worker = worker
+        self.dpi = dpi
+        self.paths = []
+        self._figure = Figure(dpi=dpi)
+        FigureCanvasAgg(self._figure)
+        self._counter = itertools.count()
+        self._futures = []
+        self._lock = threading.Lock()
+        self._previous = None
+        if worker == "thread":
+            self._executor = ThreadPoolExecutor(max_workers=1)
+        elif worker == "process":
+            self._executor = ProcessPoolExecutor(max_workers=1)
+        else:
+            self._executor = None
+
+    def submit(self, name, draw, *args, figsize=None):
+        """
+        Renders draw(ax, *args) to "<directory>/<index>_<name>.<fmt>".
+        For worker="process", draw must be a module-level function and args picklable.
+
+        Returns:
+            str or concurrent.futures.Future: The file path, or a future resolving to it.
+        """
+        safe_name = re.sub(r"[^\w.-]+", "_", name).strip("_") or "plot"
+        with self._lock:
+            path = os.path.join(self.directory, f"{next(self._counter):04d}_{safe_name}.{self.fmt}")
+        if self._executor is None:
+            self.paths.append(_draw_on(self._figure, draw, args, path, figsize))
+            return path
+        if self.worker == "thread":
+            future = self._executor.submit(_draw_on, self._figure, draw, args, path, figsize)
+        else:
+            future = self._executor.submit(_draw_in_process, draw, args, path, figsize, self.dpi)
+        with self._lock:
+            self._futures.append(future)
+        return future
+
+    def wait(self):
+        """
+        Blocks until every queued plot is written and returns the paths written so far.
+        Re-raises the first rendering error, if any.
+        """
+        with self._lock:
+            futures, self._futures = self._futures, []
+        for future in futures:
+            self.paths.append(future.result())
+        return list(self.paths)
+
+    def close(self):
+        try:
+            self.wait()
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+
+    def __enter__(self):
+        self._previous = set_plot_sink(self)
+        return self
+
+    def __exit__(self, *exc):
+        set_plot_sink(self._previous)
+        self.close()
+        return False
+
+class DiscardSink:
+    """
+    A sink that draws nothing, for batch runs where plots are not wanted at all
+    (benchmark timings, service workers).
+    """
+
+    def submit(self, name, draw, *args, figsize=None):
+        return None
+
+def use_interactive_backend():
+    """
+    Switches pyplot to the TkAgg window backend for interactive runs. Nothing changes when
+    MPLBACKEND is set (benchmark and server runs) or when Tk is not available.
+    """
+    if "MPLBACKEND" not in os.environ:
+        try:
+            plt.switch_backend('TkAgg')
+        except ImportError:
+            pass  # No display available: keep the default backend.
+
+def set_plot_sink(sink):
+    """
+    Routes every plot drawn through render() to `sink` (None restores plt.show()).
+
+    Returns:
+        PlotSink: The previously active sink, or None.
+    """
+    global _active
+    previous, _active = _active, sink
+    return previous
+
+def get_plot_sink():
+    return _active
+
+def render(name, draw, *args, figsize=None):
+    """
+    Shows a plot: draw(ax, *args) fills the axes. When a PlotSink is active the plot is
+    written to a file by the sink; otherwise a new interactive figure is opened with plt.show().
+    """
+    if _active is not None:
+        return _active.submit(name, draw, *args, figsize=figsize)
+    figure = plt.figure(figsize=figsize)
+    draw(figure.add_subplot(), *args)
+    figure.tight_layout()
+    plt.show()
+    return None
@@ -0,0 +1,361 @@
+"""
+Asyncio service exposing the numerical methods over a local socket, so a pipeline can
+call them without paying interpreter and import startup per request.
+
+Protocol: newline-delimited JSON over a Unix socket (default) or a localhost TCP port.
+    request:  {"id": 7, "method": "bisection_method", "params": {"f": "x**3 - 2", "start": 0, "end": 2}}
+    response: {"id": 7, "ok": true, "result": {"method": "bisection", "value": 1.2599..., ...}}
+              {"id": 7, "ok": false, "error": "ValueError: ..."}
+Functions are passed as expressions in x. Requests on one connection may be pipelined;
+each response is written as soon as it is ready and is matched to its request by "id".
+The built-in method "methods" lists what is available.
+Expressions are checked against a whitelist of functions before parsing (expression_parser).
+
+Run:
+    python solver_service.py --socket /tmp/numerics.sock --workers 4
+    python solver_service.py --port 8765
+"""
+import argparse
+import asyncio
+import contextlib
+import itertools
+import json
+import math
+import os
+import signal
+import threading
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+os.environ.setdefault("MPLBACKEND", "Agg")
+
+import numpy as np
+from sympy import symbols, lambdify
+
+from method_result import MethodResult
+from plot_sink import DiscardSink, set_plot_sink
+from expression_parser import parse_function
+from EquationRoots import bisection_method, newton_method, secant_method
+from Simpson_Rule import simpson
+from Romberg_Integration import romberg
+from interpolation_methods import trapezoid_rule
+from vectorized_integration import simpson_vectorized, trapezoid_vectorized
+from adaptive_integration import adaptive_simpson, gauss_kronrod
+from gaussian_quadrature import gauss_legendre, gauss_lobatto
+from improper_integration import tanh_sinh
+from chebyshev_approximation import chebyshev_approximation
+from jacobi_gauss_seidel import jacobi_method, gauss_seidel_method
+from forward_elimination import gaussian_elimination
+from mixed_precision import mixed_precision_solve
+from parallel_iterative import block_jacobi, multicolor_gauss_seidel
+from matrix_vector_mult import residual_norm_max
+from Lagrange_and_Neville_Polynomial_Interpolation import lagrange_interpolation, neville_interpolation
+from Cubic_Spline_Interpolation import cubic_spline_interpolation
+
+# name -> (method, parameters that are expressions in x)
+METHODS = {
+    "bisection_method": (bisection_method, ("f",)),
+    "newton_method": (newton_method, ("func", "dfunc")),
+    "secant_method": (secant_method, ("func",)),
+    "simpson": (simpson, ("f",)),
+    "simpson_vectorized": (simpson_vectorized, ("f",)),
+    "trapezoid_rule": (trapezoid_rule, ("f",)),
+    "trapezoid_vectorized": (trapezoid_vectorized, ("f",)),
+    "romberg": (romberg, ("f",)),
+    "adaptive_simpson": (adaptive_simpson, ("f",)),
+    "gauss_kronrod": (gauss_kronrod, ("f",)),
+    "gauss_legendre": (gauss_legendre, ("f",)),
+    "gauss_lobatto": (gauss_lobatto, ("f",)),
+    "tanh_sinh": (tanh_sinh, ("f",)),
+    "chebyshev_approximation": (chebyshev_approximation, ("f",)),
+    "jacobi_method": (jacobi_method, ()),
+    "gauss_seidel_method": (gauss_seidel_method, ()),
+    "gaussian_elimination": (gaussian_elimination, ()),
+    "mixed_precision_solve": (mixed_precision_solve, ()),
+    "block_jacobi": (block_jacobi, ()),
+    "multicolor_gauss_seidel": (multicolor_gauss_seidel, ()),
+    "residual_norm_max": (residual_norm_max, ()),
+    "lagrange_interpolation": (lagrange_interpolation, ()),
+    "neville_interpolation": (neville_interpolation, ()),
+    "cubic_spline_interpolation": (cubic_spline_interpolation, ()),
+}
+
+# Longest request or response line accepted, in bytes. asyncio's default of 64 KiB is too
+# small for linear systems: a 120 x 120 matrix is about 300 KB of JSON.
+MAX_LINE = 64 * 2**20
+
+@lru_cache(maxsize=256)
+def compile_expression(expr_str, derivative=0):
+    """
+    Compiles an expression in x to a NumPy function, cached per worker process.
+    Expressions come from the socket, so they are parsed with expression_parser.parse_function,
+    which only accepts x, numbers, arithmetic and whitelisted functions.
+
+    Raises:
+        ValueError: If the expression is malformed or uses anything outside the whitelist.
+    """
+    x = symbols('x')
+    expr = parse_function(expr_str)
+    if derivative:
+        expr = expr.diff(x, derivative)
+    return lambdify(x, expr, "numpy")
+
+def to_plain(value):
+    """
+    Converts results (MethodResult, NumPy arrays and scalars, tuples) into JSON-ready values;
+    non-finite floats (e.g. from a divergent method) become None.
+    """
+    if isinstance(value, MethodResult):
+        return to_plain(value.as_dict())
+    if isinstance(value, dict):
+        return {str(k): to_plain(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_plain(v) for v in value]
+    if isinstance(value, np.ndarray):
+        return to_plain(value.tolist())
+    if isinstance(value, np.generic):
+        return to_plain(value.item())
+    if isinstance(value, float) and not math.isfinite(value):
+        return None  # NaN and infinity are not valid JSON.
+    return value
+
+def _raise_timeout(signum, frame):
+    raise TimeoutError("request exceeded its time limit.")
+
+@contextlib.contextmanager
+def time_limit(seconds):
+    """
+    Raises TimeoutError in the running code after `seconds` (SIGALRM; a no-op where it is
+    unavailable or off the main thread). Long C calls are only interrupted once they return.
+    """
+    if not seconds or not hasattr(signal, "setitimer") or threading.current_thread() is not threading.main_thread():
+        yield
+        return
+    previous = signal.signal(signal.SIGALRM, _raise_timeout)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+def execute(method, params, timeout=None):
+    """
+    Runs one request inside a worker process and returns its JSON-ready result.
+
+    Raises:
+        ValueError: If the method is unknown.
+        TimeoutError: If the request runs longer than timeout seconds.
+    """
+    with time_limit(timeout):
+        return _execute(method, params)
+
+def _execute(method, params):
+    if method not in METHODS:
+        raise ValueError(f"Unknown method '{method}'.")
+    function, expressions = METHODS[method]
+    params = dict(params)
+    if method == "newton_method" and "dfunc" not in params and "func" in params:
+        params["dfunc"] = compile_expression(params["func"], 1)
+    for name in expressions:
+        if isinstance(params.get(name), str):
+            params[name] = compile_expression(params[name])
+    result = function(**params)
+    if not isinstance(result, MethodResult):
+        result = {"value": result}
+    return to_plain(result)
+
+def _init_worker():
+    # Workers never show plots or progress output.
+    sys.stdout = open(os.devnull, "w")
+    set_plot_sink(DiscardSink())
+
+class SolverService:
+    """
+    Accepts JSON-lines connections and runs each request on a process pool.
+
+    Parameters:
+        workers (int): Number of worker processes (default: CPU count).
+        max_pending (int): Requests in flight per connection before reading pauses.
+        timeout (float): Seconds a request may run before it is stopped with a TimeoutError
+                         reply (None: no limit), so slow requests cannot hold workers indefinitely.
+    """
+
+    def __init__(self, workers=None, max_pending=64, timeout=30.0):
+        self.workers = workers or os.cpu_count() or 1
+        self.pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker)
+        self.max_pending = max_pending
+        self.timeout = timeout
+
+    async def warm_up(self):
+        # Start every worker and compile a first expression, so the first client does not pay for it.
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(loop.run_in_executor(self.pool, execute, "simpson",
+                                                    {"f": "x", "a": 0, "b": 1, "n": 2})
+                               for _ in range(self.workers)))
+
+    async def handle(self, reader, writer):
+        write_lock = asyncio.Lock()
+        limit = asyncio.Semaphore(self.max_pending)
+        pending = set()
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    # Longer than MAX_LINE: the rest of the stream can no longer be split into
+                    # requests, so answer the ones already read, report the overrun and close.
+                    await self._send(writer, write_lock, {"id": None, "ok": False,
+                                                          "error": f"ValueError: request line exceeds {MAX_LINE} bytes."})
+                    break
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                await limit.acquire()
+                task = asyncio.create_task(self._respond(line, writer, write_lock, limit))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+            if pending:
+                await asyncio.gather(*pending)
+        finally:
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+
+    async def _respond(self, line, writer, write_lock, limit):
+        request_id = None
+        try:
+            request = json.loads(line)
+            request_id = request.get("id")
+            method = request["method"]
+            if method == "methods":
+                result = sorted(METHODS)
+            else:
+                loop = asyncio.get_running_loop()
+                work = loop.run_in_executor(self.pool, execute, method, request.get("params", {}), self.timeout)
+                # The worker stops itself at the limit; the extra second here only guarantees a
+                # reply if it is stuck in a C call that the alarm cannot interrupt.
+                try:
+                    result = await asyncio.wait_for(work, None if self.timeout is None else self.timeout + 1.0)
+                except asyncio.TimeoutError:
+                    raise TimeoutError("request exceeded its time limit.") from None
+            response = {"id": request_id, "ok": True, "result": result}
+        except Exception as e:
+            response = {"id": request_id, "ok": False, "error": f"{type(e).__name__}: {e}"}
+        finally:
+            limit.release()
+        await self._send(writer, write_lock, response)
+
+    async def _send(self, writer, write_lock, response):
+        async with write_lock:
+            writer.write(json.dumps(response, allow_nan=False).encode() + b"\n")
+            with contextlib.suppress(ConnectionError):
+                await writer.drain()
+
+    async def serve(self, socket_path=None, host="127.0.0.1", port=None):
+        """
+        Serves until cancelled, on a Unix socket if socket_path is given, else on host:port.
+        """
+        await self.warm_up()
+        if socket_path is not None:
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(socket_path)
+            server = await asyncio.start_unix_server(self.handle, path=socket_path, limit=MAX_LINE)
+            print(f"[Service] Listening on {socket_path}", flush=True)
+        else:
+            server = await asyncio.start_server(self.handle, host, port, limit=MAX_LINE)
+            print(f"[Service] Listening on {host}:{port}", flush=True)
+        async with server:
+            await server.serve_forever()
+
+    def close(self):
+        self.pool.shutdown(cancel_futures=True)
+
+class SolverClient:
+    """
+    Minimal asyncio client. Calls may be issued concurrently on one connection (pipelined);
+    responses are matched to callers by id.
+    """
+
+    def __init__(self, reader, writer):
+        self._reader = reader
+        self._writer = writer
+        self._ids = itertools.count(1)
+        self._waiting = {}
+        self._listener = asyncio.create_task(self._listen())
+
+    @classmethod
+    async def connect(cls, socket_path=None, host="127.0.0.1", port=None):
+        if socket_path is not None:
+            reader, writer = await asyncio.open_unix_connection(socket_path, limit=MAX_LINE)
+        else:
+            reader, writer = await asyncio.open_connection(host, port, limit=MAX_LINE)
+        return cls(reader, writer)
+
+    async def _listen(self):
+        reason = None
+        while True:
+            try:
+                line = await self._reader.readline()
+            except ValueError:
+                break  # Response longer than MAX_LINE: the stream is out of step, treat it as closed.
+            if not line:
+                break
+            response = json.loads(line)
+            if response.get("id") is None and not response.get("ok"):
+                reason = response.get("error")  # Connection-level error (e.g. an oversized request).
+            future = self._waiting.pop(response.get("id"), None)
+            if future is not None and not future.done():
+                future.set_result(response)
+        for future in self._waiting.values():
+            if not future.done():
+                future.set_exception(ConnectionError(f"Service closed the connection: {reason}"
+                                                     if reason else "Service closed the connection."))
+
+    async def call(self, method, **params):
+        """
+        Sends one request and waits for its response.
+
+        Returns:
+            The "result" field of the response.
+
+        Raises:
+            RuntimeError: If the service reports an error.
+        """
+        request_id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self._waiting[request_id] = future
+        self._writer.write(json.dumps({"id": request_id, "method": method, "params": params}).encode() + b"\n")
+        await self._writer.drain()
+        response = await future
+        if not response["ok"]:
+            raise RuntimeError(response["error"])
+        return response["result"]
+
+    async def close(self):
+        self._writer.close()
+        with contextlib.suppress(ConnectionError):
+            await self._writer.wait_closed()
+        self._listener.cancel()
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve the numerical methods over a local socket.")
+    parser.add_argument("--socket", default=None, help="Unix socket path (default transport).")
+    parser.add_argument("--port", type=int, default=None, help="Serve on 127.0.0.1:PORT instead of a socket.")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count).")
+    parser.add_argument("--timeout", type=float, default=30.0, help="Seconds allowed per request (default: 30).")
+    args = parser.parse_args()
+    socket_path = args.socket if args.socket or args.port else "/tmp/numerics.sock"
+
+    service = SolverService(args.workers, timeout=args.timeout)
+    try:
+        asyncio.run(service.serve(socket_path, port=args.port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        service.close()
+
+if __name__ == "__main__":
+    main()
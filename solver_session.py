@@ -0,0 +1,135 @@
+import hashlib
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+from method_result import MethodResult
+from array_model import as_matrix, as_vector, layout_of, restore_layout
+from sparse_matrix import CSRMatrix
+from jacobi_gauss_seidel import jacobi_method, gauss_seidel_method
+from parallel_iterative import block_jacobi, multicolor_gauss_seidel
+from mixed_precision import lu_factor, lu_solve, refine
+
+ITERATIVE_METHODS = {
+    "jacobi": jacobi_method,
+    "gauss_seidel": gauss_seidel_method,
+    "block_jacobi": block_jacobi,
+    "multicolor_gauss_seidel": multicolor_gauss_seidel,
+}
+
+def matrix_fingerprint(A):
+    """
+    Returns a short hash of a matrix's shape and values (CSR structure included for a CSRMatrix),
+    so identical systems can be recognised without keeping copies of them.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    if isinstance(A, CSRMatrix):
+        parts = (A.data, A.indices, A.indptr)
+        digest.update(repr(("csr", A.shape)).encode())
+    else:
+        A = as_matrix(A)
+        parts = (A,)
+        digest.update(repr(("dense", A.shape)).encode())
+    for part in parts:
+        digest.update(np.ascontiguousarray(part).tobytes())
+    return digest.hexdigest()
+
+class SolverSession:
+    """
+    Solves a sequence of related systems Ax = b, such as the steps of a time-stepping run,
+    reusing work from earlier solves:
+    - Iterative methods start from the cached solution of the same matrix or, for a new matrix,
+      from the last solution of the same size (a warm start). Only converged, finite solutions
+      are remembered, so a diverged solve never becomes the starting point of the next one.
+    - The "lu" method keeps LU factors per matrix fingerprint. A repeated or slightly changed
+      matrix is solved by refinement with the stored (or previous) factors, a few O(n^2) steps,
+      and is only re-factored if that refinement stalls.
+
+    Parameters:
+        method (str): "jacobi", "gauss_seidel", "block_jacobi", "multicolor_gauss_seidel" or "lu".
+        tol (float): Tolerance passed to the iterative methods ("lu" always solves to
+                     float64 accuracy).
+        max_iterations (int): Iteration limit passed to the iterative methods.
+        max_entries (int): Number of matrices remembered (least recently used are dropped).
+        **options: Further keyword arguments for the iterative method (e.g. workers).
+
+    Raises:
+        ValueError: If the method is unknown.
+    """
+
+    def __init__(self, method="gauss_seidel", tol=1e-5, max_iterations=100, max_entries=8, **options):
+        if method not in ITERATIVE_METHODS and method != "lu":
+            raise ValueError(f"Unknown method '{method}'.")
+        self.method = method
+        self.tol = tol if method != "lu" else None
+        self.max_iterations = max_iterations
+        self.max_entries = max_entries
+        self.options = options
+        self.entries = OrderedDict()
+        self.last = None
+        self.stats = {"solves": 0, "hits": 0, "warm_starts": 0, "factorizations": 0}
+
+    def clear(self):
+        self.entries.clear()
+        self.last = None
+
+    def _remember(self, key, **values):
+        entry = self.entries.pop(key, {})
+        entry.update(values)
+        self.entries[key] = entry
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        self.last = entry
+
+    def solve(self, A, b):
+        """
+        Solves Ax = b, starting from or reusing whatever the session holds for this matrix.
+
+        Returns:
+            MethodResult: The solver's result; details["session"] records the fingerprint,
+            whether it was a cache hit, and whether the solve was warm-started.
+        """
+        key = matrix_fingerprint(A)
+        n = A.shape[0] if isinstance(A, CSRMatrix) else len(as_matrix(A))
+        entry = self.entries.get(key)
+        hit = entry is not None
+        if hit:
+            self.entries.move_to_end(key)
+        elif self.last is not None and len(self.last["solution"]) == n:
+            entry = self.last
+        self.stats["solves"] += 1
+        self.stats["hits"] += hit
+        self.stats["warm_starts"] += entry is not None
+
+        if self.method == "lu":
+            result = self._solve_lu(A, b, key, entry)
+        else:
+            x0 = entry["solution"] if entry is not None else None
+            result = ITERATIVE_METHODS[self.method](A, b, self.tol, self.max_iterations, x0=x0, **self.options)
+            x = np.array(as_vector(result.value), dtype=float)
+            if result.converged and np.all(np.isfinite(x)):
+                self._remember(key, solution=x)
+        result.details["session"] = {"fingerprint": key, "hit": hit, "warm_start": entry is not None}
+        return result
+
+    def _solve_lu(self, A, b, key, entry):
+        start = time.perf_counter()
+        b_layout = layout_of(b)
+        A = A.toarray() if isinstance(A, CSRMatrix) else as_matrix(A)
+        b = as_vector(b)
+        factors = entry.get("factors") if entry is not None else None
+        residuals = []
+        converged = False
+        if factors is not None:
+            # Factors stored for this matrix, or those of the previous (nearby) matrix.
+            x, residuals, converged = refine(A, b, *factors, lu_solve(*factors, b), self.tol)
+        if not converged:
+            factors = lu_factor(A, np.float64)
+            self.stats["factorizations"] += 1
+            x, more, converged = refine(A, b, *factors, lu_solve(*factors, b), self.tol)
+            residuals += more
+        if converged and np.all(np.isfinite(x)):
+            self._remember(key, solution=x, factors=factors)
+        return MethodResult("lu", restore_layout(x, b_layout), converged, len(residuals), len(residuals),
+                            time.perf_counter() - start, residuals[-1], details={"residuals": residuals})
@@ -0,0 +1,125 @@
+import numpy as np
+
+from array_model import as_matrix
+
+class CSRMatrix:
+    """
+    Compressed sparse row matrix built on three NumPy arrays: the non-zero values row by row
+    (data), their column indices (indices), and where each row starts in both (indptr).
+    Products are whole-array NumPy operations, so they run without holding the GIL.
+
+    Parameters:
+        data (numpy.ndarray): Non-zero values, row by row.
+        indices (numpy.ndarray): Column index of every value.
+        indptr (numpy.ndarray): Row i occupies data[indptr[i]:indptr[i + 1]].
+        shape (tuple): (rows, columns).
+    """
+
+    def __init__(self, data, indices, indptr, shape):
+        self.data = np.asarray(data, dtype=float)
+        self.indices = np.asarray(indices, dtype=np.int64)
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.shape = (int(shape[0]), int(shape[1]))
+        if len(self.indptr) != self.shape[0] + 1 or len(self.data) != len(self.indices):
+            raise ValueError("Inconsistent CSR arrays.")
+
+    @classmethod
+    def from_triplets(cls, rows, cols, values, shape):
+        """
+        Builds a CSR matrix from (row, column, value) triplets, e.g. the output of
+        matrix_io.load_matrix_market(path, dense=False). Duplicate entries are summed.
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        cols = np.asarray(cols, dtype=np.int64)
+        values = np.asarray(values, dtype=float)
+        order = np.lexsort((cols, rows))
+        rows, cols, values = rows[order], cols[order], values[order]
+        if len(rows):
+            first = np.concatenate(([True], (rows[1:] != rows[:-1]) | (cols[1:] != cols[:-1])))
+            starts = np.flatnonzero(first)
+            values = np.add.reduceat(values, starts)
+            rows, cols = rows[starts], cols[starts]
+        indptr = np.zeros(shape[0] + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=shape[0]), out=indptr[1:])
+        return cls(values, cols, indptr, shape)
+
+    @classmethod
+    def from_dense(cls, matrix):
+        A = as_matrix(matrix)
+        rows, cols = np.nonzero(A)
+        return cls.from_triplets(rows, cols, A[rows, cols], A.shape)
+
+    @property
+    def nnz(self):
+        return len(self.data)
+
+    def diagonal(self):
+        rows = np.repeat(np.arange(self.shape[0]), np.diff(self.indptr))
+        on_diagonal = rows == self.indices
+        diagonal = np.zeros(min(self.shape))
+        np.add.at(diagonal, rows[on_diagonal], self.data[on_diagonal])
+        return diagonal
+
+    def row_block_matvec(self, x, start, stop):
+        """
+        Returns (A @ x)[start:stop], touching only the non-zeros of those rows.
+        """
+        lo, hi = self.indptr[start], self.indptr[stop]
+        result = np.zeros(stop - start)
+        if hi == lo:
+            return result
+        products = self.data[lo:hi] * x[self.indices[lo:hi]]
+        offsets = self.indptr[start:stop] - lo
+        filled = offsets < hi - lo
+        sums = np.add.reduceat(products, offsets[filled])
+        # reduceat gives a wrong value for empty rows, so only rows with entries take their sum.
+        nonempty = np.diff(self.indptr[start:stop + 1])[filled] > 0
+        result[np.flatnonzero(filled)[nonempty]] = sums[nonempty]
+        return result
+
+    def __matmul__(self, x):
+        return self.row_block_matvec(np.asarray(x, dtype=float), 0, self.shape[0])
+
+    def permuted(self, order):
+        """
+        Returns P A P^T for the permutation that puts row/unknown order[k] at position k.
+        """
+        order = np.asarray(order, dtype=np.int64)
+        position = np.empty_like(order)
+        position[order] = np.arange(len(order))
+        counts = np.diff(self.indptr)[order]
+        indptr = np.zeros(len(order) + 1, dtype=np.int64)
+        np.cumsum(counts, out=indptr[1:])
+        take = np.arange(self.nnz) + np.repeat(self.indptr[order] - indptr[:-1], counts)
+        return CSRMatrix(self.data[take], position[self.indices[take]], indptr, self.shape)
+
+    def toarray(self):
+        matrix = np.zeros(self.shape)
+        rows = np.repeat(np.arange(self.shape[0]), np.diff(self.indptr))
+        np.add.at(matrix, (rows, self.indices), self.data)
+        return matrix
+
+def load_sparse(path):
+    """
+    Loads a coordinate Matrix Market file straight into a CSRMatrix, never forming the dense matrix.
+    """
+    from matrix_io import load_matrix_market
+    loaded = load_matrix_market(path, dense=False)
+    if isinstance(loaded, np.ndarray):
+        return CSRMatrix.from_dense(loaded)
+    return CSRMatrix.from_triplets(*loaded)
+
+def poisson_2d(m):
+    """
+    The 5-point finite-difference Laplacian on an m x m grid (m^2 unknowns), a standard
+    sparse, diagonally dominant test system.
+    """
+    index = np.arange(m * m).reshape(m, m)
+    rows = [index.ravel()]
+    cols = [index.ravel()]
+    values = [np.full(m * m, 4.0)]
+    for a, b in ((index[:, :-1], index[:, 1:]), (index[:-1, :], index[1:, :])):
+        rows += [a.ravel(), b.ravel()]
+        cols += [b.ravel(), a.ravel()]
+        values += [np.full(a.size, -1.0)] * 2
+    return CSRMatrix.from_triplets(np.concatenate(rows), np.concatenate(cols), np.concatenate(values), (m * m, m * m))
@@ -0,0 +1,125 @@
+import time
+import numpy as np
+
+from method_result import MethodResult
+from instrumentation import profiled
+
+def sample_function(f, x):
+    """
+    Evaluates f on an array of points in a single call.
+    Falls back to a point-by-point loop for callables that do not accept arrays,
+    and broadcasts constant results (e.g. a lambdified "5") to the shape of x.
+
+    Parameters:
+        f (function): The function to sample.
+        x (numpy.ndarray): Points at which to evaluate f.
+
+    Returns:
+        numpy.ndarray: float64 array of f-values with the same shape as x.
+    """
+    x = np.asarray(x, dtype=float)
+    try:
+        y = np.asarray(f(x), dtype=float)
+        if y.shape != x.shape:
+            y = np.broadcast_to(y, x.shape).copy()
+        return y
+    except (TypeError, ValueError):
+        return np.array([f(xi) for xi in x.ravel()], dtype=float).reshape(x.shape)
+
+def trapezoid_weights(n, h):
+    """
+    Returns the n + 1 composite trapezoid weights for step h: h * [1/2, 1, ..., 1, 1/2].
+    """
+    w = np.full(n + 1, h)
+    w[0] = w[-1] = 0.5 * h
+    return w
+
+def simpson_weights(n, h):
+    """
+    Returns the n + 1 composite Simpson weights for step h: h/3 * [1, 4, 2, 4, ..., 2, 4, 1].
+    """
+    if n % 2 != 0:
+        raise ValueError("n must be even for Simpson's Rule.")
+    w = np.full(n + 1, 2.0)
+    w[1::2] = 4.0
+    w[0] = w[-1] = 1.0
+    return w * (h / 3)
+
+@profiled("simpson_vectorized")
+def simpson_vectorized(f, a, b, n):
+    """
+    Composite Simpson's Rule that evaluates f once on the whole node grid.
+
+    Parameters:
+        f (function): The integrand; NumPy-vectorized callables are evaluated in one call.
+        a (float): The lower limit of integration.
+        b (float): The upper limit of integration.
+        n (int): Number of subintervals (must be even).
+
+    Returns:
+        MethodResult: value is the approximation of the integral of f from a to b.
+
+    Raises:
+        ValueError: If n is odd or not positive.
+    """
+    if n % 2 != 0:
+        raise ValueError("n must be even for Simpson's Rule.")
+    if n < 2:
+        raise ValueError("Number of subintervals n must be at least 2.")
+    start = time.perf_counter()
+    x = np.linspace(a, b, n + 1)
+    value = float(np.dot(simpson_weights(n, (b - a) / n), sample_function(f, x)))
+    return MethodResult("simpson", value, True, n, n + 1, time.perf_counter() - start)
+
+@profiled("trapezoid_vectorized")
+def trapezoid_vectorized(f, a, b, n):
+    """
+    Composite Trapezoidal Rule that evaluates f once on the whole node grid.
+
+    Parameters:
+        f (function): The integrand; NumPy-vectorized callables are evaluated in one call.
+        a (float): The lower limit of integration.
+        b (float): The upper limit of integration.
+        n (int): Number of subintervals (must be >= 1).
+
+    Returns:
+        MethodResult: value is the approximation of the integral of f from a to b.
+
+    Raises:
+        ValueError: If n < 1 or a >= b.
+    """
+    if n < 1:
+        raise ValueError("Number of subintervals n must be at least 1.")
+    if a >= b:
+        raise ValueError("Lower limit a must be less than upper limit b.")
+    start = time.perf_counter()
+    x = np.linspace(a, b, n + 1)
+    value = float(np.dot(trapezoid_weights(n, (b - a) / n), sample_function(f, x)))
+    return MethodResult("trapezoid", value, True, n, n + 1, time.perf_counter() - start)
+
+@profiled("midpoint_vectorized")
+def midpoint_vectorized(f, a, b, n):
+    """
+    Composite Midpoint Rule that evaluates f once on all n midpoints.
+
+    Parameters:
+        f (function): The integrand; NumPy-vectorized callables are evaluated in one call.
+        a (float): The lower limit of integration.
+        b (float): The upper limit of integration.
+        n (int): Number of subintervals (must be >= 1).
+
+    Returns:
+        MethodResult: value is the approximation of the integral of f from a to b.
+
+    Raises:
+        ValueError: If n < 1 or a >= b.
+    """
+    if n < 1:
+        raise ValueError("Number of subintervals n must be at least 1.")
+    if a >= b:
+        raise ValueError("Lower limit a must be less than upper limit b.")
+    start = time.perf_counter()
+    h = (b - a) / n
+    x = a + h * (np.arange(n) + 0.5)
+    value = float(h * np.sum(sample_function(f, x)))
+    return MethodResult("midpoint", value, True, n, n, time.perf_counter() - start)